@@ -0,0 +1,111 @@
+"""Throughput of ``python -m jarvis --batch`` as ``--concurrency`` grows.
+
+Writes ``--utterances`` distinct utterances (a third of them skill commands,
+the rest chat questions that miss the response cache) to a temporary JSONL
+file and runs the batch CLI against the local OpenAI stand-in once per
+concurrency level. The stand-in serves at most ``--upstream-limit`` chat
+requests at once, like a rate-limited API, so throughput should grow with
+concurrency and then flatten at that limit.
+
+Run with ``python benchmarks/bench_batch_throughput.py [--concurrency 1 2 4 8 16]``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_PATH = ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fake_openai import CannedReply, FakeOpenAIServer
+
+
+def _write_input(path: Path, count: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for index in range(count):
+            if index % 3 == 0:
+                text = "turn on the desk lamp"
+            else:
+                text = f"question {index}: what is a fun fact about space?"
+            handle.write(json.dumps({"id": f"u{index}", "text": text}) + "\n")
+
+
+def _run_batch(base_url: str, source: Path, output: Path, concurrency: int, workdir: str) -> float:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_PATH),
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "bench"),
+        "OPENAI_BASE_URL": base_url,
+        "OPENAI_WARM_UP": "false",
+        "RESPONSE_CACHE_ENABLED": "false",
+    }
+    command = [
+        sys.executable,
+        "-m",
+        "jarvis",
+        "--batch",
+        str(source),
+        "--output",
+        str(output),
+        "--concurrency",
+        str(concurrency),
+    ]
+    start = time.perf_counter()
+    subprocess.run(command, cwd=workdir, env=env, check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def _stage_mean(output: Path, stage: str) -> float:
+    samples: List[float] = []
+    with output.open(encoding="utf-8") as handle:
+        for raw in handle:
+            record = json.loads(raw)
+            if stage in record.get("stages", {}):
+                samples.append(record["stages"][stage])
+    return sum(samples) / len(samples) if samples else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--utterances", type=int, default=120)
+    parser.add_argument("--latency", type=float, default=0.1, help="fake model first-byte delay")
+    parser.add_argument("--upstream-limit", type=int, default=6, help="concurrent chat requests")
+    args = parser.parse_args()
+
+    fake = FakeOpenAIServer(
+        lambda body: CannedReply("Saturn would float in a large enough bathtub."),
+        latency=args.latency,
+        max_concurrent=args.upstream_limit,
+    )
+    print(
+        f"{args.utterances} utterances, model latency {args.latency * 1000:.0f} ms, "
+        f"upstream limit {args.upstream_limit}"
+    )
+    print(f"{'concurrency':>11} | {'seconds':>7} | {'utt/s':>6} | {'llm ms':>6}")
+    with fake, tempfile.TemporaryDirectory() as workdir:
+        source = Path(workdir) / "utterances.jsonl"
+        _write_input(source, args.utterances)
+        for concurrency in args.concurrency:
+            output = Path(workdir) / f"results-{concurrency}.jsonl"
+            seconds = _run_batch(fake.base_url, source, output, concurrency, workdir)
+            with output.open(encoding="utf-8") as handle:
+                answered = sum(1 for _ in handle)
+            print(
+                f"{concurrency:>11} | {seconds:>7.2f} | {answered / seconds:>6.1f} "
+                f"| {_stage_mean(output, 'llm') * 1000:>6.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
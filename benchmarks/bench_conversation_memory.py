@@ -0,0 +1,152 @@
+"""Benchmark: prompt tokens per turn with raw history vs. ConversationMemory.
+
+Simulates a 500-turn session of short questions and medium-length answers
+and reports how many prompt tokens each request would carry. Raw history
+grows linearly; the token-budgeted memory levels off at its budget.
+
+Before the table, two questions go through ``JarvisAssistant.respond`` with a
+recording client in place of ``OpenAIClient``; the script fails if the second
+request does not carry the first exchange.
+
+Run with ``python benchmarks/bench_conversation_memory.py [--turns N] [--budget T]``.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.config import load_settings
+from jarvis.core.assistant import JarvisAssistant
+from jarvis.core.memory import ConversationMemory
+
+_SYSTEM_PROMPT = (
+    "You are JARVIS, an affable AI assistant that controls software and hardware at the "
+    "user's desk. Keep answers short and take actions when skills are available."
+)
+_WORDS = (
+    "weather lamp schedule meeting python build server latency music volume email "
+    "reminder project deadline coffee report dashboard sensor temperature battery network"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+class _RecordingClient:
+    """Answers every prompt with a fixed reply and keeps the history each request carried."""
+
+    def __init__(self) -> None:
+        self.histories: List[List[dict]] = []
+
+    def generate_response(
+        self,
+        prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
+        conversation_history: Optional[Iterable[dict]] = None,
+    ) -> str:
+        self.histories.append(list(conversation_history or []))
+        return f"Here is what I know about {prompt}."
+
+    def stream_response(
+        self,
+        prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
+        conversation_history: Optional[Iterable[dict]] = None,
+    ) -> Iterator[str]:
+        yield self.generate_response(
+            prompt, system_prompt=system_prompt, conversation_history=conversation_history
+        )
+
+
+def _check_assistant() -> bool:
+    """Ask two questions through the assistant and check the second carries the first."""
+
+    first, second = "who wrote the odyssey", "when was he born"
+    with tempfile.TemporaryDirectory() as workdir:
+        previous = os.getcwd()
+        os.chdir(workdir)  # keeps the assistant's caches out of the repository
+        os.environ.update(
+            OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY", "bench"),
+            MEMORY_ENABLED="true",
+            RESPONSE_CACHE_ENABLED="false",
+            ENABLE_MICROPHONE="false",
+            VOICE_ENGINE="text",
+        )
+        try:
+            assistant = JarvisAssistant(load_settings())
+            client = _RecordingClient()
+            assistant._openai = client
+            for text in (first, second):
+                reply = assistant.respond(text)
+                assert reply is not None
+                # draining the stream is what commits the turn to memory
+                "".join(reply.chunks) if reply.chunks is not None else reply.text
+        finally:
+            os.chdir(previous)
+    carried = client.histories[-1] if len(client.histories) == 2 else []
+    return [message["content"] for message in carried[-2:]] == [
+        first,
+        f"Here is what I know about {first}.",
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--budget", type=int, default=1500)
+    args = parser.parse_args()
+
+    if not _check_assistant():
+        print("respond(): the second request did not carry the first turn")
+        return 1
+    print("respond(): the second request carried the first turn\n")
+
+    rng = random.Random(11)
+    memory = ConversationMemory(max_tokens=args.budget, max_turns=args.turns)
+    raw: List[dict] = []
+    checkpoints = {1, 10, 25, 50, 100, 200, 300, 400, args.turns}
+    build_seconds = 0.0
+    peak = 0
+
+    print(f"{'turn':>5} | {'raw history tokens':>18} | {'memory tokens':>13} | {'memory msgs':>11}")
+    for turn in range(1, args.turns + 1):
+        question = _sentence(rng, rng.randint(5, 14)) + " What do you think?"
+        answer = " ".join(_sentence(rng, rng.randint(8, 16)) for _ in range(rng.randint(1, 4)))
+
+        started = time.perf_counter()
+        history = memory.messages()
+        build_seconds += time.perf_counter() - started
+        prompt_tokens = memory.count_tokens(_SYSTEM_PROMPT) + memory.count_tokens(question)
+        memory_tokens = prompt_tokens + memory.tokens
+        raw_tokens = prompt_tokens + sum(memory.count_tokens(m["content"]) for m in raw)
+        peak = max(peak, memory_tokens)
+        if turn in checkpoints:
+            print(f"{turn:>5} | {raw_tokens:>18} | {memory_tokens:>13} | {len(history):>11}")
+
+        raw.extend(
+            [{"role": "user", "content": question}, {"role": "assistant", "content": answer}]
+        )
+        memory.add_turn(question, answer)
+
+    print(
+        f"\npeak memory prompt: {peak} tokens (budget {args.budget} + system/question); "
+        f"history build {build_seconds / args.turns * 1e6:.1f} us/turn"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
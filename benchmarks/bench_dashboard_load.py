@@ -0,0 +1,193 @@
+"""Load test: many dashboard clients, some slow, while the assistant publishes events.
+
+Starts a :class:`~jarvis.dashboard.DashboardServer` on a free port, connects
+``--clients`` Socket.IO clients from a separate process (``--slow`` of them
+take ``--slow-ack`` seconds to acknowledge each batch) and publishes
+``--events`` events at ``--rate`` per second from a thread standing in for
+the assistant loop.
+
+Reports what the publishing thread paid per event with and without clients
+connected, how quickly fast clients saw events, and how many events slow
+clients skipped instead of queueing. Requires flask, flask-socketio and
+python-socketio. Run with
+``python benchmarks/bench_dashboard_load.py [--clients 50] [--slow 5]``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.config import DashboardConfig
+from jarvis.dashboard import DashboardServer
+from jarvis.telemetry.events import EventBus
+from jarvis.telemetry.metrics import MetricsRegistry
+from jarvis.telemetry.tracing import Tracer
+
+
+@dataclass
+class ClientStats:
+    slow: bool
+    received: int = 0
+    dropped: int = 0
+    batches: int = 0
+    delays: List[float] = field(default_factory=list)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _connect(address: str, stats: ClientStats, slow_ack: float) -> Any:
+    import socketio
+
+    client = socketio.Client(reconnection=False)
+
+    @client.on("events")
+    def _on_events(batch: Dict[str, Any]) -> bool:
+        arrived = time.time()
+        stats.batches += 1
+        stats.received += len(batch["events"])
+        stats.dropped += batch["dropped"]
+        stats.delays.extend(arrived - event["time"] for event in batch["events"])
+        if stats.slow:
+            time.sleep(slow_ack)  # acknowledging late is what makes a client slow
+        return True
+
+    client.connect(address, wait_timeout=10)
+    return client
+
+
+def _publish(bus: EventBus, count: int, rate: float) -> List[float]:
+    costs: List[float] = []
+    interval = 1.0 / rate
+    next_at = time.perf_counter()
+    for index in range(count):
+        start = time.perf_counter()
+        bus.publish("transcript", turn=index, text=f"utterance {index}")
+        costs.append(time.perf_counter() - start)
+        next_at += interval
+        pause = next_at - time.perf_counter()
+        if pause > 0:
+            time.sleep(pause)
+    return costs
+
+
+def _clients_child(address: str, count: int, slow: int, slow_ack: float) -> int:
+    stats = [ClientStats(slow=index < slow) for index in range(count)]
+    clients = [_connect(address, entry, slow_ack) for entry in stats]
+    sys.stdin.readline()  # the parent says when publishing is over
+    for client in clients:
+        client.disconnect()
+    print(json.dumps([asdict(entry) for entry in stats]))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--slow", type=int, default=5, help="clients that acknowledge late")
+    parser.add_argument("--slow-ack", type=float, default=0.5, help="seconds per slow ack")
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=200.0, help="events per second")
+    parser.add_argument("--ring", type=int, default=256, help="event bus capacity")
+    parser.add_argument("--clients-child", metavar="ADDRESS", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.clients_child:
+        return _clients_child(args.clients_child, args.clients, args.slow, args.slow_ack)
+
+    try:
+        import socketio  # noqa: F401
+    except ImportError:
+        print("python-socketio is required for the load test.")
+        return 1
+
+    bus = EventBus(capacity=args.ring)
+    registry = MetricsRegistry()
+    server = DashboardServer(
+        DashboardConfig(enabled=True, host="127.0.0.1", port=0),
+        run_skill=lambda text: None,
+        run_action=lambda name, kwargs: Future(),
+        actions=dict,
+        bus=bus,
+        registry=registry,
+        tracer=Tracer(registry),
+        backlog=0,
+    ).start()
+    try:
+        idle_costs = _publish(bus, args.events, args.rate)
+
+        # clients live in another interpreter so they do not compete for our GIL
+        child = subprocess.Popen(
+            [
+                sys.executable,
+                __file__,
+                "--clients-child",
+                server.address,
+                "--clients",
+                str(args.clients),
+                "--slow",
+                str(args.slow),
+                "--slow-ack",
+                str(args.slow_ack),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        deadline = time.monotonic() + 30
+        while server.clients < args.clients and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(0.5)
+
+        loaded_costs = _publish(bus, args.events, args.rate)
+        time.sleep(1.0 + args.slow_ack)  # let the last batches land
+        output, _ = child.communicate("stop\n", timeout=60)
+        stats = [ClientStats(**entry) for entry in json.loads(output.strip().splitlines()[-1])]
+    finally:
+        server.close()
+
+    def _row(label: str, costs: List[float]) -> None:
+        print(
+            f"{label:>24} | {_percentile(costs, 0.5) * 1e6:>7.1f} "
+            f"| {_percentile(costs, 0.99) * 1e6:>7.1f} | {max(costs) * 1e6:>7.1f}"
+        )
+
+    print(f"{args.events} events at {args.rate:.0f}/s, ring of {args.ring}")
+    print(f"{'publish cost (us)':>24} | {'p50':>7} | {'p99':>7} | {'max':>7}")
+    _row("no clients", idle_costs)
+    _row(f"{args.clients} clients", loaded_costs)
+
+    for slow in (False, True):
+        group = [entry for entry in stats if entry.slow == slow]
+        if not group:
+            continue
+        delays = [delay for entry in group for delay in entry.delays]
+        received = sum(entry.received for entry in group) / len(group)
+        dropped = sum(entry.dropped for entry in group) / len(group)
+        batches = sum(entry.batches for entry in group) / len(group)
+        print(
+            f"{'slow' if slow else 'fast'} clients ({len(group)}): "
+            f"received {received:.0f}, skipped {dropped:.0f}, "
+            f"{received / batches if batches else 0:.1f} events/batch, "
+            f"delay p50 {_percentile(delays, 0.5) * 1000:.0f} ms "
+            f"p95 {_percentile(delays, 0.95) * 1000:.0f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Benchmark: one-by-one device writes vs. shadowed, batched scenes.
+
+Registers simulated slow devices (each write sleeps) and applies an
+"evening" scene that sets power and level on all of them. Compares writing
+every device in turn with ``HardwareController.apply_scene``, then re-applies
+the scene to show redundant writes being skipped by the state shadow.
+
+Run with ``python benchmarks/bench_device_scenes.py [--devices 8] [--delay 0.04]``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.config import HardwareConfig
+from jarvis.hardware.controller import HardwareController
+from jarvis.hardware.devices import DeviceState
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=8)
+    parser.add_argument("--delay", type=float, default=0.04, help="seconds per device write")
+    args = parser.parse_args()
+
+    writes = [0]
+    lock = threading.Lock()
+
+    def _slow_write(_value: object) -> None:
+        time.sleep(args.delay)
+        with lock:
+            writes[0] += 1
+
+    controller = HardwareController(HardwareConfig(executor_workers=args.devices))
+    names = [f"light{index}" for index in range(args.devices)]
+    for name in names:
+        controller.register_device(name, set_power=_slow_write, set_level=_slow_write)
+    evening = {name: DeviceState(power=True, level=30) for name in names}
+    controller.define_scene("evening", evening)
+
+    start = time.perf_counter()
+    for _ in evening:
+        _slow_write(True)
+        _slow_write(30)
+    serial = time.perf_counter() - start
+    serial_writes, writes[0] = writes[0], 0
+
+    first = controller.apply_scene("evening")
+    first_writes, writes[0] = writes[0], 0
+    again = controller.apply_scene("evening")
+    controller.close()
+
+    print(f"{args.devices} devices, power+level each, {args.delay * 1000:.0f} ms per write")
+    print(f"{'run':>22} | {'ms':>7} | {'writes':>6} | changed/skipped")
+    print(f"{'one device at a time':>22} | {serial * 1000:>7.0f} | {serial_writes:>6} | -")
+    print(
+        f"{'apply_scene (cold)':>22} | {first.seconds * 1000:>7.0f} | {first_writes:>6} "
+        f"| {len(first.changed)}/{len(first.skipped)}"
+    )
+    print(
+        f"{'apply_scene (again)':>22} | {again.seconds * 1000:>7.2f} | {writes[0]:>6} "
+        f"| {len(again.changed)}/{len(again.skipped)}"
+    )
+    print(f"redundant writes skipped by the shadow: {controller.skipped_writes}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,500 @@
+"""Benchmark: end-to-end turn latency through the real ``JarvisAssistant``.
+
+Replays a script of utterances (typed text, synthetic audio, or recorded WAV
+files) through ``JarvisAssistant.run()`` with every external service
+replaced by a local stand-in:
+
+* OpenAI chat, streaming, tool calls and Whisper: ``fake_openai.FakeOpenAIServer``
+  with configurable latency and token pacing;
+* speech-to-text: in ``--mode audio`` the listener's real Whisper path
+  (upload encoding, transcription coordinator, HTTP) against the fake server;
+  in ``--mode text`` the typed-input path;
+* text-to-speech: a ``VoiceResponder`` whose synthesis sleeps instead of playing;
+* hardware: a ``HardwareController`` whose device writes sleep ``--device-delay``.
+
+Each turn is timed from the end of the utterance. Stages are ``stt``
+(transcription), ``route`` (skill routing or ChatGPT request, inside
+``respond``), ``llm_first_token`` (streamed replies), ``tts_first_audio``,
+``first_audio`` and ``turn`` (until the reply has been spoken), and
+``hardware`` (until the device write finished). p50/p95/p99 are printed per
+stage and per turn kind (``skill``, ``chat``, ``tools``), leaving out the first
+``--warmup`` turns; ``--output`` saves samples and summary as JSON and
+``--baseline`` compares with an earlier file.
+
+A script is a text file with one utterance per line, or JSONL lines like
+``{"text": "turn on the desk lamp", "audio": "clips/lamp.wav"}``.
+
+Run with ``python benchmarks/bench_end_to_end.py [--mode text|audio] [--repeat 5]
+[--llm-latency 0.3] [--output e2e.json] [--baseline old.json]``.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import logging
+import math
+import struct
+import sys
+import threading
+import time
+import wave
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fake_openai import CannedReply, FakeOpenAIServer
+
+from jarvis.config import (
+    DashboardConfig,
+    HardwareConfig,
+    OpenAIConfig,
+    PipelineConfig,
+    ResponseCacheConfig,
+    Settings,
+    SpeechInputConfig,
+    SpeechOutputConfig,
+    TransportConfig,
+)
+from jarvis.core.assistant import JarvisAssistant
+from jarvis.core.pipeline import Reply
+from jarvis.hardware.controller import HardwareController
+from jarvis.integrations.openai_client import OpenAIClient
+from jarvis.io.voice_listener import VoiceListener
+from jarvis.io.voice_responder import SpeechStreamStats, VoiceResponder
+
+STAGES = (
+    "stt",
+    "route",
+    "llm_first_token",
+    "tts_first_audio",
+    "hardware",
+    "first_audio",
+    "turn",
+)
+_DEFAULT_SCRIPT = (
+    "turn on the desk lamp",
+    "what is a good way to stay focused",
+    "kill the desk lamp",
+    "turn on the desk lamp and tell me a joke",
+    "how far away is the moon",
+    "switch the desk lamp off",
+)
+_CHAT_REPLY = (
+    "Here is a short answer to that. It comes back one word at a time, like a real model. "
+    "The last sentence closes the reply."
+)
+_SAMPLE_RATE = 16000
+
+
+@dataclass(slots=True)
+class Utterance:
+    text: str
+    audio: Optional[Path] = None
+
+
+@dataclass(slots=True)
+class TurnTiming:
+    """Timestamps (``time.perf_counter``) collected for one scripted turn."""
+
+    text: str
+    kind: str = "skill"
+    captured: float = 0.0
+    transcribed: Optional[float] = None
+    stt: Optional[float] = None
+    routed: Optional[float] = None
+    route: Optional[float] = None
+    first_token: Optional[float] = None
+    first_audio: Optional[float] = None
+    tts_first_audio: Optional[float] = None
+    spoken: Optional[float] = None
+    hardware_done: List[float] = field(default_factory=list)
+
+    def stages(self) -> Dict[str, float]:
+        values: Dict[str, Optional[float]] = {
+            "stt": self.stt,
+            "route": self.route,
+            "llm_first_token": _since(self.routed, self.first_token),
+            "tts_first_audio": self.tts_first_audio,
+            "hardware": _since(self.captured, max(self.hardware_done, default=None)),
+            "first_audio": _since(self.captured, self.first_audio),
+            "turn": _since(self.captured, self.spoken),
+        }
+        return {name: value for name, value in values.items() if value is not None}
+
+
+def _since(start: Optional[float], end: Optional[float]) -> Optional[float]:
+    return None if start is None or end is None else end - start
+
+
+class Recorder:
+    """Hands turns to the stand-ins in script order and collects their timings."""
+
+    def __init__(self, script: List[Utterance]) -> None:
+        self.script = script
+        self.turns: List[TurnTiming] = []
+        self.lock = threading.Lock()
+        self.delivered = threading.Semaphore(1)  # the user waits for each answer
+        self.reasoning: Optional[TurnTiming] = None
+        self._transcribing = 0
+        self._delivering = 0
+
+    def next_capture(self) -> Optional[Utterance]:
+        if len(self.turns) >= len(self.script):
+            return None
+        self.delivered.acquire()
+        utterance = self.script[len(self.turns)]
+        with self.lock:
+            self.turns.append(TurnTiming(text=utterance.text, captured=time.perf_counter()))
+        return utterance
+
+    def next_transcription(self) -> TurnTiming:
+        with self.lock:
+            turn = self.turns[self._transcribing]
+            self._transcribing += 1
+        return turn
+
+    def next_delivery(self) -> TurnTiming:
+        with self.lock:
+            turn = self.turns[self._delivering]
+            self._delivering += 1
+        return turn
+
+    def turn_for(self, text: str) -> Optional[TurnTiming]:
+        with self.lock:
+            pending = [turn for turn in self.turns if turn.routed is None]
+        for turn in pending:
+            if turn.text.strip().lower() == text.strip().lower():
+                return turn
+        return pending[0] if pending else None
+
+
+class ScriptedListener(VoiceListener):
+    """Replays the script; audio goes through the real transcription backends."""
+
+    def __init__(
+        self, config: SpeechInputConfig, recorder: Recorder, *, openai_client: OpenAIClient
+    ) -> None:
+        super().__init__(config, openai_client=openai_client)
+        self._recorder = recorder
+        self._audio = config.enable_microphone
+        self.expected = ""
+
+    def capture(self, *, prompt: str = "") -> Any:
+        utterance = self._recorder.next_capture()
+        if utterance is None:
+            raise EOFError
+        if not self._audio:
+            return utterance.text
+        return _load_audio(utterance, self._sr)
+
+    def transcribe(self, captured: Any) -> str:
+        turn = self._recorder.next_transcription()
+        self.expected = turn.text  # what the fake Whisper endpoint answers
+        start = time.perf_counter()
+        text = super().transcribe(captured)
+        turn.transcribed = time.perf_counter()
+        turn.stt = turn.transcribed - start
+        return text
+
+
+class StandInResponder(VoiceResponder):
+    """Text-only responder whose synthesis and playback sleep instead of sounding."""
+
+    def __init__(self, recorder: Recorder, *, latency: float, seconds_per_word: float) -> None:
+        super().__init__(SpeechOutputConfig(engine="text"), text_fallback=False)
+        self._recorder = recorder
+        self._latency = latency
+        self._seconds_per_word = seconds_per_word
+        self._turn: Optional[TurnTiming] = None
+
+    def speak(self, message: str) -> None:
+        self._turn = self._recorder.next_delivery()
+        try:
+            super().speak(message)
+        finally:
+            self._finish()
+
+    def speak_stream(
+        self, chunks: Iterable[str], *, started_at: Optional[float] = None
+    ) -> SpeechStreamStats:
+        self._turn = turn = self._recorder.next_delivery()
+
+        def _timed() -> Iterator[str]:
+            for chunk in chunks:
+                if turn.first_token is None:
+                    turn.first_token = time.perf_counter()
+                yield chunk
+
+        try:
+            return super().speak_stream(_timed(), started_at=started_at)
+        finally:
+            self._finish()
+
+    def _say(self, message: str, interrupted: threading.Event) -> None:
+        began = time.perf_counter()
+        if interrupted.wait(self._latency):
+            return
+        turn = self._turn
+        if turn is not None and turn.first_audio is None:
+            turn.first_audio = time.perf_counter()
+            turn.tts_first_audio = turn.first_audio - began
+        interrupted.wait(self._seconds_per_word * len(message.split()))  # barge-in cuts playback
+
+    def _finish(self) -> None:
+        if self._turn is not None:
+            self._turn.spoken = time.perf_counter()
+        self._turn = None
+        self._recorder.delivered.release()
+
+
+class TimedAssistant(JarvisAssistant):
+    """Times ``respond`` and tells the stand-ins which turn is being reasoned about."""
+
+    def __init__(self, settings: Settings, recorder: Recorder, **backends: Any) -> None:
+        super().__init__(settings, **backends)
+        self._recorder = recorder
+
+    def respond(self, text: str, *, started_at: Optional[float] = None) -> Optional[Reply]:
+        turn = self._recorder.turn_for(text)
+        self._recorder.reasoning = turn
+        start = time.perf_counter()
+        reply = super().respond(text, started_at=started_at)
+        if turn is not None:
+            turn.routed = time.perf_counter()
+            turn.route = turn.routed - start
+        return reply
+
+
+class TimedHardware(HardwareController):
+    """Attributes each device write to the turn whose reasoning submitted it."""
+
+    def __init__(self, recorder: Recorder, *, delay: float) -> None:
+        super().__init__(HardwareConfig())
+        self._recorder = recorder
+        self.register_device(
+            "desk_lamp",
+            set_power=lambda _on: time.sleep(delay),
+            description="Simulated desk lamp",
+        )
+
+    def execute(self, name: str, **kwargs: Any) -> Future:
+        turn = self._recorder.reasoning
+        future = super().execute(name, **kwargs)
+        if turn is not None:
+            future.add_done_callback(lambda _done: turn.hardware_done.append(time.perf_counter()))
+        return future
+
+
+def _load_audio(utterance: Utterance, sr: Any) -> Any:
+    if utterance.audio is not None:
+        with wave.open(str(utterance.audio), "rb") as clip:
+            return sr.AudioData(
+                clip.readframes(clip.getnframes()), clip.getframerate(), clip.getsampwidth()
+            )
+    # synthetic speech-like audio: a warbling tone, 0.3 s per word
+    samples = int(0.3 * max(1, len(utterance.text.split())) * _SAMPLE_RATE)
+    values = []
+    for index in range(samples):
+        pitch = 180 + 60 * math.sin(index / 800)
+        values.append(int(8000 * math.sin(2 * math.pi * pitch * index / _SAMPLE_RATE)))
+    return sr.AudioData(struct.pack(f"<{samples}h", *values), _SAMPLE_RATE, 2)
+
+
+def _load_script(path: Optional[Path], repeat: int) -> List[Utterance]:
+    if path is None:
+        base = [Utterance(text) for text in _DEFAULT_SCRIPT]
+    else:
+        base = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                item = json.loads(line)
+                audio = item.get("audio")
+                base.append(
+                    Utterance(item["text"], (path.parent / audio) if audio else None)
+                )
+            else:
+                base.append(Utterance(line))
+    return [*base * repeat, Utterance("quit")]
+
+
+def _reply_for(recorder: Recorder):
+    def _reply(request: Dict[str, Any]) -> CannedReply:
+        turn = recorder.reasoning
+        if turn is not None:
+            turn.kind = "tools" if request.get("tools") else "chat"
+        if request.get("tools"):
+            return CannedReply(
+                content="Why did the lamp go to school? To get a little brighter.",
+                tool_calls=[("skill_lighting", {"intent": "turn_on", "device": "desk lamp"})],
+            )
+        return CannedReply(content=_CHAT_REPLY)
+
+    return _reply
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def _at(fraction: float) -> float:
+        return ordered[min(int(math.ceil(fraction * len(ordered))) - 1, len(ordered) - 1)]
+
+    return {
+        "count": len(ordered),
+        "p50": _at(0.50),
+        "p95": _at(0.95),
+        "p99": _at(0.99),
+        "mean": sum(ordered) / len(ordered),
+    }
+
+
+def summarize(turns: List[TurnTiming]) -> Dict[str, Any]:
+    stages: Dict[str, List[float]] = {name: [] for name in STAGES}
+    kinds: Dict[str, Dict[str, List[float]]] = {}
+    for turn in turns:
+        for name, value in turn.stages().items():
+            stages[name].append(value)
+            if name in ("first_audio", "turn"):
+                kinds.setdefault(turn.kind, {}).setdefault(name, []).append(value)
+    return {
+        "stages": {name: percentiles(values) for name, values in stages.items() if values},
+        "kinds": {
+            kind: {name: percentiles(values) for name, values in by_stage.items()}
+            for kind, by_stage in sorted(kinds.items())
+        },
+    }
+
+
+def _print_summary(summary: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    header = f"{'stage':>18} | {'n':>4} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8}"
+    if baseline:
+        header += f" | {'Δp50 ms':>8} | {'Δp95 ms':>8}"
+    print(header)
+    rows = [(name, stats) for name, stats in summary["stages"].items()]
+    rows += [
+        (f"{kind}:{name}", stats)
+        for kind, by_stage in summary["kinds"].items()
+        for name, stats in by_stage.items()
+    ]
+    for name, stats in rows:
+        line = (
+            f"{name:>18} | {stats['count']:>4} | {stats['p50'] * 1000:>8.1f} "
+            f"| {stats['p95'] * 1000:>8.1f} | {stats['p99'] * 1000:>8.1f}"
+        )
+        if baseline:
+            old = _lookup(baseline, name)
+            if old is None:
+                line += f" | {'-':>8} | {'-':>8}"
+            else:
+                line += (
+                    f" | {(stats['p50'] - old['p50']) * 1000:>+8.1f} "
+                    f"| {(stats['p95'] - old['p95']) * 1000:>+8.1f}"
+                )
+        print(line)
+
+
+def _lookup(summary: Dict[str, Any], name: str) -> Optional[Dict[str, float]]:
+    if ":" in name:
+        kind, stage = name.split(":", 1)
+        return summary.get("kinds", {}).get(kind, {}).get(stage)
+    return summary.get("stages", {}).get(name)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=("text", "audio"), default="text")
+    parser.add_argument("--script", type=Path, default=None, help="text or JSONL utterances")
+    parser.add_argument("--repeat", type=int, default=5, help="times to replay the script")
+    parser.add_argument("--warmup", type=int, default=1, help="first turns left out of stats")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="model latency (s)")
+    parser.add_argument("--token-interval", type=float, default=0.02, help="s between words")
+    parser.add_argument("--stt-latency", type=float, default=0.25, help="Whisper latency (s)")
+    parser.add_argument("--tts-latency", type=float, default=0.08, help="synthesis latency (s)")
+    parser.add_argument("--speech-seconds-per-word", type=float, default=0.0)
+    parser.add_argument("--device-delay", type=float, default=0.05, help="device write (s)")
+    parser.add_argument("--no-stream", action="store_true", help="blocking ChatGPT replies")
+    parser.add_argument("--pipeline", action="store_true", help="use the asyncio pipeline")
+    parser.add_argument("--output", type=Path, default=None, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=None, help="earlier --output file")
+    args = parser.parse_args()
+    if args.mode == "audio" and importlib.util.find_spec("speech_recognition") is None:
+        print("--mode audio needs the SpeechRecognition package.")
+        return 1
+
+    recorder = Recorder(_load_script(args.script, args.repeat))
+    server = FakeOpenAIServer(
+        _reply_for(recorder),
+        latency=args.llm_latency,
+        token_interval=args.token_interval,
+        transcription_latency=args.stt_latency,
+    )
+    with server:
+        openai_config = OpenAIConfig(
+            api_key="fake",
+            stream_responses=not args.no_stream,
+            cache=ResponseCacheConfig(enabled=False),
+            transport=TransportConfig(base_url=server.base_url),
+        )
+        speech_input = SpeechInputConfig(
+            enable_microphone=args.mode == "audio",
+            stt_backends="whisper",
+            whisper_upload_format="wav",
+        )
+        settings = Settings(
+            root_dir=Path.cwd(),
+            openai=openai_config,
+            speech_input=speech_input,
+            speech_output=SpeechOutputConfig(engine="text"),
+            hardware=HardwareConfig(),
+            dashboard=DashboardConfig(),
+            pipeline=PipelineConfig(enabled=args.pipeline, barge_in=False),
+        )
+        listener = ScriptedListener(
+            speech_input, recorder, openai_client=OpenAIClient(openai_config)
+        )
+        server.transcript = lambda: listener.expected
+        assistant = TimedAssistant(
+            settings,
+            recorder,
+            listener=listener,
+            responder=StandInResponder(
+                recorder, latency=args.tts_latency, seconds_per_word=args.speech_seconds_per_word
+            ),
+            hardware=TimedHardware(recorder, delay=args.device_delay),
+        )
+        logging.getLogger().setLevel(logging.WARNING)
+        started = time.perf_counter()
+        assistant.run()
+        wall = time.perf_counter() - started
+
+    turns = [turn for turn in recorder.turns if turn.text != "quit"][args.warmup :]
+    summary = summarize(turns)
+    baseline = json.loads(args.baseline.read_text())["summary"] if args.baseline else None
+    print(
+        f"{len(turns)} turns ({args.mode} input, {'pipelined' if args.pipeline else 'serial'}) "
+        f"in {wall:.1f} s; model {args.llm_latency * 1000:.0f} ms, "
+        f"whisper {args.stt_latency * 1000:.0f} ms, tts {args.tts_latency * 1000:.0f} ms"
+    )
+    _print_summary(summary, baseline)
+    if args.output:
+        result = {
+            "config": {key: str(value) for key, value in vars(args).items()},
+            "wall_seconds": wall,
+            "summary": summary,
+            "turns": [{**asdict(turn), "stages": turn.stages()} for turn in turns],
+        }
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+"""Benchmark: inline hardware actions vs. the per-device background executor.
+
+Simulates slow devices (serial writes, relays with settle time) and fires a
+burst of on/off commands at them, the way rapid voice or dashboard input
+would. Reports how long the caller is blocked, command completion latency,
+throughput, and how many writes coalescing saved.
+
+Run with ``python benchmarks/bench_hardware_executor.py [--devices 4] [--delay 0.05]``.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.config import HardwareConfig
+from jarvis.hardware.controller import HardwareController
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def _workload(devices: int, commands: int) -> List[Tuple[str, str]]:
+    rng = random.Random(5)
+    return [
+        (rng.choice(("turn_on", "turn_off")), f"device{rng.randrange(devices)}")
+        for _ in range(commands)
+    ]
+
+
+def _controller(devices: int, delay: float, writes: Dict[str, int]) -> HardwareController:
+    controller = HardwareController(HardwareConfig(executor_workers=devices))
+
+    def _write(device: str) -> None:
+        time.sleep(delay)
+        writes[device] = writes.get(device, 0) + 1
+
+    for index in range(devices):
+        device = f"device{index}"
+        for verb in ("turn_on", "turn_off"):
+            controller.register_action(
+                f"{verb}_{device}",
+                lambda device=device: _write(device),
+                device=device,
+                slot="power",
+            )
+    return controller
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds per device write")
+    parser.add_argument("--commands", type=int, default=120)
+    parser.add_argument("--gap", type=float, default=0.005, help="seconds between commands")
+    args = parser.parse_args()
+    workload = _workload(args.devices, args.commands)
+
+    # inline: what HardwareController.execute used to do
+    writes: Dict[str, int] = {}
+    controller = _controller(args.devices, args.delay, writes)
+    blocked: List[float] = []
+    start = time.perf_counter()
+    for verb, device in workload:
+        began = time.perf_counter()
+        controller._actions[f"{verb}_{device}"].handler()
+        blocked.append(time.perf_counter() - began)
+        time.sleep(args.gap)
+    inline_wall = time.perf_counter() - start
+    inline = (blocked, list(blocked), inline_wall, sum(writes.values()))
+    controller.close()
+
+    writes = {}
+    controller = _controller(args.devices, args.delay, writes)
+    blocked, completed = [], []
+    futures = []
+    start = time.perf_counter()
+    for verb, device in workload:
+        began = time.perf_counter()
+        future = controller.execute(f"{verb}_{device}")
+        blocked.append(time.perf_counter() - began)
+        future.add_done_callback(
+            lambda _future, began=began: completed.append(time.perf_counter() - began)
+        )
+        futures.append(future)
+        time.sleep(args.gap)
+    for future in futures:
+        future.result()
+    queued_wall = time.perf_counter() - start
+    controller.close()  # waits for the last done-callbacks
+    stats = controller.executor_stats()
+    queued = (blocked, completed, queued_wall, sum(writes.values()))
+
+    print(
+        f"{args.commands} commands over {args.devices} devices, "
+        f"{args.delay * 1000:.0f} ms per write, {args.gap * 1000:.0f} ms apart"
+    )
+    print(
+        f"{'mode':>9} | {'caller blocked p50/p95 ms':>25} | {'completion p50/p95 ms':>21} "
+        f"| {'wall s':>6} | {'cmds/s':>6} | {'writes':>6}"
+    )
+    for label, (held, done, wall, count) in (("inline", inline), ("executor", queued)):
+        held_p50, held_p95 = _percentile(held, 0.5) * 1000, _percentile(held, 0.95) * 1000
+        done_p50, done_p95 = _percentile(done, 0.5) * 1000, _percentile(done, 0.95) * 1000
+        print(
+            f"{label:>9} | {held_p50:>11.2f} / {held_p95:<11.2f} "
+            f"| {done_p50:>9.1f} / {done_p95:<9.1f} "
+            f"| {wall:>6.2f} | {args.commands / wall:>6.0f} | {count:>6}"
+        )
+    print(
+        f"coalesced {stats.coalesced} superseded command(s); "
+        f"mean blocked {statistics.mean(queued[0]) * 1e6:.0f} us per execute()"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
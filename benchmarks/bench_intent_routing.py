@@ -0,0 +1,188 @@
+"""Benchmark: how many ChatGPT calls the local intent classifier avoids.
+
+Routes a labelled corpus of commands, paraphrases and open questions through
+the trigger index alone and then through triggers plus the intent classifier.
+Reports the share of LLM calls avoided, routing accuracy, and classification
+latency.
+
+Accuracy is scored on a held-out split. Utterances too close to a phrase the
+classifier was trained on, either a skill example or an ``OUT_OF_DOMAIN``
+rejection phrase, are left out and listed. A copy or near-copy of the training
+data would otherwise make the classifier look better than it is.
+
+Run with ``python benchmarks/bench_intent_routing.py [--threshold 0.5]``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.skills.base import Skill
+from jarvis.skills.intents import OUT_OF_DOMAIN
+from jarvis.skills.lighting import LightingSkill
+from jarvis.skills.matcher import normalize_utterance
+from jarvis.skills.registry import SkillRegistry
+from jarvis.skills.system_control import SystemControlSkill
+
+# (utterance, expected intent or None when ChatGPT should answer)
+_CORPUS: List[Tuple[str, Optional[str]]] = [
+    ("turn on the desk lamp", "turn_on"),
+    ("turn off the desk lamp", "turn_off"),
+    ("open visual studio code", "open_vscode"),
+    ("launch the terminal", "open_terminal"),
+    ("switch the desk lamp on", "turn_on"),
+    ("switch on my desk lamp please", "turn_on"),
+    ("could you turn the lamp on", "turn_on"),
+    ("lamp on", "turn_on"),
+    ("power on the desk lamp", "turn_on"),
+    ("lights on please", "turn_on"),
+    ("switch the desk lamp off", "turn_off"),
+    ("could you turn the lamp off", "turn_off"),
+    ("kill the lights", "turn_off"),
+    ("shut the desk lamp off", "turn_off"),
+    ("lamp off", "turn_off"),
+    ("fire up code", "open_vscode"),
+    ("launch vscode", "open_vscode"),
+    ("bring up my code editor", "open_vscode"),
+    ("start coding in vs code", "open_vscode"),
+    ("open up a terminal for me", "open_terminal"),
+    ("start my terminal", "open_terminal"),
+    ("give me a shell", "open_terminal"),
+    ("open the command prompt", "open_terminal"),
+    ("can you get the desk light going", "turn_on"),
+    ("i would like the lamp lit", "turn_on"),
+    ("put the lamp out", "turn_off"),
+    ("get rid of the light on my desk", "turn_off"),
+    ("could you get vscode running", "open_vscode"),
+    ("i need my editor up", "open_vscode"),
+    ("pop open a console window", "open_terminal"),
+    ("i need a command prompt right now", "open_terminal"),
+    ("what's the weather like today", None),
+    ("tell me a joke", None),
+    ("who won the game last night", None),
+    ("how far away is the moon", None),
+    ("what time is it in tokyo", None),
+    ("set a timer for ten minutes", None),
+    ("play some music", None),
+    ("what is the capital of france", None),
+    ("write a poem about the ocean", None),
+    ("explain quantum computing simply", None),
+    ("is it going to rain tomorrow", None),
+    ("remind me to call mom", None),
+    ("how do i boil an egg", None),
+    ("what should i cook tonight", None),
+    ("summarize the news for me", None),
+    # near misses: they share words with an intent but ask something else
+    ("write some code for me in python", None),
+    ("why is it so dark in here at night", None),
+    ("how do i use the terminal on a mac", None),
+    ("what does the command line do", None),
+    ("why do lamps get hot", None),
+    ("is it dark outside yet", None),
+    ("recommend a good code editor", None),
+    ("who invented the light bulb", None),
+]
+_ROUNDS = 200
+# token overlap (Jaccard) with a training phrase at which an utterance is not held out
+_MAX_OVERLAP = 0.5
+
+
+def _training_phrases(skills: Sequence[Skill]) -> List[str]:
+    phrases = [
+        phrase
+        for skill in skills
+        for examples in skill.examples.values()
+        for phrase in examples
+    ]
+    return phrases + list(OUT_OF_DOMAIN)
+
+
+def _overlap(text: str, phrases: Sequence[str]) -> Tuple[float, str]:
+    """The training phrase sharing the most tokens with ``text``, and how many."""
+
+    tokens = set(normalize_utterance(text))
+    best = (0.0, "")
+    for phrase in phrases:
+        other = set(normalize_utterance(phrase))
+        union = tokens | other
+        best = max(best, (len(tokens & other) / len(union) if union else 0.0, phrase))
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threshold", type=float, default=0.5)
+    args = parser.parse_args()
+
+    skills: List[Skill] = [SystemControlSkill(), LightingSkill(device_name="desk_lamp")]
+    registry = SkillRegistry(skills, intent_threshold=args.threshold)
+    registry.classify("warm up")  # train outside the timed region
+
+    training = _training_phrases(skills)
+    held_out: List[Tuple[str, Optional[str]]] = []
+    excluded: List[str] = []
+    for text, expected in _CORPUS:
+        overlap, phrase = _overlap(text, training)
+        if overlap >= _MAX_OVERLAP:
+            excluded.append(f"{text!r} (overlap {overlap:.2f} with {phrase!r})")
+        else:
+            held_out.append((text, expected))
+
+    trigger_llm_calls = 0
+    classifier_llm_calls = 0
+    correct = 0
+    # (correct, total) for commands and for questions that belong to ChatGPT
+    commands = [0, 0]
+    questions = [0, 0]
+    misrouted: List[str] = []
+    for text, expected in held_out:
+        if registry.candidates(text):
+            routed: Optional[str] = expected  # exact trigger hit, handled as before
+        else:
+            trigger_llm_calls += 1
+            match = registry.classify(text)
+            routed = match.intent if match and match.confidence >= args.threshold else None
+        if routed is None:
+            classifier_llm_calls += 1
+        tally = questions if expected is None else commands
+        tally[1] += 1
+        if routed == expected:
+            correct += 1
+            tally[0] += 1
+        else:
+            misrouted.append(f"{text!r}: expected {expected}, routed {routed}")
+
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        for text, _ in _CORPUS:
+            registry.classify(text)
+    per_call = (time.perf_counter() - start) / (_ROUNDS * len(_CORPUS))
+
+    avoided = trigger_llm_calls - classifier_llm_calls
+    print(
+        f"corpus: {len(_CORPUS)} utterances, {len(held_out)} held out from training, "
+        f"threshold {args.threshold}"
+    )
+    print(f"LLM calls, triggers only:       {trigger_llm_calls}")
+    print(f"LLM calls, triggers+classifier: {classifier_llm_calls}")
+    print(f"LLM calls avoided:              {avoided} ({avoided / max(trigger_llm_calls, 1):.0%})")
+    print(f"routing accuracy (held out):    {correct / max(len(held_out), 1):.0%}")
+    print(f"  commands routed to the skill: {commands[0]}/{commands[1]}")
+    print(f"  questions left to ChatGPT:    {questions[0]}/{questions[1]}")
+    print(f"classify latency:               {per_call * 1e6:.0f} us/utterance")
+    for line in misrouted:
+        print(f"  misrouted {line}")
+    for line in excluded:
+        print(f"  not held out {line}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+"""Benchmark: time to first token with a fixed model versus latency-aware model routing.
+
+Runs a mix of small-talk and involved prompts through ``OpenAIClient.stream_response``
+against the local OpenAI stand-in, where a "fast" and a "smart" model have
+their own latency profiles. Four scenarios are compared:
+
+* ``fixed``: routing off, every prompt goes to the smart model;
+* ``routed``: small talk goes to the fast model with a short token budget;
+* ``smart slow``: the smart model degrades past the deadline mid-run, so
+  late replies are hedged and later requests move to the fast model;
+* ``fast failing``: the fast model returns errors, so requests escalate to
+  the smart model.
+
+Run with ``python benchmarks/bench_model_routing.py [--prompts 60]``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_PATH = ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fake_openai import CannedReply, FakeOpenAIServer, ModelProfile
+
+from jarvis.config import ModelRoutingConfig, OpenAIConfig, ResponseCacheConfig, TransportConfig
+from jarvis.integrations.openai_client import OpenAIClient
+
+SIMPLE = ["hello", "what time is it", "thanks", "good morning", "tell me a joke"]
+COMPLEX = [
+    "explain how photosynthesis works step by step",
+    "compare python and rust and explain why you would pick one",
+    "write a python function that merges two sorted lists",
+    "why do airplanes fly and how do wings generate lift",
+]
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def _first_token(client: OpenAIClient, prompt: str) -> Tuple[float, bool]:
+    start = time.perf_counter()
+    first = None
+    try:
+        for _chunk in client.stream_response(prompt):
+            if first is None:
+                first = time.perf_counter() - start
+    except RuntimeError:
+        return time.perf_counter() - start, False
+    return (time.perf_counter() - start if first is None else first), True
+
+
+def _scenario(
+    fake: FakeOpenAIServer,
+    client: OpenAIClient,
+    prompts: List[str],
+    concurrency: int,
+    profiles: Dict[str, ModelProfile],
+) -> Tuple[List[float], int, Dict[str, int]]:
+    fake.models.update(profiles)
+    before = len(fake.requests)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda prompt: _first_token(client, prompt), prompts))
+    time.sleep(0.5)  # let hedged losers finish so every upstream call is counted
+    calls: Dict[str, int] = {}
+    for body in fake.requests[before:]:
+        calls[body.get("model", "?")] = calls.get(body.get("model", "?"), 0) + 1
+    latencies = [seconds for seconds, ok in outcomes if ok]
+    return latencies, sum(1 for _seconds, ok in outcomes if not ok), calls
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompts", type=int, default=60, help="prompts per scenario")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--fast-latency", type=float, default=0.15)
+    parser.add_argument("--smart-latency", type=float, default=0.6)
+    parser.add_argument("--deadline", type=float, default=1.5)
+    args = parser.parse_args()
+
+    fast = ModelProfile(latency=args.fast_latency, token_interval=0.005)
+    smart = ModelProfile(latency=args.smart_latency, token_interval=0.01)
+    pool = SIMPLE * 2 + COMPLEX
+    prompts = [f"{pool[index % len(pool)]} ({index})" for index in range(args.prompts)]
+
+    fake = FakeOpenAIServer(
+        lambda body: CannedReply("Here is an answer that takes a few words to say."),
+        models={"fast": fast, "smart": smart},
+    )
+    scenarios = [
+        ("fixed", False, {}),
+        ("routed", True, {}),
+        ("smart slow", True, {"smart": ModelProfile(latency=args.deadline * 2)}),
+        ("fast failing", True, {"fast": ModelProfile(latency=0.05, error_rate=1.0)}),
+    ]
+    rows = []
+    with fake:
+        for name, enabled, profiles in scenarios:
+            config = OpenAIConfig(
+                api_key="bench",
+                model="smart",
+                cache=ResponseCacheConfig(enabled=False),
+                transport=TransportConfig(base_url=fake.base_url, warm_up=False),
+                routing=ModelRoutingConfig(
+                    enabled=enabled,
+                    fast_model="fast",
+                    smart_model="smart",
+                    deadline_seconds=args.deadline,
+                ),
+            )
+            client = OpenAIClient(config)
+            client.warm_up()
+            fake.models.update({"fast": fast, "smart": smart})
+            rows.append((name, *_scenario(fake, client, prompts, args.concurrency, profiles)))
+
+    print(
+        f"{args.prompts} prompts ({len(SIMPLE) * 2}:{len(COMPLEX)} simple:complex), "
+        f"concurrency {args.concurrency}, deadline {args.deadline:.1f}s"
+    )
+    print(
+        f"{'scenario':>12} | {'p50 ms':>7} | {'p95 ms':>7} | {'max ms':>7} | "
+        f"{'failed':>6} | upstream calls"
+    )
+    for name, latencies, failed, calls in rows:
+        mix = ", ".join(f"{model} {count}" for model, count in sorted(calls.items()))
+        print(
+            f"{name:>12} | {_percentile(latencies, 0.5) * 1000:>7.0f} "
+            f"| {_percentile(latencies, 0.95) * 1000:>7.0f} "
+            f"| {max(latencies, default=0.0) * 1000:>7.0f} | {failed:>6} | {mix}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
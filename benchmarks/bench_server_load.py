@@ -0,0 +1,175 @@
+"""Load test: turns per second and tail latency of ``python -m jarvis --serve``.
+
+Starts the local OpenAI stand-in, launches the server in a child process
+pointed at it, and for each count in ``--sessions`` opens that many HTTP
+sessions that each send ``--turns`` turns back to back. Every third turn is
+a skill command; the rest are distinct chat questions, so they miss the
+response cache and stream from the fake model.
+
+Reports throughput, client-side latency percentiles and how many turns the
+server refused as the number of concurrent sessions grows past its worker
+count. Requires flask, flask-socketio and httpx. Run with
+``python benchmarks/bench_server_load.py [--sessions 1 4 16 64] [--workers 8]``.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_PATH = ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fake_openai import CannedReply, FakeOpenAIServer
+
+
+@dataclass
+class LoadResult:
+    sessions: int
+    seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    rejected: int = 0
+    failed: int = 0
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(base_url: str, port: int, workers: int, workdir: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_PATH),
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "bench"),
+        "OPENAI_BASE_URL": base_url,
+        "OPENAI_WARM_UP": "false",
+        "SERVER_PORT": str(port),
+        "SERVER_WORKERS": str(workers),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "jarvis", "--serve"],
+        cwd=workdir,  # keeps the child's caches out of the repository
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_until_up(address: str, child: subprocess.Popen) -> None:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if child.poll() is not None:
+            raise RuntimeError(f"The server exited with status {child.returncode}.")
+        try:
+            httpx.get(f"{address}/health", timeout=1.0).raise_for_status()
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise RuntimeError("The server did not come up within 30 seconds.")
+
+
+def _client(address: str, index: int, turns: int, result: LoadResult, lock: threading.Lock) -> None:
+    with httpx.Client(base_url=address, timeout=60.0) as http:
+        session = http.post("/sessions").json()["session"]
+        for turn in range(turns):
+            if turn % 3 == 0:
+                text = "turn on the desk lamp"
+            else:
+                text = f"session {index} asks question {turn}: what is a fun fact?"
+            start = time.perf_counter()
+            response = http.post(f"/sessions/{session}/turns", json={"text": text})
+            elapsed = time.perf_counter() - start
+            with lock:
+                if response.status_code == 200:
+                    result.latencies.append(elapsed)
+                elif response.status_code == 429:
+                    result.rejected += 1
+                else:
+                    result.failed += 1
+        http.delete(f"/sessions/{session}")
+
+
+def _run(address: str, sessions: int, turns: int) -> LoadResult:
+    result = LoadResult(sessions=sessions)
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(target=_client, args=(address, index, turns, result, lock))
+        for index in range(sessions)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--turns", type=int, default=9, help="turns per session")
+    parser.add_argument("--workers", type=int, default=8, help="SERVER_WORKERS for the server")
+    parser.add_argument("--latency", type=float, default=0.2, help="fake model first-byte delay")
+    parser.add_argument("--token-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    fake = FakeOpenAIServer(
+        lambda body: CannedReply("Here is a fun fact about octopuses and their three hearts."),
+        latency=args.latency,
+        token_interval=args.token_interval,
+    )
+    port = _free_port()
+    address = f"http://127.0.0.1:{port}"
+    with fake, tempfile.TemporaryDirectory() as workdir:
+        child = _start_server(fake.base_url, port, args.workers, workdir)
+        try:
+            _wait_until_up(address, child)
+            _run(address, 1, 2)  # first requests pay for lazy imports and connections
+            results = [_run(address, count, args.turns) for count in args.sessions]
+        finally:
+            child.terminate()
+            child.wait(timeout=10)
+
+    print(
+        f"{args.workers} workers, {args.turns} turns per session, "
+        f"model latency {args.latency * 1000:.0f} ms"
+    )
+    print(
+        f"{'sessions':>8} | {'turns/s':>8} | {'p50 ms':>7} | {'p95 ms':>7} | "
+        f"{'p99 ms':>7} | {'rejected':>8} | {'failed':>6}"
+    )
+    for result in results:
+        print(
+            f"{result.sessions:>8} | {len(result.latencies) / result.seconds:>8.1f} "
+            f"| {_percentile(result.latencies, 0.5) * 1000:>7.0f} "
+            f"| {_percentile(result.latencies, 0.95) * 1000:>7.0f} "
+            f"| {_percentile(result.latencies, 0.99) * 1000:>7.0f} "
+            f"| {result.rejected:>8} | {result.failed:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
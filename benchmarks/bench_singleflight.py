@@ -0,0 +1,83 @@
+"""Benchmark: upstream requests saved by single flight under bursts of identical calls.
+
+Fires ``--callers`` concurrent ``generate_response`` and ``stream_response``
+calls at the local OpenAI stand-in, first all with the same question and
+then each with its own, with the response cache off so only single flight
+can merge them. Reports upstream requests, saved calls and latency for both.
+
+Run with ``python benchmarks/bench_singleflight.py [--callers 32]``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fake_openai import CannedReply, FakeOpenAIServer
+from jarvis.config import OpenAIConfig, ResponseCacheConfig, TransportConfig
+from jarvis.integrations import OpenAIClient
+
+
+def _burst(callers: int, call: Callable[[int], str]) -> List[float]:
+    def _timed(index: int) -> float:
+        start = time.perf_counter()
+        call(index)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        return list(pool.map(_timed, range(callers)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callers", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.3, help="fake model first-byte delay")
+    args = parser.parse_args()
+
+    with FakeOpenAIServer(
+        lambda body: CannedReply("The forecast says clear skies all afternoon."),
+        latency=args.latency,
+        token_interval=0.01,
+    ) as fake:
+        client = OpenAIClient(
+            OpenAIConfig(
+                api_key="bench",
+                cache=ResponseCacheConfig(enabled=False),
+                transport=TransportConfig(
+                    base_url=fake.base_url, warm_up=False, max_connections=args.callers
+                ),
+            )
+        )
+        client.generate_response("warm up")
+
+        print(f"{args.callers} concurrent callers, model latency {args.latency * 1000:.0f} ms")
+        print(f"{'burst':>18} | {'upstream':>8} | {'saved':>5} | {'p50 ms':>6} | {'max ms':>6}")
+        for label, call in (
+            ("same, blocking", lambda index: client.generate_response("weather today?")),
+            ("distinct, blocking", lambda index: client.generate_response(f"weather {index}?")),
+            ("same, streamed", lambda index: "".join(client.stream_response("forecast?"))),
+            (
+                "distinct, streamed",
+                lambda index: "".join(client.stream_response(f"forecast {index}?")),
+            ),
+        ):
+            before = len(fake.requests)
+            saved = sum(stats.saved for stats in client.flight_stats().values())
+            latencies = sorted(_burst(args.callers, call))
+            saved = sum(stats.saved for stats in client.flight_stats().values()) - saved
+            print(
+                f"{label:>18} | {len(fake.requests) - before:>8} | {saved:>5} "
+                f"| {latencies[len(latencies) // 2] * 1000:>6.0f} | {latencies[-1] * 1000:>6.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
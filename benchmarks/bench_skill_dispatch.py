@@ -0,0 +1,71 @@
+"""Micro-benchmark: compiled trigger index vs. linear ``can_handle`` scans.
+
+Run with ``python benchmarks/bench_skill_dispatch.py``.
+"""
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.skills.base import Skill, SkillContext, SkillResult
+from jarvis.skills.registry import SkillRegistry
+
+_UTTERANCES = [
+    "please activate widget 7 in the kitchen",
+    "could you restart the router for me",
+    "what is the weather going to be like tomorrow afternoon",
+    "activate widget 999 now",
+]
+_ROUNDS = 2000
+
+
+class IndexedSkill(Skill):
+    def __init__(self, number: int) -> None:
+        self.name = f"indexed_{number}"
+        self.triggers = (f"activate widget {number}", f"enable gadget {number}")
+
+    def handle(self, text: str, context: SkillContext) -> SkillResult:
+        return SkillResult(handled=True)
+
+
+class LinearSkill(Skill):
+    def __init__(self, number: int) -> None:
+        self.name = f"linear_{number}"
+        self._phrases = (f"activate widget {number}", f"enable gadget {number}")
+
+    def can_handle(self, text: str) -> bool:
+        lowered = text.lower()
+        return any(phrase in lowered for phrase in self._phrases)
+
+    def handle(self, text: str, context: SkillContext) -> SkillResult:
+        return SkillResult(handled=True)
+
+
+def _time_dispatch(registry: SkillRegistry) -> float:
+    registry.candidates(_UTTERANCES[0])  # compile outside the timed region
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        for utterance in _UTTERANCES:
+            registry.candidates(utterance)
+    elapsed = time.perf_counter() - start
+    return elapsed / (_ROUNDS * len(_UTTERANCES)) * 1e6
+
+
+def main() -> int:
+    print(f"{'skills':>8} | {'linear us/turn':>15} | {'indexed us/turn':>15}")
+    for count in (10, 100, 1000):
+        linear = SkillRegistry(LinearSkill(number) for number in range(count))
+        indexed = SkillRegistry(IndexedSkill(number) for number in range(count))
+        print(
+            f"{count:>8} | {_time_dispatch(linear):>15.2f} | {_time_dispatch(indexed):>15.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,178 @@
+"""Benchmark: first-reply latency with and without speculative chat requests.
+
+Answers a mix of chat questions, trigger commands ("turn on the desk lamp")
+and paraphrased commands the intent classifier has to catch, through
+``JarvisAssistant.answer`` against the local OpenAI stand-in. Skill matching
+is slowed down by ``--skill-delay`` to stand in for skills with slow side
+effects or lookups. With ``OPENAI_SPECULATIVE_CHAT`` the chat request starts
+before matching, so chat turns should gain roughly the skill time, while
+paraphrased commands pay for a request that is then cancelled.
+
+Prints p50/p95 time to the first reply chunk for chat turns, whole-turn p50
+for skill turns, and the speculation win rate and wasted tokens. It also
+cancels one speculation while the model is between tokens and reports how
+long the request kept running afterwards; cancelling aborts the connection,
+so this should be a few milliseconds rather than the gap to the next token. Run with
+``python benchmarks/bench_speculative_chat.py [--skill-delay 0.2] [--turns 30]``.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_PATH = ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fake_openai import CannedReply, FakeOpenAIServer
+
+from jarvis.config import (
+    OpenAIConfig,
+    ResponseCacheConfig,
+    Settings,
+    TransportConfig,
+    load_settings,
+)
+from jarvis.core.assistant import JarvisAssistant
+from jarvis.core.pipeline import Reply
+from jarvis.core.speculation import Speculator
+from jarvis.integrations.openai_client import OpenAIClient
+
+COMMANDS = ["turn on the desk lamp", "turn off the desk lamp", "open vs code"]
+PARAPHRASES = ["switch the desk lamp on", "kill the desk light", "fire up code"]
+
+
+class SlowSkillsAssistant(JarvisAssistant):
+    """Skill matching that takes ``skill_delay`` seconds before it answers or declines."""
+
+    def __init__(self, settings: Settings, *, skill_delay: float) -> None:
+        super().__init__(settings)
+        self._skill_delay = skill_delay
+
+    def _try_handle_with_skills(self, text: str) -> Optional[Reply]:
+        time.sleep(self._skill_delay)
+        return super()._try_handle_with_skills(text)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def _utterances(turns: int) -> List[str]:
+    texts = []
+    for index in range(turns):
+        if index % 4 == 1:
+            texts.append(COMMANDS[index % len(COMMANDS)])
+        elif index % 4 == 3:
+            texts.append(PARAPHRASES[index % len(PARAPHRASES)])
+        else:
+            texts.append(f"question {index}: what is a fun fact about the ocean?")
+    return texts
+
+
+def _scenario(speculative: bool, texts: List[str], skill_delay: float) -> List[str]:
+    settings = load_settings()
+    settings.openai.speculative_chat = speculative
+    assistant = SlowSkillsAssistant(settings, skill_delay=skill_delay)
+    try:
+        assistant.answer("warm up the connection", memory=assistant.new_memory())
+        chat: List[float] = []
+        skill: List[float] = []
+        for text in texts:
+            result = assistant.answer(text, memory=assistant.new_memory())
+            if result is None:
+                continue
+            if result.route == "chat" and result.first_reply_seconds is not None:
+                chat.append(result.first_reply_seconds)
+            elif result.route == "skill":
+                skill.append(result.seconds)
+        stats = assistant.speculation_stats()
+    finally:
+        assistant.close()
+    return [
+        "speculative" if speculative else "sequential",
+        f"{_percentile(chat, 0.5) * 1000:.0f}",
+        f"{_percentile(chat, 0.95) * 1000:.0f}",
+        f"{_percentile(skill, 0.5) * 1000:.0f}",
+        f"{stats.used}/{stats.cancelled}",
+        f"{stats.win_rate:.0%}",
+        f"{stats.wasted_prompt_tokens}+{stats.wasted_completion_tokens}",
+    ]
+
+
+def _cancel_delay(token_gap: float) -> float:
+    """Seconds a speculative request keeps running after it is cancelled mid-reply."""
+
+    fake = FakeOpenAIServer(
+        lambda body: CannedReply("one two three four five"), latency=0.05, token_interval=token_gap
+    )
+    with fake:
+        client = OpenAIClient(
+            OpenAIConfig(
+                api_key="bench",
+                cache=ResponseCacheConfig(enabled=False),
+                transport=TransportConfig(base_url=fake.base_url, warm_up=False),
+            )
+        )
+        client.warm_up()
+        speculation = Speculator().start(client.stream_response("cancel me"), prompt_tokens=0)
+        time.sleep(0.05 + token_gap / 4)  # the first word is in, the next one is far off
+        started = time.perf_counter()
+        speculation.cancel()
+        speculation._stream._thread.join(token_gap * 2)
+        return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=32)
+    parser.add_argument("--skill-delay", type=float, default=0.2, help="seconds per skill match")
+    parser.add_argument("--latency", type=float, default=0.4, help="fake model first-byte delay")
+    parser.add_argument("--token-interval", type=float, default=0.02)
+    args = parser.parse_args()
+
+    fake = FakeOpenAIServer(
+        lambda body: CannedReply("The ocean holds about ninety seven percent of all water."),
+        latency=args.latency,
+        token_interval=args.token_interval,
+    )
+    texts = _utterances(args.turns)
+    with fake, tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)  # keeps the assistant's caches out of the repository
+        os.environ.update(
+            OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY", "bench"),
+            OPENAI_BASE_URL=fake.base_url,
+            OPENAI_WARM_UP="false",
+            RESPONSE_CACHE_ENABLED="false",
+            ENABLE_MICROPHONE="false",
+            VOICE_ENGINE="text",
+        )
+        rows = [_scenario(speculative, texts, args.skill_delay) for speculative in (False, True)]
+
+    print(
+        f"{args.turns} turns, skill matching {args.skill_delay * 1000:.0f} ms, "
+        f"model latency {args.latency * 1000:.0f} ms"
+    )
+    header = ["mode", "chat p50 ms", "chat p95 ms", "skill p50 ms", "used/cxl", "wins", "wasted"]
+    widths = [11, 11, 11, 12, 8, 5, 10]
+    print(" | ".join(title.rjust(width) for title, width in zip(header, widths)))
+    for row in rows:
+        print(" | ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+    gap = 1.0
+    delay = _cancel_delay(gap)
+    print(
+        f"cancelled mid-reply with the next token {gap * 1000:.0f} ms away: "
+        f"request stopped after {delay * 1000:.0f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+"""Benchmark: startup time breakdown with an enforceable regression budget.
+
+Starts the assistant in fresh interpreters (so nothing is already imported)
+and reports the median time to import ``jarvis``, to construct the assistant
+(after which the prompt shows), and until every backend is initialized, plus the per-component
+profile of the median run. For comparison it also times importing the
+backend libraries eagerly, which is what every start used to pay.
+
+Exits with status 1 when the median total exceeds ``--budget-ms``, so it can
+guard startup in CI. Run with
+``python benchmarks/bench_startup.py [--runs 5] [--budget-ms 1500] [--json]``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+_EAGER_BACKENDS = ("openai", "speech_recognition", "numpy")
+_CHILD_ENV = {
+    "OPENAI_API_KEY": "benchmark",
+    "OPENAI_WARM_UP": "false",
+    "RESPONSE_CACHE_ENABLED": "false",
+    "VOICE_ENGINE": "text",
+    "ENABLE_MICROPHONE": "false",
+    "PHRASE_CACHE_DIR": "",
+}
+
+
+def _child() -> int:
+    start = time.perf_counter()
+    from jarvis.config import load_settings
+    from jarvis.core.assistant import JarvisAssistant
+
+    imported = time.perf_counter() - start
+    start = time.perf_counter()
+    assistant = JarvisAssistant(load_settings(env_file=Path(os.devnull)))
+    # the constructor returns as soon as the prompt can show; backends keep loading
+    constructed = time.perf_counter() - start
+    report = assistant.startup_report()
+    print(
+        json.dumps(
+            {"import_seconds": imported, "construct_seconds": constructed, **report.as_dict()}
+        )
+    )
+    return 0
+
+
+def _eager_child() -> int:
+    start = time.perf_counter()
+    for name in _EAGER_BACKENDS:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+    print(json.dumps({"import_seconds": time.perf_counter() - start}))
+    return 0
+
+
+def _spawn(flag: str) -> dict:
+    env = {**os.environ, **_CHILD_ENV, "PYTHONPATH": str(SRC_PATH)}
+    output = subprocess.run(
+        [sys.executable, __file__, flag], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--json", action="store_true", help="print the median run as JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--eager-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return _child()
+    if args.eager_child:
+        return _eager_child()
+
+    runs = [_spawn("--child") for _ in range(args.runs)]
+    for run in runs:
+        run["startup_ms"] = (run["import_seconds"] + run["total_seconds"]) * 1000
+    runs.sort(key=lambda run: run["startup_ms"])
+    median = runs[len(runs) // 2]
+    eager = statistics.median(
+        _spawn("--eager-child")["import_seconds"] * 1000 for _ in range(args.runs)
+    )
+    over = args.budget_ms is not None and median["startup_ms"] > args.budget_ms
+
+    if args.json:
+        summary = {
+            **median,
+            "eager_backend_import_ms": eager,
+            "budget_ms": args.budget_ms,
+            "over_budget": over,
+        }
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"median of {args.runs} fresh starts (text mode, no network)")
+        print(f"  import jarvis:              {median['import_seconds'] * 1000:>7.1f} ms")
+        print(f"  assistant constructed:      {median['construct_seconds'] * 1000:>7.1f} ms")
+        print(f"  all backends initialized:   {median['total_seconds'] * 1000:>7.1f} ms")
+        print(f"  startup total:              {median['startup_ms']:>7.1f} ms")
+        print(f"  eager {'/'.join(_EAGER_BACKENDS)} import: {eager:.1f} ms (now deferred)")
+        print(f"{'component':>14} | {'start ms':>8} | {'import ms':>9} | {'init ms':>8}")
+        for component in median["components"]:
+            print(
+                f"{component['name']:>14} | {component['started_at'] * 1000:>8.1f} "
+                f"| {component['import_seconds'] * 1000:>9.1f} "
+                f"| {component['init_seconds'] * 1000:>8.1f}"
+            )
+        if args.budget_ms is not None:
+            verdict = "OVER" if over else "within"
+            print(f"startup {verdict} the {args.budget_ms:.0f} ms budget")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+"""Benchmark: one tool-calling round-trip vs. one turn per command.
+
+A local fake OpenAI server (``fake_openai.py``) answers "open VS Code and turn
+on my desk lamp" with two canned tool calls. The skills' actions are slowed
+down to look like real app launches and device writes. Compares issuing the
+two commands as separate turns (two completions, actions in series) with a
+single planned completion whose calls run concurrently.
+
+Run with ``python benchmarks/bench_tool_calling.py [--latency 0.4] [--action 0.3]``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fake_openai import CannedReply, FakeOpenAIServer
+
+from jarvis.config import HardwareConfig, OpenAIConfig, ResponseCacheConfig, TransportConfig
+from jarvis.hardware.controller import HardwareController
+from jarvis.integrations.openai_client import OpenAIClient
+from jarvis.skills.base import SkillContext
+from jarvis.skills.lighting import LightingSkill
+from jarvis.skills.system_control import SystemControlSkill
+from jarvis.skills.tools import ToolBox
+from jarvis.system.launcher import AppLauncher, AppSpec, LaunchResult
+
+_COMMAND = "open VS Code and turn on my desk lamp"
+
+
+class SlowLauncher(AppLauncher):
+    """Pretends every application takes ``delay`` seconds to start."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self._delay = delay
+
+    def open(self, spec: AppSpec, *, reuse: bool = True) -> Optional[LaunchResult]:
+        time.sleep(self._delay)
+        return LaunchResult(key=spec.key, pid=None)
+
+
+def _plan(request: Dict[str, Any]) -> CannedReply:
+    if not request.get("tools"):
+        return CannedReply(content="Done.")
+    return CannedReply(
+        content="",
+        tool_calls=[
+            ("skill_system_control", {"intent": "open_vscode", "app": "vs code"}),
+            ("skill_lighting", {"intent": "turn_on", "device": "desk lamp"}),
+        ],
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.4, help="fake model latency (s)")
+    parser.add_argument("--action", type=float, default=0.3, help="per-action duration (s)")
+    args = parser.parse_args()
+
+    hardware = HardwareController(HardwareConfig())
+    hardware.register_action("turn_on_desk_lamp", lambda: time.sleep(args.action))
+    hardware.register_action("turn_off_desk_lamp", lambda: time.sleep(args.action))
+    context = SkillContext(hardware=hardware)
+    skills = [SystemControlSkill(SlowLauncher(args.action)), LightingSkill(device_name="desk_lamp")]
+    toolbox = ToolBox(skills)
+
+    with FakeOpenAIServer(_plan, latency=args.latency) as server:
+        client = OpenAIClient(
+            OpenAIConfig(
+                api_key="fake",
+                cache=ResponseCacheConfig(enabled=False),
+                transport=TransportConfig(base_url=server.base_url, warm_up=False),
+            )
+        )
+        client.generate_response("warm up the connection")
+
+        start = time.perf_counter()
+        for command, skill in (("open VS Code", skills[0]), ("turn on my desk lamp", skills[1])):
+            client.generate_response(command)
+            skill.handle(command, context)
+        separate = time.perf_counter() - start
+
+        start = time.perf_counter()
+        plan = client.plan_tool_calls(_COMMAND, tools=toolbox.schemas(context))
+        results = toolbox.execute(plan.calls, context)
+        planned = time.perf_counter() - start
+
+    print(f"command: {_COMMAND!r}")
+    print(f"separate turns:        {separate * 1000:7.0f} ms  (2 completions, actions in series)")
+    print(f"one tool-calling turn: {planned * 1000:7.0f} ms  (1 completion, {len(results)} calls)")
+    for result in results:
+        print(f"  {result.call.name}({result.call.arguments}) -> {result.output!r}")
+    toolbox.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+"""Micro-benchmark: what a tracing span and a histogram update cost per call.
+
+Compares a bare loop with spans outside a turn, inside an active turn, with
+tracing disabled, and with a plain histogram ``observe``. The per-call costs
+should stay in the low microseconds, far below any stage they time.
+
+Run with ``python benchmarks/bench_tracing_overhead.py [--calls 200000]``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.telemetry.metrics import MetricsRegistry
+from jarvis.telemetry.tracing import Tracer
+
+
+def _per_call_ns(body: Callable[[], None], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        body()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    tracer = Tracer(MetricsRegistry(), keep_turns=1)
+    histogram = MetricsRegistry().histogram("bench_seconds")
+
+    def _span() -> None:
+        with tracer.span("stt"):
+            pass
+
+    baseline = _per_call_ns(lambda: None, args.calls)
+    outside = _per_call_ns(_span, args.calls)
+    with tracer.activate(tracer.begin_turn()):
+        inside = _per_call_ns(_span, args.calls)
+    observe = _per_call_ns(lambda: histogram.observe(0.01), args.calls)
+    tracer.enabled = False
+    disabled = _per_call_ns(_span, args.calls)
+
+    print(f"{'operation':>22} | {'ns/call':>8}")
+    for label, value in (
+        ("empty call", baseline),
+        ("span, no turn", outside),
+        ("span, inside a turn", inside),
+        ("span, tracing off", disabled),
+        ("histogram observe", observe),
+    ):
+        print(f"{label:>22} | {value:>8.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
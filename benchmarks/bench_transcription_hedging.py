@@ -0,0 +1,162 @@
+"""Benchmark: check racing, hedging and cancellation in TranscriptionCoordinator.
+
+Drives the coordinator with fake transcribers that sleep for a fixed time
+instead of calling a speech-to-text service. Each scenario checks one path
+and prints the time it took:
+
+* ``race``: the fast backend wins even though the slow one was listed first;
+* ``hedge learned``: after a few answers, the hedge delay equals the first
+  backend's observed p90, and a stalled call is hedged at that point;
+* ``hedge not needed``: an answer within the delay never starts the second
+  backend;
+* ``hedge failover``: a failing first backend starts the second at once;
+* ``cancel``: a losing cancellable backend stops before its "upload", and the
+  cut-short call is left out of its latency statistics.
+
+Exits with status 1 if any check fails. Run with
+``python benchmarks/bench_transcription_hedging.py``.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.io.transcription import (
+    TranscriptionBackend,
+    TranscriptionCancelled,
+    TranscriptionCoordinator,
+)
+
+
+class FakeTranscriber:
+    """Spends ``prepare`` seconds encoding, then ``latency`` seconds "uploading"."""
+
+    def __init__(
+        self, text: str, latency: float, *, prepare: float = 0.0, fail: bool = False
+    ) -> None:
+        self.text = text
+        self.latency = latency
+        self.prepare = prepare
+        self.fail = fail
+        self.started: List[float] = []
+        self.uploads = 0
+        self.skipped = 0
+
+    def __call__(self, audio: object, *, cancelled: Optional[threading.Event] = None) -> str:
+        self.started.append(time.perf_counter())
+        if cancelled is not None and cancelled.wait(self.prepare):
+            self.skipped += 1
+            raise TranscriptionCancelled(f"{self.text} skipped")
+        if cancelled is None:
+            time.sleep(self.prepare)
+        self.uploads += 1
+        time.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError(f"{self.text} failed")
+        return self.text
+
+
+def _coordinator(
+    strategy: str, *fakes: Tuple[str, FakeTranscriber], cancellable: bool = False
+) -> TranscriptionCoordinator:
+    backends = [
+        TranscriptionBackend(name=name, transcribe=fake, cancellable=cancellable)
+        for name, fake in fakes
+    ]
+    return TranscriptionCoordinator(backends, strategy=strategy, default_hedge_delay=0.5)
+
+
+def _timed(coordinator: TranscriptionCoordinator) -> Tuple[str, float, float]:
+    started = time.perf_counter()
+    text = coordinator.transcribe(b"audio")
+    return text, time.perf_counter() - started, started
+
+
+def _race() -> Tuple[bool, str]:
+    slow, fast = FakeTranscriber("slow", 0.6), FakeTranscriber("fast", 0.05)
+    coordinator = _coordinator("race", ("slow", slow), ("fast", fast))
+    text, seconds, _ = _timed(coordinator)
+    coordinator.close()
+    return text == "fast" and seconds < 0.3, f"{text!r} in {seconds * 1000:.0f} ms"
+
+
+def _hedge_learned() -> Tuple[bool, str]:
+    primary, backup = FakeTranscriber("primary", 0.15), FakeTranscriber("backup", 0.05)
+    coordinator = _coordinator("hedge", ("primary", primary), ("backup", backup))
+    for _ in range(5):
+        _timed(coordinator)  # answers inside the default delay teach the p90
+    delay = coordinator.hedge_delay(coordinator._backends[0])
+    primary.latency = 2.0  # stalls this time
+    text, seconds, started = _timed(coordinator)
+    hedged_at = backup.started[-1] - started if backup.started else float("inf")
+    coordinator.close()
+    ok = (
+        0.13 <= delay <= 0.25
+        and text == "backup"
+        and abs(hedged_at - delay) < 0.08
+        and seconds < delay + 0.2
+    )
+    return ok, (
+        f"delay {delay * 1000:.0f} ms, hedged at {hedged_at * 1000:.0f} ms, "
+        f"{text!r} in {seconds * 1000:.0f} ms"
+    )
+
+
+def _hedge_not_needed() -> Tuple[bool, str]:
+    primary, backup = FakeTranscriber("primary", 0.1), FakeTranscriber("backup", 0.05)
+    coordinator = _coordinator("hedge", ("primary", primary), ("backup", backup))
+    text, seconds, _ = _timed(coordinator)
+    coordinator.close()
+    ok = text == "primary" and not backup.started
+    return ok, f"{text!r} in {seconds * 1000:.0f} ms, backup calls {len(backup.started)}"
+
+
+def _hedge_failover() -> Tuple[bool, str]:
+    broken = FakeTranscriber("broken", 0.02, fail=True)
+    backup = FakeTranscriber("backup", 0.05)
+    coordinator = _coordinator("hedge", ("broken", broken), ("backup", backup))
+    text, seconds, _ = _timed(coordinator)
+    coordinator.close()
+    return text == "backup" and seconds < 0.3, f"{text!r} in {seconds * 1000:.0f} ms"
+
+
+def _cancel() -> Tuple[bool, str]:
+    fast = FakeTranscriber("fast", 0.05, prepare=0.01)
+    whisper = FakeTranscriber("whisper", 0.5, prepare=0.2)
+    coordinator = _coordinator("race", ("fast", fast), ("whisper", whisper), cancellable=True)
+    text, seconds, _ = _timed(coordinator)
+    time.sleep(0.3)  # let the loser reach its upload step
+    stats = coordinator.stats()["whisper"]
+    coordinator.close()
+    ok = text == "fast" and whisper.skipped == 1 and whisper.uploads == 0 and stats.calls == 0
+    return ok, (
+        f"{text!r} in {seconds * 1000:.0f} ms, loser uploads {whisper.uploads}, "
+        f"skipped {whisper.skipped}, loser samples {stats.calls}"
+    )
+
+
+def main() -> int:
+    checks: List[Tuple[str, Callable[[], Tuple[bool, str]]]] = [
+        ("race", _race),
+        ("hedge learned", _hedge_learned),
+        ("hedge not needed", _hedge_not_needed),
+        ("hedge failover", _hedge_failover),
+        ("cancel", _cancel),
+    ]
+    failed = 0
+    for name, check in checks:
+        ok, detail = check()
+        failed += not ok
+        print(f"{name:>16} | {'ok' if ok else 'FAIL':>4} | {detail}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
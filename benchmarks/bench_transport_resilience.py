@@ -0,0 +1,275 @@
+"""Benchmark: check retries and circuit breaking in ResilientTransport over real HTTP.
+
+Points ``OpenAIClient`` at a local server that answers each chat request
+with the next scripted outcome: an HTTP status (500, 502, 429, 200), a
+dropped connection, or a stall longer than the request deadline. Each
+scenario checks the upstream hits and the transport counters:
+
+* ``5xx``, ``429`` and ``reset`` are retried until the 200 comes through;
+* ``stall`` uses up the whole deadline, so it fails without a retry;
+* ``400`` is not transient: no retry, and it does not count against the breaker;
+* ``breaker`` trips the circuit (closed -> open), short-circuits without
+  reaching the server, lets one probe through after the reset period
+  (half-open), closes again when the probe succeeds, and re-opens when a
+  later probe fails.
+
+Exits with status 1 if any check fails. Run with
+``python benchmarks/bench_transport_resilience.py``.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, List, Tuple, Union
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.config import OpenAIConfig, ResponseCacheConfig, TransportConfig
+from jarvis.integrations.openai_client import OpenAIClient
+from jarvis.integrations.transport import CLOSED, HALF_OPEN, OPEN, TransportMetrics
+
+_DEADLINE = 0.6
+_RESET_SECONDS = 0.3
+_CANNED = "I'm offline right now."
+# a status code, "reset" (close the connection unanswered) or ("slow", seconds)
+Outcome = Union[int, str, Tuple[str, float]]
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        pass  # the client hanging up on a stall is expected
+
+
+class ScriptedServer:
+    """Answer chat requests with scripted outcomes, then with 200."""
+
+    def __init__(self) -> None:
+        self.script: List[Outcome] = []
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._server = _QuietHTTPServer(("127.0.0.1", 0), self._handler_class())
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next(self) -> Outcome:
+        with self._lock:
+            self.hits += 1
+            return self.script.pop(0) if self.script else 200
+
+    def _handler_class(self) -> type:
+        scripted = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                data = b'{"object": "list", "data": []}'
+                self.send_response(200)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers.get("content-length", 0)))
+                outcome = scripted._next()
+                if outcome == "reset":
+                    self.close_connection = True
+                    return
+                if isinstance(outcome, tuple):
+                    time.sleep(outcome[1])
+                    outcome = 200
+                if outcome == "stall":
+                    time.sleep(_DEADLINE * 2)
+                    outcome = 200
+                if outcome == 200:
+                    body = {
+                        "id": "chatcmpl-check",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": "check",
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": "ok"},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    }
+                else:
+                    body = {"error": {"message": f"scripted {outcome}"}}
+                data = json.dumps(body).encode()
+                self.send_response(int(outcome))
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return _Handler
+
+
+def _client(server: ScriptedServer, *, max_retries: int = 2) -> OpenAIClient:
+    client = OpenAIClient(
+        OpenAIConfig(
+            api_key="check",
+            cache=ResponseCacheConfig(enabled=False),
+            transport=TransportConfig(
+                base_url=server.base_url,
+                request_timeout=_DEADLINE,
+                max_retries=max_retries,
+                backoff_base_seconds=0.01,
+                backoff_max_seconds=0.02,
+                breaker_failure_threshold=3,
+                breaker_reset_seconds=_RESET_SECONDS,
+                canned_response=_CANNED,
+                warm_up=False,
+            ),
+        )
+    )
+    client.warm_up()  # load the SDK outside the short deadlines below
+    return client
+
+
+def _ask(client: OpenAIClient, prompt: str) -> Tuple[str, float]:
+    started = time.perf_counter()
+    try:
+        reply = client.generate_response(prompt)
+    except RuntimeError as exc:
+        reply = f"error: {type(exc.__cause__).__name__}"
+    return reply, time.perf_counter() - started
+
+
+def _counts(metrics: TransportMetrics) -> str:
+    return (
+        f"attempts {metrics.attempts}, retries {metrics.retries}, "
+        f"failures {metrics.failures}, short circuits {metrics.short_circuits}"
+    )
+
+
+def _retried(script: List[Outcome], retries: int) -> Callable[[ScriptedServer], Tuple[bool, str]]:
+    def check(server: ScriptedServer) -> Tuple[bool, str]:
+        server.script = list(script)
+        client = _client(server)
+        reply, seconds = _ask(client, "retry me")
+        metrics = client.transport_metrics()
+        ok = (
+            reply == "ok"
+            and server.hits == retries + 1
+            and metrics.attempts == retries + 1
+            and metrics.retries == retries
+            and metrics.failures == 0
+            and metrics.circuit_state == CLOSED
+        )
+        return ok, f"{reply!r} in {seconds * 1000:.0f} ms; hits {server.hits}, {_counts(metrics)}"
+
+    return check
+
+
+def _stall(server: ScriptedServer) -> Tuple[bool, str]:
+    server.script = ["stall"]
+    client = _client(server)
+    reply, seconds = _ask(client, "stall")
+    metrics = client.transport_metrics()
+    ok = (
+        reply.startswith("error")
+        and abs(seconds - _DEADLINE) < 0.2
+        and (metrics.attempts, metrics.retries, metrics.failures) == (1, 0, 1)
+    )
+    return ok, f"{reply!r} after {seconds * 1000:.0f} ms; {_counts(metrics)}"
+
+
+def _not_transient(server: ScriptedServer) -> Tuple[bool, str]:
+    server.script = [400, 400, 400, 400]
+    client = _client(server, max_retries=0)
+    replies = [_ask(client, f"bad request {index}")[0] for index in range(4)]
+    metrics = client.transport_metrics()
+    ok = (
+        all(reply.startswith("error") for reply in replies)
+        and server.hits == 4
+        and metrics.retries == 0
+        and metrics.circuit_state == CLOSED
+    )
+    return ok, f"hits {server.hits}, state {metrics.circuit_state}, {_counts(metrics)}"
+
+
+def _breaker(server: ScriptedServer) -> Tuple[bool, str]:
+    client = _client(server, max_retries=0)
+    states: List[str] = []
+
+    def state() -> str:
+        states.append(client.transport_metrics().circuit_state)
+        return states[-1]
+
+    state()
+    server.script = [500, 500, 500]
+    for index in range(3):
+        _ask(client, f"fail {index}")
+    tripped = state() == OPEN
+    hits = server.hits
+    short_reply, _ = _ask(client, "while open")
+    short_circuited = short_reply == _CANNED and server.hits == hits
+
+    # after the reset period one probe goes through; watch the state while it runs
+    time.sleep(_RESET_SECONDS + 0.05)
+    server.script = [("slow", 0.2)]
+    probe = threading.Thread(target=_ask, args=(client, "probe"))
+    probe.start()
+    time.sleep(0.1)
+    probing = state() == HALF_OPEN
+    probe.join()
+    closed = state() == CLOSED
+
+    server.script = [500, 500, 500]
+    for index in range(3):
+        _ask(client, f"fail again {index}")
+    time.sleep(_RESET_SECONDS + 0.05)
+    server.script = [500]
+    _ask(client, "failing probe")
+    reopened = state() == OPEN
+
+    ok = tripped and short_circuited and probing and closed and reopened
+    metrics = client.transport_metrics()
+    return ok, f"states {' -> '.join(states)}; {_counts(metrics)}"
+
+
+def main() -> int:
+    checks: List[Tuple[str, Callable[[ScriptedServer], Tuple[bool, str]]]] = [
+        ("5xx", _retried([500, 502], retries=2)),
+        ("429", _retried([429], retries=1)),
+        ("reset", _retried(["reset"], retries=1)),
+        ("stall", _stall),
+        ("400", _not_transient),
+        ("breaker", _breaker),
+    ]
+    failed = 0
+    for name, check in checks:
+        server = ScriptedServer()
+        try:
+            ok, detail = check(server)
+        finally:
+            server.close()
+        failed += not ok
+        print(f"{name:>7} | {'ok' if ok else 'FAIL':>4} | {detail}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
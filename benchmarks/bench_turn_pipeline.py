@@ -0,0 +1,122 @@
+"""Benchmark: serial turn loop vs. the asyncio ``TurnPipeline``.
+
+Back-to-back commands arrive on a fixed schedule; each stage sleeps to
+simulate transcription, reasoning, and speech. Turn latency is measured from
+the moment the user finished speaking to the first audio of the reply.
+
+Run with ``python benchmarks/bench_turn_pipeline.py``.
+"""
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from jarvis.core.pipeline import Reply, TurnPipeline
+
+_COMMANDS = 8
+_ARRIVAL_INTERVAL = 0.8
+_TRANSCRIBE_SECONDS = 0.2
+_REASON_SECONDS = 0.5
+_SPEAK_SECONDS = 0.6
+
+
+class ScriptedListener:
+    """Hand out utterances as they "arrive", recording when each one was spoken."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._next = 0
+        self.spoken_at: List[float] = []
+
+    def capture(self, *, prompt: str = "") -> str:
+        if self._next >= _COMMANDS:
+            raise EOFError
+        arrival = self._origin + self._next * _ARRIVAL_INTERVAL
+        time.sleep(max(0.0, arrival - time.perf_counter()))
+        self.spoken_at.append(arrival)
+        self._next += 1
+        return f"command {self._next}"
+
+    def transcribe(self, captured: str) -> str:
+        time.sleep(_TRANSCRIBE_SECONDS)
+        return captured
+
+    def pause(self) -> None:
+        pass
+
+    def resume(self) -> None:
+        pass
+
+
+class SleepyResponder:
+    def stop(self) -> None:
+        pass
+
+
+def _reason(text: str, started_at: float) -> Optional[Reply]:
+    time.sleep(_REASON_SECONDS)
+    return Reply(text=f"done with {text}", started_at=started_at)
+
+
+def _make_deliver(listener: ScriptedListener, latencies: List[float]):
+    def _deliver(reply: Reply) -> Optional[float]:
+        index = len(latencies)
+        latencies.append(time.perf_counter() - listener.spoken_at[index])
+        time.sleep(_SPEAK_SECONDS)
+        return None
+
+    return _deliver
+
+
+def run_serial() -> List[float]:
+    listener = ScriptedListener()
+    latencies: List[float] = []
+    deliver = _make_deliver(listener, latencies)
+    while True:
+        try:
+            captured = listener.capture()
+        except EOFError:
+            break
+        text = listener.transcribe(captured)
+        reply = _reason(text, time.perf_counter())
+        if reply:
+            deliver(reply)
+    return latencies
+
+
+def run_pipelined() -> List[float]:
+    listener = ScriptedListener()
+    latencies: List[float] = []
+    pipeline = TurnPipeline(
+        listener,  # type: ignore[arg-type]
+        SleepyResponder(),  # type: ignore[arg-type]
+        reason=_reason,
+        deliver=_make_deliver(listener, latencies),
+        barge_in=False,
+    )
+    pipeline.run()
+    return latencies
+
+
+def _describe(label: str, latencies: List[float]) -> None:
+    print(
+        f"{label:>10}: mean {statistics.mean(latencies) * 1000:7.0f} ms | "
+        f"max {max(latencies) * 1000:7.0f} ms over {len(latencies)} turns"
+    )
+
+
+def main() -> int:
+    _describe("serial", run_serial())
+    _describe("pipelined", run_pipelined())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
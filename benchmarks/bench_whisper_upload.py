@@ -0,0 +1,133 @@
+"""Benchmark: temp-file WAV uploads vs. trimmed in-memory FLAC/Opus uploads.
+
+Builds a synthetic utterance (silence, a voiced burst, silence) and compares
+payload size, preparation time and transcription round trip. By default the
+upload goes to the local OpenAI stand-in behind a throttled uplink
+(``--uplink-kbps``), so the round trip reflects payload size; with ``--live``
+and ``OPENAI_API_KEY`` set it goes to the real Whisper API instead. A codec
+that is unavailable here (Opus without ffmpeg) is labelled with the codec
+actually uploaded.
+
+Run with ``python benchmarks/bench_whisper_upload.py [--live] [--uplink-kbps 1000]``.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+import speech_recognition as sr
+from fake_openai import FakeOpenAIServer
+
+from jarvis.config import OpenAIConfig, ResponseCacheConfig, TransportConfig
+from jarvis.integrations.openai_client import OpenAIClient
+from jarvis.io.audio_processing import prepare_upload
+
+_RATE = 44100
+
+
+def _synthetic_utterance() -> "sr.AudioData":
+    rng = random.Random(7)
+    samples = array("h")
+    for second, voiced in ((1.0, False), (1.5, True), (1.5, False)):
+        for index in range(int(second * _RATE)):
+            noise = rng.randint(-40, 40)
+            tone = 6000 * math.sin(2 * math.pi * 180 * index / _RATE) if voiced else 0
+            samples.append(int(tone) + noise)
+    return sr.AudioData(samples.tobytes(), _RATE, 2)
+
+
+def _legacy(audio: "sr.AudioData") -> Tuple[bytes, str]:
+    wav_bytes = audio.get_wav_data(convert_rate=16000)
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as handle:
+        handle.write(wav_bytes)
+        tmp_path = Path(handle.name)
+    try:
+        return tmp_path.read_bytes(), "audio.wav"
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+def _time(prepare: Callable[[], Tuple[bytes, str]], rounds: int = 5) -> Tuple[bytes, str, float]:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        payload, name = prepare()
+    return payload, name, (time.perf_counter() - start) / rounds
+
+
+def _round_trip(client: OpenAIClient, payload: bytes, name: str, rounds: int) -> float:
+    samples: List[float] = []
+    for index in range(rounds):
+        start = time.perf_counter()
+        # a distinct file name per round keeps identical uploads from being merged
+        client.transcribe_audio(payload, filename=f"{index}-{name}")
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)[len(samples) // 2]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--live", action="store_true", help="call the real Whisper API")
+    parser.add_argument("--uplink-kbps", type=float, default=1000, help="local uplink speed")
+    parser.add_argument("--whisper-latency", type=float, default=0.3, help="local model time")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    audio = _synthetic_utterance()
+    # (label, codec the variant asks for, prepare)
+    variants = [
+        ("temp-file wav", "wav", lambda: _legacy(audio)),
+        ("memory wav+trim", "wav", lambda: prepare_upload(audio, sr, codec="wav")),
+        ("memory flac+trim", "flac", lambda: prepare_upload(audio, sr, codec="flac")),
+        ("memory opus+trim", "ogg", lambda: prepare_upload(audio, sr, codec="opus")),
+    ]
+
+    with contextlib.ExitStack() as stack:
+        if args.live and os.getenv("OPENAI_API_KEY"):
+            config = OpenAIConfig(api_key=os.environ["OPENAI_API_KEY"])
+            target = "Whisper API"
+        else:
+            fake = stack.enter_context(
+                FakeOpenAIServer(
+                    transcription_latency=args.whisper_latency,
+                    upload_bytes_per_second=args.uplink_kbps * 1000 / 8,
+                )
+            )
+            config = OpenAIConfig(
+                api_key="bench",
+                cache=ResponseCacheConfig(enabled=False),
+                transport=TransportConfig(base_url=fake.base_url, warm_up=False),
+            )
+            target = f"local stand-in, {args.uplink_kbps:.0f} kbit/s uplink"
+        client = OpenAIClient(config)
+        client.warm_up()
+
+        print(f"round trip: {target}, median of {args.rounds}")
+        print(f"{'variant':>32} | {'bytes':>9} | {'prepare ms':>10} | {'upload ms':>9}")
+        for label, extension, prepare in variants:
+            payload, name, seconds = _time(prepare)
+            if not name.endswith(f".{extension}"):
+                label = f"{label} ({name.rsplit('.', 1)[-1]} fallback)"
+            upload = _round_trip(client, payload, name, args.rounds)
+            print(
+                f"{label:>32} | {len(payload):>9} | {seconds * 1000:>10.1f} "
+                f"| {upload * 1000:>9.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
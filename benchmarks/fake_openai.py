@@ -0,0 +1,223 @@
+"""Local stand-in for the OpenAI HTTP API used by the benchmarks.
+
+Serves ``/v1/chat/completions`` (plain, streamed and tool-calling),
+``/v1/audio/transcriptions`` and ``/v1/models`` with a configurable delay so
+the real ``OpenAIClient`` can be exercised without network access. Point the
+client at it with ``TransportConfig(base_url=server.base_url)``.
+"""
+from __future__ import annotations
+
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+@dataclass(slots=True)
+class CannedReply:
+    """What the fake model answers: prose, tool calls as ``(name, arguments)``, or both."""
+
+    content: str = "Sure thing."
+    tool_calls: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ModelProfile:
+    """How one fake model behaves: its first-byte delay, word pacing and failure rate."""
+
+    latency: float = 0.0
+    token_interval: float = 0.0
+    # fraction of requests answered with HTTP 500
+    error_rate: float = 0.0
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # clients hanging up mid-stream (barge-in, cancelled or hedged requests) are expected
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class FakeOpenAIServer:
+    """Threaded HTTP server that mimics the OpenAI endpoints JARVIS calls.
+
+    ``reply`` receives the decoded request body and returns a
+    :class:`CannedReply`. ``latency`` is slept before the first byte;
+    streamed replies additionally sleep ``token_interval`` between words.
+    ``transcript`` is a fixed string or a callable invoked per transcription
+    request, and ``transcription_latency`` overrides ``latency`` for those.
+    ``upload_bytes_per_second`` makes transcription uploads take as long as
+    they would over an uplink of that speed, so payload size shows up in the
+    round trip. ``max_concurrent`` caps how many chat requests are served at once, the
+    way an upstream rate limit would; the rest wait their turn. ``models``
+    maps a requested model name to a :class:`ModelProfile` that replaces
+    ``latency`` and ``token_interval`` for it; it may be changed while the
+    server runs to simulate a model slowing down or failing.
+    """
+
+    def __init__(
+        self,
+        reply: Optional[Callable[[Dict[str, Any]], CannedReply]] = None,
+        *,
+        latency: float = 0.0,
+        token_interval: float = 0.0,
+        transcript: Union[str, Callable[[], str]] = "turn on the desk lamp",
+        transcription_latency: Optional[float] = None,
+        upload_bytes_per_second: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        models: Optional[Dict[str, ModelProfile]] = None,
+    ) -> None:
+        self.reply = reply or (lambda request: CannedReply())
+        self.latency = latency
+        self.token_interval = token_interval
+        self.transcript = transcript
+        self.transcription_latency = transcription_latency
+        self.upload_bytes_per_second = upload_bytes_per_second
+        self.models: Dict[str, ModelProfile] = dict(models or {})
+        self.requests: List[Dict[str, Any]] = []
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self._lock = threading.Lock()
+        self._server = _QuietHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    # ------------------------------------------------------------------
+    def _record(self, body: Dict[str, Any]) -> None:
+        with self._lock:
+            self.requests.append(body)
+
+    def _handler_class(self) -> type:
+        fake = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self._json({"object": "list", "data": [{"id": "fake", "object": "model"}]})
+
+            def do_POST(self) -> None:
+                raw = self.rfile.read(int(self.headers.get("content-length", 0)))
+                if self.path.endswith("/audio/transcriptions"):
+                    latency = fake.transcription_latency
+                    if fake.upload_bytes_per_second:
+                        time.sleep(len(raw) / fake.upload_bytes_per_second)
+                    time.sleep(fake.latency if latency is None else latency)
+                    fake._record({"path": self.path, "bytes": len(raw)})
+                    transcript = fake.transcript
+                    self._json({"text": transcript() if callable(transcript) else transcript})
+                    return
+                if fake._slots is None:
+                    self._chat(raw)
+                    return
+                with fake._slots:
+                    self._chat(raw)
+
+            def _chat(self, raw: bytes) -> None:
+                body = json.loads(raw or b"{}")
+                profile = fake.models.get(body.get("model", ""))
+                if profile is None:
+                    profile = ModelProfile(latency=fake.latency, token_interval=fake.token_interval)
+                fake._record(body)
+                time.sleep(profile.latency)
+                if profile.error_rate and random.random() < profile.error_rate:
+                    self._json({"error": {"message": "The fake model failed."}}, status=500)
+                    return
+                canned = fake.reply(body)
+                if body.get("stream"):
+                    self._stream(body, canned, profile.token_interval)
+                else:
+                    self._json(_completion(body, canned))
+
+            def _json(self, payload: Dict[str, Any], status: int = 200) -> None:
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(
+                self, body: Dict[str, Any], canned: CannedReply, token_interval: float
+            ) -> None:
+                self.send_response(200)
+                self.send_header("content-type", "text/event-stream")
+                self.send_header("transfer-encoding", "chunked")
+                self.end_headers()
+                words = canned.content.split(" ")
+                for index, word in enumerate(words):
+                    if index:
+                        time.sleep(token_interval)
+                    delta = word if index == 0 else " " + word
+                    self._chunk(_stream_chunk(body, {"content": delta}))
+                self._chunk(_stream_chunk(body, {}, finish_reason="stop"))
+                self._write(b"data: [DONE]\n\n")
+                self._write(b"")
+
+            def _chunk(self, payload: Dict[str, Any]) -> None:
+                self._write(f"data: {json.dumps(payload)}\n\n".encode())
+
+            def _write(self, data: bytes) -> None:
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+        return _Handler
+
+
+def _completion(body: Dict[str, Any], canned: CannedReply) -> Dict[str, Any]:
+    message: Dict[str, Any] = {"role": "assistant", "content": canned.content or None}
+    if canned.tool_calls:
+        message["tool_calls"] = [
+            {
+                "id": f"call_{index}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(arguments)},
+            }
+            for index, (name, arguments) in enumerate(canned.tool_calls)
+        ]
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "fake"),
+        "choices": [
+            {
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if canned.tool_calls else "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def _stream_chunk(
+    body: Dict[str, Any], delta: Dict[str, Any], *, finish_reason: Optional[str] = None
+) -> Dict[str, Any]:
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": body.get("model", "fake"),
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
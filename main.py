@@ -9,20 +9,7 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from jarvis.config import load_settings
-from jarvis.core.assistant import JarvisAssistant
-
-
-def main() -> int:
-    try:
-        settings = load_settings()
-    except Exception as exc:
-        print(f"Failed to load configuration: {exc}")
-        return 1
-
-    assistant = JarvisAssistant(settings)
-    assistant.run()
-    return 0
+from jarvis.__main__ import main
 
 
 if __name__ == "__main__":
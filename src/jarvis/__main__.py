@@ -1,20 +1,110 @@
 """Allow running ``python -m jarvis`` to start the assistant."""
 from __future__ import annotations
 
+import argparse
+from pathlib import Path
+from typing import Optional, Sequence
+
 from jarvis.core.assistant import JarvisAssistant
-from jarvis.config import load_settings
+from jarvis.core.batch import BatchRunner
+from jarvis.config import Settings, load_settings
+
 
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="jarvis", description="Run the JARVIS assistant.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--serve",
+        action="store_true",
+        help="answer many clients over HTTP and Socket.IO instead of the microphone",
+    )
+    mode.add_argument(
+        "--batch",
+        type=Path,
+        metavar="INPUT",
+        help="answer every utterance in a .jsonl or .csv file and exit",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="JSONL results for --batch (default: INPUT with a .results.jsonl suffix)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="utterances answered at once in --batch"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="continue a --batch run from its output file"
+    )
+    args = parser.parse_args(argv)
 
-def main() -> int:
     try:
         settings = load_settings()
     except Exception as exc:
         print(f"Failed to load configuration: {exc}")
         return 1
 
+    if args.serve:
+        return _serve(settings)
+    if args.batch is not None:
+        output = args.output or args.batch.with_suffix(".results.jsonl")
+        return _batch(settings, args.batch, output, args.concurrency, args.resume)
     JarvisAssistant(settings).run()
     return 0
 
 
+def _headless(settings: Settings) -> None:
+    # replies go back over the network or into a file, so nothing is captured or spoken
+    settings.speech_input.enable_microphone = False
+    settings.speech_output.engine = "text"
+
+
+def _serve(settings: Settings) -> int:
+    from jarvis.server import JarvisServer
+
+    _headless(settings)
+    assistant = JarvisAssistant(settings)
+    try:
+        server = JarvisServer(assistant, settings.server)
+    except (OSError, RuntimeError) as exc:
+        print(f"Failed to start the server: {exc}")
+        assistant.close()
+        return 1
+
+    try:
+        server.serve_forever()
+    finally:
+        server.close()
+        assistant.close()
+    return 0
+
+
+def _batch(settings: Settings, source: Path, output: Path, concurrency: int, resume: bool) -> int:
+    if not source.exists():
+        print(f"No such input file: {source}")
+        return 1
+    _headless(settings)
+    # every concurrent utterance may hold an OpenAI connection
+    transport = settings.openai.transport
+    transport.max_connections = max(transport.max_connections, concurrency)
+    transport.max_keepalive_connections = max(transport.max_keepalive_connections, concurrency)
+    assistant = JarvisAssistant(settings)
+    try:
+        report = BatchRunner(assistant, concurrency=concurrency).run(
+            source, output, resume=resume
+        )
+    except (OSError, RuntimeError) as exc:
+        print(f"Batch run failed: {exc}")
+        return 1
+    finally:
+        assistant.close()
+
+    print(
+        f"Answered {report.answered}, failed {report.failed}"
+        f"{f', resumed after {report.resumed}' if report.resumed else ''} "
+        f"in {report.seconds:.1f} s ({report.turns_per_second:.1f}/s) -> {output}"
+    )
+    return 0 if report.failed == 0 else 2
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -1,7 +1,7 @@
 """Project-wide configuration management for the JARVIS assistant."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +10,65 @@ from dotenv import load_dotenv
 import os
 
 
+@dataclass(slots=True)
+class ResponseCacheConfig:
+    """Cache ChatGPT fallback answers in memory and, optionally, on disk."""
+
+    enabled: bool = True
+    path: Optional[Path] = None
+    ttl_seconds: float = 24 * 3600
+    max_memory_entries: int = 256
+    max_disk_bytes: int = 8 * 1024 * 1024
+    # Opt-in: requests with conversation history are cached only when this is above
+    # 0, keyed on the prompt plus the last ``history_turns`` exchanges. A question
+    # can then hit again later in a session, at the risk of reusing an answer that
+    # leaned on older context.
+    history_turns: int = 0
+    # Opt-in: replies sampled above this temperature are expected to vary and are
+    # not cached, so by default only deterministic (temperature 0) requests are.
+    max_temperature: float = 0.0
+
+
+@dataclass(slots=True)
+class TransportConfig:
+    """HTTP connection pooling, deadlines, retries and circuit breaking for OpenAI."""
+
+    base_url: Optional[str] = None
+    request_timeout: float = 30.0
+    connect_timeout: float = 5.0
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry_seconds: float = 120.0
+    max_retries: int = 2
+    backoff_base_seconds: float = 0.25
+    backoff_max_seconds: float = 4.0
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: float = 30.0
+    warm_up: bool = True
+    canned_response: str = (
+        "I'm having trouble reaching my language model right now. Please try again shortly."
+    )
+
+
+@dataclass(slots=True)
+class ModelRoutingConfig:
+    """Pick the chat model and token budget per request from complexity and live latency."""
+
+    enabled: bool = False
+    # chit-chat goes to ``fast_model`` and involved questions to ``smart_model``;
+    # either defaults to ``OpenAIConfig.model``
+    fast_model: Optional[str] = None
+    smart_model: Optional[str] = None
+    fast_max_tokens: int = 150
+    complexity_threshold: float = 0.45
+    # a reply (the first token, when streaming) should arrive within this budget
+    deadline_seconds: float = 3.0
+    # ask the other model too once this fraction of the deadline has passed
+    hedge_after: float = 0.6
+    # avoid a model whose recent error rate is above this
+    max_error_rate: float = 0.5
+
+
 @dataclass(slots=True)
 class OpenAIConfig:
     """Runtime configuration for OpenAI-powered intelligence."""
@@ -18,6 +77,12 @@ class OpenAIConfig:
     model: str = "gpt-4o-mini"
     temperature: float = 0.3
     response_max_tokens: int = 500
+    stream_responses: bool = True
+    # start the streamed chat request while skills are still matching the utterance
+    speculative_chat: bool = False
+    cache: ResponseCacheConfig = field(default_factory=ResponseCacheConfig)
+    transport: TransportConfig = field(default_factory=TransportConfig)
+    routing: ModelRoutingConfig = field(default_factory=ModelRoutingConfig)
 
 
 @dataclass(slots=True)
@@ -29,6 +94,22 @@ class SpeechInputConfig:
     device_index: Optional[int] = None
     phrase_time_limit: Optional[int] = None
     energy_threshold: Optional[int] = None
+    # Keep one microphone stream open and cut utterances out of it.
+    persistent_stream: bool = True
+    calibration_seconds: float = 1.0
+    pre_roll_seconds: float = 0.3
+    pause_seconds: float = 0.8
+    # Whisper uploads: "flac", "opus" (needs ffmpeg) or "wav".
+    whisper_upload_format: str = "flac"
+    trim_silence: bool = True
+    # NumPy voice activity detection for endpointing (ignored without numpy).
+    vad_enabled: bool = True
+    vad_hangover_ms: int = 200
+    # Comma-separated STT backends (google, whisper, sphinx); empty derives it
+    # from use_whisper_api. Strategy is "single", "race" or "hedge".
+    stt_backends: str = ""
+    stt_strategy: str = "single"
+    stt_hedge_percentile: float = 0.9
 
 
 @dataclass(slots=True)
@@ -40,6 +121,8 @@ class SpeechOutputConfig:
     volume: Optional[float] = None
     voice_id: Optional[str] = None
     elevenlabs_api_key: Optional[str] = None
+    phrase_cache_dir: Optional[Path] = None
+    phrase_cache_max_bytes: int = 64 * 1024 * 1024
 
 
 @dataclass(slots=True)
@@ -48,6 +131,7 @@ class HardwareConfig:
 
     enable_gpio: bool = False
     gpio_board_mode: Optional[str] = None
+    executor_workers: int = 4
 
 
 @dataclass(slots=True)
@@ -59,6 +143,73 @@ class DashboardConfig:
     port: int = 5050
 
 
+@dataclass(slots=True)
+class PipelineConfig:
+    """Asyncio turn pipeline that overlaps listening, thinking, and speaking."""
+
+    enabled: bool = False
+    queue_size: int = 2
+    barge_in: bool = True
+
+
+@dataclass(slots=True)
+class MemoryConfig:
+    """Conversation history sent with ChatGPT requests, bounded by a token budget."""
+
+    enabled: bool = True
+    max_tokens: int = 1500
+    max_turns: int = 50
+    summary_max_tokens: int = 300
+
+
+@dataclass(slots=True)
+class IntentConfig:
+    """Local intent classifier that routes paraphrased commands without ChatGPT."""
+
+    enabled: bool = True
+    threshold: float = 0.5
+
+
+@dataclass(slots=True)
+class ToolCallingConfig:
+    """Let ChatGPT plan compound commands as several skill and hardware tool calls."""
+
+    enabled: bool = True
+    max_workers: int = 4
+
+
+@dataclass(slots=True)
+class StartupConfig:
+    """Parallel backend initialization and the startup time profile."""
+
+    workers: int = 4
+    profile: bool = False
+    # warn when every backend is not ready within this many milliseconds
+    budget_ms: Optional[float] = None
+
+
+@dataclass(slots=True)
+class TelemetryConfig:
+    """Per-turn tracing and how many recent turn traces to keep."""
+
+    tracing: bool = True
+    keep_turns: int = 50
+
+
+@dataclass(slots=True)
+class ServerConfig:
+    """Multi-session HTTP and Socket.IO server started with ``python -m jarvis --serve``."""
+
+    host: str = "127.0.0.1"
+    port: int = 8080
+    # turns answered at once across every session
+    workers: int = 8
+    max_sessions: int = 256
+    # turns a session may have waiting behind its running one
+    session_queue: int = 4
+    session_idle_seconds: float = 1800.0
+
+
 @dataclass(slots=True)
 class Settings:
     """Top-level configuration container for the assistant."""
@@ -69,6 +220,13 @@ class Settings:
     speech_output: SpeechOutputConfig
     hardware: HardwareConfig
     dashboard: DashboardConfig
+    pipeline: PipelineConfig = field(default_factory=PipelineConfig)
+    memory: MemoryConfig = field(default_factory=MemoryConfig)
+    intents: IntentConfig = field(default_factory=IntentConfig)
+    tools: ToolCallingConfig = field(default_factory=ToolCallingConfig)
+    startup: StartupConfig = field(default_factory=StartupConfig)
+    telemetry: TelemetryConfig = field(default_factory=TelemetryConfig)
+    server: ServerConfig = field(default_factory=ServerConfig)
 
 
 def load_settings(env_file: Optional[Path] = None) -> Settings:
@@ -95,6 +253,46 @@ def load_settings(env_file: Optional[Path] = None) -> Settings:
             model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
             temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.3")),
             response_max_tokens=int(os.getenv("OPENAI_RESPONSE_MAX_TOKENS", "500")),
+            stream_responses=os.getenv("OPENAI_STREAM_RESPONSES", "true").lower()
+            == "true",
+            speculative_chat=os.getenv("OPENAI_SPECULATIVE_CHAT", "false").lower() == "true",
+            cache=ResponseCacheConfig(
+                enabled=os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true",
+                path=_parse_optional_path(
+                    os.getenv(
+                        "RESPONSE_CACHE_PATH",
+                        str(Path.cwd() / ".jarvis" / "response_cache.sqlite3"),
+                    )
+                ),
+                ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", str(24 * 3600))),
+                max_memory_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256")),
+                max_disk_bytes=int(
+                    os.getenv("RESPONSE_CACHE_MAX_BYTES", str(8 * 1024 * 1024))
+                ),
+                history_turns=int(os.getenv("RESPONSE_CACHE_HISTORY_TURNS", "0")),
+                max_temperature=float(os.getenv("RESPONSE_CACHE_MAX_TEMPERATURE", "0")),
+            ),
+            transport=TransportConfig(
+                base_url=os.getenv("OPENAI_BASE_URL") or None,
+                request_timeout=float(os.getenv("OPENAI_TIMEOUT_SECONDS", "30")),
+                connect_timeout=float(os.getenv("OPENAI_CONNECT_TIMEOUT_SECONDS", "5")),
+                max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "10")),
+                max_keepalive_connections=int(os.getenv("OPENAI_MAX_KEEPALIVE", "5")),
+                max_retries=int(os.getenv("OPENAI_MAX_RETRIES", "2")),
+                breaker_failure_threshold=int(os.getenv("OPENAI_BREAKER_THRESHOLD", "5")),
+                breaker_reset_seconds=float(os.getenv("OPENAI_BREAKER_RESET_SECONDS", "30")),
+                warm_up=os.getenv("OPENAI_WARM_UP", "true").lower() == "true",
+            ),
+            routing=ModelRoutingConfig(
+                enabled=os.getenv("MODEL_ROUTING_ENABLED", "false").lower() == "true",
+                fast_model=os.getenv("OPENAI_FAST_MODEL") or None,
+                smart_model=os.getenv("OPENAI_SMART_MODEL") or None,
+                fast_max_tokens=int(os.getenv("OPENAI_FAST_MAX_TOKENS", "150")),
+                complexity_threshold=float(os.getenv("MODEL_ROUTING_THRESHOLD", "0.45")),
+                deadline_seconds=float(os.getenv("MODEL_ROUTING_DEADLINE_SECONDS", "3.0")),
+                hedge_after=float(os.getenv("MODEL_ROUTING_HEDGE_AFTER", "0.6")),
+                max_error_rate=float(os.getenv("MODEL_ROUTING_MAX_ERROR_RATE", "0.5")),
+            ),
         ),
         speech_input=SpeechInputConfig(
             enable_microphone=os.getenv("ENABLE_MICROPHONE", "true").lower()
@@ -103,6 +301,17 @@ def load_settings(env_file: Optional[Path] = None) -> Settings:
             device_index=_parse_optional_int(os.getenv("MIC_DEVICE_INDEX")),
             phrase_time_limit=_parse_optional_int(os.getenv("PHRASE_TIME_LIMIT")),
             energy_threshold=_parse_optional_int(os.getenv("ENERGY_THRESHOLD")),
+            persistent_stream=os.getenv("MIC_PERSISTENT_STREAM", "true").lower() == "true",
+            calibration_seconds=float(os.getenv("MIC_CALIBRATION_SECONDS", "1.0")),
+            pre_roll_seconds=float(os.getenv("MIC_PRE_ROLL_SECONDS", "0.3")),
+            pause_seconds=float(os.getenv("MIC_PAUSE_SECONDS", "0.8")),
+            whisper_upload_format=os.getenv("WHISPER_UPLOAD_FORMAT", "flac"),
+            trim_silence=os.getenv("TRIM_SILENCE", "true").lower() == "true",
+            vad_enabled=os.getenv("VAD_ENABLED", "true").lower() == "true",
+            vad_hangover_ms=int(os.getenv("VAD_HANGOVER_MS", "200")),
+            stt_backends=os.getenv("STT_BACKENDS", ""),
+            stt_strategy=os.getenv("STT_STRATEGY", "single").lower(),
+            stt_hedge_percentile=float(os.getenv("STT_HEDGE_PERCENTILE", "0.9")),
         ),
         speech_output=SpeechOutputConfig(
             engine=os.getenv("VOICE_ENGINE", "pyttsx3"),
@@ -110,16 +319,59 @@ def load_settings(env_file: Optional[Path] = None) -> Settings:
             volume=_parse_optional_float(os.getenv("VOICE_VOLUME")),
             voice_id=os.getenv("VOICE_ID"),
             elevenlabs_api_key=eleven_key,
+            phrase_cache_dir=_parse_optional_path(
+                os.getenv("PHRASE_CACHE_DIR", str(Path.cwd() / ".jarvis" / "phrases"))
+            ),
+            phrase_cache_max_bytes=int(
+                os.getenv("PHRASE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+            ),
         ),
         hardware=HardwareConfig(
             enable_gpio=os.getenv("ENABLE_GPIO", "false").lower() == "true",
             gpio_board_mode=os.getenv("GPIO_BOARD_MODE"),
+            executor_workers=int(os.getenv("HARDWARE_WORKERS", "4")),
         ),
         dashboard=DashboardConfig(
             enabled=os.getenv("DASHBOARD_ENABLED", "false").lower() == "true",
             host=os.getenv("DASHBOARD_HOST", "127.0.0.1"),
             port=int(os.getenv("DASHBOARD_PORT", "5050")),
         ),
+        pipeline=PipelineConfig(
+            enabled=os.getenv("ASYNC_PIPELINE", "false").lower() == "true",
+            queue_size=int(os.getenv("PIPELINE_QUEUE_SIZE", "2")),
+            barge_in=os.getenv("BARGE_IN", "true").lower() == "true",
+        ),
+        memory=MemoryConfig(
+            enabled=os.getenv("MEMORY_ENABLED", "true").lower() == "true",
+            max_tokens=int(os.getenv("MEMORY_MAX_TOKENS", "1500")),
+            max_turns=int(os.getenv("MEMORY_MAX_TURNS", "50")),
+            summary_max_tokens=int(os.getenv("MEMORY_SUMMARY_MAX_TOKENS", "300")),
+        ),
+        intents=IntentConfig(
+            enabled=os.getenv("INTENT_CLASSIFIER_ENABLED", "true").lower() == "true",
+            threshold=float(os.getenv("INTENT_THRESHOLD", "0.5")),
+        ),
+        tools=ToolCallingConfig(
+            enabled=os.getenv("TOOL_CALLING_ENABLED", "true").lower() == "true",
+            max_workers=int(os.getenv("TOOL_MAX_WORKERS", "4")),
+        ),
+        startup=StartupConfig(
+            workers=int(os.getenv("STARTUP_WORKERS", "4")),
+            profile=os.getenv("STARTUP_PROFILE", "false").lower() == "true",
+            budget_ms=_parse_optional_float(os.getenv("STARTUP_BUDGET_MS")),
+        ),
+        telemetry=TelemetryConfig(
+            tracing=os.getenv("TRACING_ENABLED", "true").lower() == "true",
+            keep_turns=int(os.getenv("TRACE_KEEP_TURNS", "50")),
+        ),
+        server=ServerConfig(
+            host=os.getenv("SERVER_HOST", "127.0.0.1"),
+            port=int(os.getenv("SERVER_PORT", "8080")),
+            workers=int(os.getenv("SERVER_WORKERS", "8")),
+            max_sessions=int(os.getenv("SERVER_MAX_SESSIONS", "256")),
+            session_queue=int(os.getenv("SERVER_SESSION_QUEUE", "4")),
+            session_idle_seconds=float(os.getenv("SERVER_SESSION_IDLE_SECONDS", "1800")),
+        ),
     )
 
 
@@ -139,3 +391,9 @@ def _parse_optional_float(raw: Optional[str]) -> Optional[float]:
         return float(raw)
     except ValueError as exc:
         raise RuntimeError(f"Expected float but received '{raw}'.") from exc
+
+
+def _parse_optional_path(raw: Optional[str]) -> Optional[Path]:
+    if raw in (None, ""):
+        return None
+    return Path(raw).expanduser()
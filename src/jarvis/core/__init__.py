@@ -1,5 +1,22 @@
 """Core assistant orchestration components."""
 
-from jarvis.core.assistant import JarvisAssistant
+from jarvis.core.assistant import JarvisAssistant, TurnResult
+from jarvis.core.batch import BatchReport, BatchRunner, read_utterances
+from jarvis.core.memory import ConversationMemory
+from jarvis.core.pipeline import PrefetchedStream, Reply, TurnPipeline
+from jarvis.core.speculation import Speculation, SpeculationStats, Speculator
 
-__all__ = ["JarvisAssistant"]
+__all__ = [
+    "BatchReport",
+    "BatchRunner",
+    "ConversationMemory",
+    "JarvisAssistant",
+    "PrefetchedStream",
+    "Reply",
+    "Speculation",
+    "SpeculationStats",
+    "Speculator",
+    "TurnPipeline",
+    "TurnResult",
+    "read_utterances",
+]
@@ -1,108 +1,868 @@
 """Primary event loop that powers the JARVIS assistant experience."""
 from __future__ import annotations
 
-from typing import List
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
 
 from jarvis.config import Settings
+from jarvis.core.memory import ConversationMemory, estimate_tokens
+from jarvis.core.pipeline import PrefetchedStream, Reply, TurnPipeline
+from jarvis.core.speculation import Speculation, SpeculationStats, Speculator
+from jarvis.dashboard.server import DashboardServer
 from jarvis.hardware.controller import HardwareController
 from jarvis.integrations.openai_client import OpenAIClient
+from jarvis.integrations.transport import OPEN
 from jarvis.io.voice_listener import VoiceListener
 from jarvis.io.voice_responder import VoiceResponder
-from jarvis.skills.base import SkillContext
+from jarvis.skills.base import Skill, SkillContext
 from jarvis.skills.lighting import LightingSkill
+from jarvis.skills.matcher import normalize_utterance
 from jarvis.skills.registry import SkillRegistry
 from jarvis.skills.system_control import SystemControlSkill
+from jarvis.skills.tools import ToolBox
+from jarvis.telemetry.events import get_event_bus
+from jarvis.telemetry.exporter import MetricsServer
+from jarvis.telemetry.metrics import Sample, get_registry
+from jarvis.telemetry.tracing import TurnTrace, configure_tracing
 from jarvis.utils.logger import configure_logging, get_logger
+from jarvis.utils.startup import StartupProfiler, StartupReport
+
+T = TypeVar("T")
 
 _EXIT_KEYWORDS: List[str] = ["quit", "exit", "shutdown", "stop listening"]
+# backends the assistant cannot run without; the rest degrade when they fail to start
+_ESSENTIAL_BACKENDS = ("voice_input", "voice_output", "skills")
+_CAPTURE_ERROR_REPLY = "I could not hear you. Please try again."
+_OPENAI_ERROR_REPLY = "I ran into an issue reaching OpenAI."
 _SYSTEM_PROMPT = (
     "You are JARVIS, an affable AI assistant that controls software and hardware at the "
     "user's desk. Keep answers short and take actions when skills are available."
 )
+_TOOL_PROMPT = (
+    " When the user asks for several actions, call every tool needed in this one reply."
+)
+# words that join several commands into one utterance
+_CONJUNCTIONS = frozenset({"and", "then", "also", "plus"})
+_TRANSPORT_COUNTERS = (
+    "requests",
+    "attempts",
+    "retries",
+    "failures",
+    "short_circuits",
+    "connections_opened",
+    "tls_handshakes",
+)
+_ROUTER_COUNTERS = (
+    ("chosen", "Chat requests routed to each model."),
+    ("requests", "Chat calls made to each model."),
+    ("errors", "Failed chat calls per model."),
+    ("hedged", "Slow or failed calls that were backed up by the other model."),
+    ("rescues", "Backup answers that were used instead of the original model's."),
+)
+
+
+@dataclass(slots=True)
+class TurnResult:
+    """A complete reply produced without speaking it, with its timings.
+
+    ``first_reply_seconds`` is how long the first piece of reply text took;
+    ``stages`` sums the traced time per stage (see :mod:`jarvis.telemetry`).
+    ``error`` is set when the model failed and ``reply`` is an apology.
+    """
+
+    text: str
+    reply: str
+    route: Optional[str]
+    skill: Optional[str]
+    final: bool
+    first_reply_seconds: Optional[float]
+    seconds: float
+    stages: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
 
 class JarvisAssistant:
     """Coordinates audio IO, intelligent responses, and skill routing."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        listener: Optional[VoiceListener] = None,
+        responder: Optional[VoiceResponder] = None,
+        hardware: Optional[HardwareController] = None,
+    ) -> None:
+        """Build the assistant from ``settings``.
+
+        ``listener``, ``responder`` and ``hardware`` replace the backends that
+        would otherwise be created, for example with stand-ins in benchmarks.
+        """
+
         configure_logging()
         self._log = get_logger("jarvis.assistant")
 
         self._settings = settings
-        self._openai = OpenAIClient(settings.openai)
-        self._hardware = HardwareController(settings.hardware)
-        self._listener = VoiceListener(
-            settings.speech_input,
-            openai_client=self._openai if settings.speech_input.use_whisper_api else None,
-            fallback_to_text=True,
+        self._tracer = configure_tracing(
+            enabled=settings.telemetry.tracing, keep_turns=settings.telemetry.keep_turns
+        )
+        self._events = get_event_bus()
+        startup = settings.startup
+        self._startup = StartupProfiler(
+            max_workers=startup.workers,
+            budget_seconds=None if startup.budget_ms is None else startup.budget_ms / 1000,
         )
-        self._responder = VoiceResponder(settings.speech_output)
+        # the SDK itself loads lazily, so the client is cheap to build inline
+        self._openai = self._startup.run("openai", lambda: OpenAIClient(settings.openai))
+        self._speculator = Speculator()
+        self._memory: Optional[ConversationMemory] = None
+        if settings.memory.enabled:
+            self._memory = self._startup.run("memory", self.new_memory)
+
+        skills: List[Skill] = [SystemControlSkill(), LightingSkill(device_name="desk_lamp")]
+        # independent backends start together; each is awaited on first use, and
+        # optional ones that fail to start are replaced by a degraded stand-in
+        self._backends: Dict[str, Future] = {
+            "voice_input": self._backend(
+                "voice_input",
+                listener,
+                lambda: VoiceListener(
+                    settings.speech_input,
+                    openai_client=self._openai,
+                    fallback_to_text=True,
+                ),
+            ),
+            "voice_output": self._backend(
+                "voice_output", responder, lambda: VoiceResponder(settings.speech_output)
+            ),
+            "hardware": self._backend(
+                "hardware",
+                hardware,
+                self._degradable(
+                    "hardware",
+                    self._build_hardware,
+                    fallback=lambda: HardwareController(settings.hardware),
+                    degraded="continuing without devices",
+                ),
+            ),
+            "skills": self._startup.submit(
+                "skills",
+                self._degradable(
+                    "skills",
+                    lambda: self._build_skill_registry(skills),
+                    fallback=lambda: self._build_skill_registry(skills, intents=False),
+                    degraded="matching trigger phrases only",
+                ),
+            ),
+        }
+        if settings.tools.enabled:
+            self._backends["tools"] = self._startup.submit(
+                "tools",
+                self._degradable(
+                    "tools",
+                    lambda: ToolBox(skills, max_workers=settings.tools.max_workers),
+                    fallback=lambda: None,
+                    degraded="compound commands go to a single skill",
+                ),
+            )
+        self._skill_context: Optional[SkillContext] = None
+        get_registry().register_collector(self._collect_metrics)
+        if settings.dashboard.enabled:
+            self._backends["dashboard"] = self._startup.submit(
+                "dashboard",
+                self._degradable(
+                    "dashboard",
+                    self._serve_dashboard,
+                    fallback=lambda: None,
+                    degraded="continuing without the dashboard",
+                ),
+            )
 
         if not settings.speech_input.enable_microphone:
             self._log.info("Microphone disabled; using terminal text input mode.")
-
-        self._register_default_hardware()
-        self._skills = self._build_skill_registry()
-        self._context = SkillContext(hardware=self._hardware)
+        threading.Thread(
+            target=self._prewarm_phrases, name="jarvis-prewarm", daemon=True
+        ).start()
 
     def run(self) -> None:
+        # only the listener has to exist to prompt; the rest keeps loading meanwhile
+        self._backends["voice_input"].result()
+        self._startup.mark_ready()
+        threading.Thread(
+            target=self._report_startup, name="jarvis-startup-report", daemon=True
+        ).start()
+        if self._settings.pipeline.enabled:
+            self._run_pipelined()
+            return
+
         self._log.info("Jarvis assistant is alive. Say something!")
         while True:
-            try:
-                user_text = self._listener.listen(prompt="You> ")
-            except KeyboardInterrupt:
-                self._log.info("Interrupted by user. Shutting down.")
+            trace = self._tracer.begin_turn()
+            with self._tracer.activate(trace):
+                try:
+                    audio = self._listener.capture(prompt="You> ")
+                    started_at = time.perf_counter()
+                    if trace is not None:
+                        trace.started_at = started_at  # the turn is timed from the end of speech
+                    user_text = self._listener.transcribe(audio)
+                except KeyboardInterrupt:
+                    self._log.info("Interrupted by user. Shutting down.")
+                    break
+                except Exception as exc:
+                    self._log.exception("Failed to capture audio: %s", exc)
+                    if self._started("voice_output", wait=True):
+                        self._responder.speak(_CAPTURE_ERROR_REPLY)
+                    continue
+
+                try:
+                    self._require_backends()
+                except RuntimeError as exc:
+                    self._log.error("%s Shutting down.", exc)
+                    break
+                reply = self.respond(user_text, started_at=started_at)
+                if reply is None:
+                    continue
+                # keep Jarvis from hearing itself on an always-open microphone
+                self._listener.pause()
+                try:
+                    self._deliver(reply)
+                finally:
+                    self._listener.resume()
+            if reply.final:
                 break
-            except Exception as exc:
-                self._log.exception("Failed to capture audio: %s", exc)
-                self._responder.speak("I could not hear you. Please try again.")
-                continue
+        self.close()
 
-            cleaned = user_text.strip()
-            if not cleaned:
-                continue
+    def startup_report(self) -> StartupReport:
+        """Wait for every backend to finish initializing and return the timings."""
 
-            if cleaned.lower() in _EXIT_KEYWORDS:
-                self._responder.speak("Goodbye!")
-                break
+        return self._startup.wait()
+
+    def speculation_stats(self) -> SpeculationStats:
+        """How often speculative chat requests were used and the tokens the rest wasted."""
+
+        return self._speculator.stats()
+
+    def respond(
+        self,
+        text: str,
+        *,
+        started_at: Optional[float] = None,
+        memory: Optional[ConversationMemory] = None,
+    ) -> Optional[Reply]:
+        """Route one utterance to a skill or ChatGPT and return what to say.
+
+        The reply belongs to the current turn trace, or to a new one when
+        called outside a turn. ``memory`` is the conversation to continue and
+        defaults to the assistant's own.
+        """
+
+        if started_at is None:
+            started_at = time.perf_counter()
+        cleaned = text.strip()
+        if not cleaned:
+            return None
+
+        trace = self._tracer.current()
+        if trace is None:
+            trace = self._tracer.begin_turn(started_at)
+        self._events.publish("transcript", turn=_turn_id(trace), text=cleaned)
+        if memory is None:
+            memory = self._memory
+        with self._tracer.activate(trace):
+            reply = self._route(cleaned, memory)
+        reply.started_at = started_at
+        reply.trace = trace
+        if reply.text:
+            self._events.publish(
+                "reply", turn=_turn_id(trace), route=reply.route, text=reply.text
+            )
+        return reply
 
-            handled = self._try_handle_with_skills(cleaned)
-            if handled:
-                continue
+    def answer(
+        self,
+        text: str,
+        *,
+        started_at: Optional[float] = None,
+        memory: Optional[ConversationMemory] = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> Optional[TurnResult]:
+        """Respond to ``text`` without speaking and return the complete reply.
 
-            self._fallback_to_chatgpt(cleaned)
+        This is the entry point for callers other than :meth:`run`, such as
+        the multi-session server and batch mode. Streamed replies are
+        collected, each chunk is passed to ``on_chunk`` as it arrives, and the
+        turn is closed.
+        """
+
+        if started_at is None:
+            started_at = time.perf_counter()
+        reply = self.respond(text, started_at=started_at, memory=memory)
+        if reply is None:
+            return None
+        first_reply: Optional[float] = None
+        parts: List[str] = []
+        error = reply.error
+        try:
+            for chunk in [reply.text] if reply.chunks is None else reply.chunks:
+                if not chunk:
+                    continue
+                if first_reply is None:
+                    first_reply = time.perf_counter() - started_at
+                parts.append(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+        except Exception as exc:
+            self._log.exception("OpenAI request failed: %s", exc)
+            error = str(exc)
+            if not parts:
+                parts.append(_OPENAI_ERROR_REPLY)
+                if on_chunk is not None:
+                    on_chunk(_OPENAI_ERROR_REPLY)
+        self._end_turn(reply, first_audio=None)
+        return TurnResult(
+            text=text.strip(),
+            reply="".join(parts),
+            route=reply.route,
+            skill=reply.skill,
+            final=reply.final,
+            first_reply_seconds=first_reply,
+            seconds=time.perf_counter() - started_at,
+            stages=reply.trace.stage_seconds() if reply.trace is not None else {},
+            error=error,
+        )
+
+    def transcribe(self, audio: bytes, *, filename: str = "audio.wav") -> str:
+        """Transcribe an uploaded recording with Whisper over the shared connection pool."""
+
+        with self._tracer.span("stt"):
+            return self._openai.transcribe_audio(audio, filename=filename)
+
+    def new_memory(self) -> Optional[ConversationMemory]:
+        """Return an empty conversation memory, or ``None`` when memory is disabled."""
+
+        config = self._settings.memory
+        if not config.enabled:
+            return None
+        return ConversationMemory(
+            max_tokens=config.max_tokens,
+            max_turns=config.max_turns,
+            summary_max_tokens=config.summary_max_tokens,
+            model=self._settings.openai.model,
+        )
+
+    def close(self) -> None:
+        """Release the backends; :meth:`run` does this itself before returning."""
+
+        if self._started("voice_input", wait=True):
+            self._listener.close()
+        if self._started("hardware", wait=True):
+            self._hardware.close()
+        self._startup.close()
+        self._openai.close()
+        get_registry().unregister_collector(self._collect_metrics)
+        if self._started("dashboard", wait=True):
+            dashboard = self._backends["dashboard"].result()
+            if dashboard is not None:
+                dashboard.close()
 
     # ------------------------------------------------------------------
-    def _try_handle_with_skills(self, text: str) -> bool:
-        skill_result = self._skills.handle(text, self._context)
-        if not skill_result:
+    @property
+    def _listener(self) -> VoiceListener:
+        return self._backends["voice_input"].result()
+
+    @property
+    def _responder(self) -> VoiceResponder:
+        return self._backends["voice_output"].result()
+
+    @property
+    def _hardware(self) -> HardwareController:
+        return self._backends["hardware"].result()
+
+    @property
+    def _skills(self) -> SkillRegistry:
+        return self._backends["skills"].result()
+
+    @property
+    def _tools(self) -> Optional[ToolBox]:
+        future = self._backends.get("tools")
+        return future.result() if future is not None else None
+
+    @property
+    def _context(self) -> SkillContext:
+        if self._skill_context is None:
+            self._skill_context = SkillContext(hardware=self._hardware)
+        return self._skill_context
+
+    def _backend(self, name: str, provided: Optional[T], factory: Callable[[], T]) -> Future:
+        if provided is None:
+            return self._startup.submit(name, factory)
+        future: Future = Future()
+        future.set_result(provided)
+        return future
+
+    def _degradable(
+        self,
+        name: str,
+        factory: Callable[[], T],
+        *,
+        fallback: Callable[[], Optional[T]],
+        degraded: str,
+    ) -> Callable[[], Optional[T]]:
+        """Wrap ``factory`` so a failure is logged once and ``fallback()`` is used instead.
+
+        The stand-in becomes the backend's result, so later accesses see the
+        degraded backend rather than the original error.
+        """
+
+        def build() -> Optional[T]:
+            try:
+                return factory()
+            except Exception as exc:
+                stand_in = fallback()  # if this fails too, the backend is reported as failed
+                self._log.warning("The %s backend failed to start (%s); %s.", name, exc, degraded)
+                return stand_in
+
+        return build
+
+    def _started(self, name: str, *, wait: bool = False) -> bool:
+        """Whether backend ``name`` exists and came up; only blocks on it with ``wait``."""
+
+        future = self._backends.get(name)
+        if future is None or not (wait or future.done()):
             return False
-        if skill_result.response:
-            self._responder.speak(skill_result.response)
-        return skill_result.handled
+        return future.exception() is None
+
+    def _require_backends(self) -> None:
+        """Wait for the essential backends and raise if one failed to start.
+
+        :meth:`run` calls this before handing a turn to them, so a failure
+        stops the assistant once instead of resurfacing on every access.
+        """
+
+        for name in _ESSENTIAL_BACKENDS:
+            exc = self._backends[name].exception()
+            if exc is not None:
+                raise RuntimeError(
+                    f"The {name.replace('_', ' ')} backend failed to start: {exc}."
+                ) from exc
 
-    def _fallback_to_chatgpt(self, text: str) -> None:
+    def _report_startup(self) -> None:
+        report = self._startup.wait()
+        if self._settings.startup.profile:
+            self._log.info("Startup profile:\n%s", report.format())
+        if report.over_budget:
+            self._log.warning(
+                "Startup took %.0f ms, over the %.0f ms budget.",
+                report.total_seconds * 1000,
+                (report.budget_seconds or 0.0) * 1000,
+            )
+
+    def _run_pipelined(self) -> None:
+        try:
+            self._require_backends()
+        except RuntimeError as exc:
+            self._log.error("%s Shutting down.", exc)
+            self.close()
+            return
+        self._log.info("Jarvis assistant is alive (pipelined mode). Say something!")
+        pipeline = TurnPipeline(
+            self._listener,
+            self._responder,
+            reason=lambda text, started_at: self.respond(text, started_at=started_at),
+            deliver=self._deliver,
+            queue_size=self._settings.pipeline.queue_size,
+            barge_in=self._settings.pipeline.barge_in,
+            capture_error_reply=_CAPTURE_ERROR_REPLY,
+        )
+        try:
+            pipeline.run()
+        except KeyboardInterrupt:
+            self._log.info("Interrupted by user. Shutting down.")
+        finally:
+            self.close()
+
+    def _route(self, text: str, memory: Optional[ConversationMemory]) -> Reply:
+        if text.lower() in _EXIT_KEYWORDS:
+            return Reply(text="Goodbye!", final=True, route="exit")
+
+        speculation = self._speculate(text, memory)
         try:
-            response = self._openai.generate_response(
-                text,
-                system_prompt=_SYSTEM_PROMPT,
+            reply = self._claim(text, memory)
+        except BaseException:
+            if speculation is not None:
+                speculation.cancel()
+            raise
+        if reply is None:
+            return self._fallback_to_chatgpt(text, memory, speculation)
+        if speculation is not None:
+            speculation.cancel()
+        return reply
+
+    def _claim(self, text: str, memory: Optional[ConversationMemory]) -> Optional[Reply]:
+        """Answer with tools or a skill, or return ``None`` to leave the turn to ChatGPT."""
+
+        reply = None
+        if self._tools is not None and self._is_compound(text):
+            reply = self._plan_with_tools(text, memory)
+        if reply is None:
+            reply = self._try_handle_with_skills(text)
+        return reply
+
+    def _speculate(self, text: str, memory: Optional[ConversationMemory]) -> Optional[Speculation]:
+        """Start the chat stream now, unless a skill trigger already matches ``text``."""
+
+        openai = self._settings.openai
+        if not (openai.speculative_chat and openai.stream_responses):
+            return None
+        if self._skills.candidates(text):
+            return None  # almost certainly a command; not worth the tokens
+        history = memory.messages() if memory is not None else None
+        chunks = self._openai.stream_response(
+            text, system_prompt=_SYSTEM_PROMPT, conversation_history=history
+        )
+        prompt_tokens = estimate_tokens(_SYSTEM_PROMPT) + estimate_tokens(text)
+        if memory is not None:
+            prompt_tokens += memory.tokens
+        return self._speculator.start(chunks, prompt_tokens=prompt_tokens)
+
+    def _try_handle_with_skills(self, text: str) -> Optional[Reply]:
+        with self._tracer.span("skill_match"):
+            skill_result = self._skills.handle(text, self._context)
+        if not skill_result or not skill_result.handled:
+            return None
+        return Reply(text=skill_result.response, route="skill", skill=skill_result.skill)
+
+    def _is_compound(self, text: str) -> bool:
+        if not _CONJUNCTIONS.intersection(normalize_utterance(text)):
+            return False
+        if self._skills.candidates(text):
+            return True
+        match = self._skills.classify(text)
+        return match is not None and match.confidence >= self._settings.intents.threshold
+
+    def _plan_with_tools(
+        self, text: str, memory: Optional[ConversationMemory]
+    ) -> Optional[Reply]:
+        """Let ChatGPT plan every action in ``text`` at once and run them concurrently."""
+
+        history = memory.messages() if memory is not None else None
+        try:
+            with self._tracer.span("tool_plan"):
+                plan = self._openai.plan_tool_calls(
+                    text,
+                    tools=self._tools.schemas(self._context),  # type: ignore[union-attr]
+                    system_prompt=_SYSTEM_PROMPT + _TOOL_PROMPT,
+                    conversation_history=history,
+                )
+        except Exception as exc:
+            self._log.warning("Tool planning failed, routing to a single skill: %s", exc)
+            return None
+
+        results = self._tools.execute(plan.calls, self._context)  # type: ignore[union-attr]
+        self._log.debug("Executed %d tool call(s) from one completion.", len(results))
+        parts = [result.output for result in results if result.output]
+        if plan.text:
+            parts.append(plan.text)
+        if not parts:
+            return None
+        response = " ".join(parts)
+        if memory is not None:
+            memory.add_turn(text, response)
+        return Reply(text=response, route="tools")
+
+    def _fallback_to_chatgpt(
+        self,
+        text: str,
+        memory: Optional[ConversationMemory],
+        speculation: Optional[Speculation] = None,
+    ) -> Reply:
+        if speculation is not None:
+            # already under way; the LLM spans time only what is left to wait for
+            return Reply(
+                chunks=PrefetchedStream(
+                    self._remember_stream(
+                        text, speculation.adopt(), memory, self._tracer.current()
+                    )
+                ),
+                route="chat",
             )
+        history = memory.messages() if memory is not None else None
+        if self._settings.openai.stream_responses:
+            chunks = self._openai.stream_response(
+                text, system_prompt=_SYSTEM_PROMPT, conversation_history=history
+            )
+            return Reply(
+                chunks=PrefetchedStream(
+                    self._remember_stream(text, chunks, memory, self._tracer.current())
+                ),
+                route="chat",
+            )
+
+        try:
+            with self._tracer.span("llm"):
+                response = self._openai.generate_response(
+                    text,
+                    system_prompt=_SYSTEM_PROMPT,
+                    conversation_history=history,
+                )
         except Exception as exc:
             self._log.exception("OpenAI request failed: %s", exc)
-            self._responder.speak("I ran into an issue reaching OpenAI.")
-            return
-        self._responder.speak(response)
+            return Reply(text=_OPENAI_ERROR_REPLY, route="chat", error=str(exc))
+        if memory is not None:
+            memory.add_turn(text, response)
+        return Reply(text=response, route="chat")
+
+    def _remember_stream(
+        self,
+        text: str,
+        chunks: Iterator[str],
+        memory: Optional[ConversationMemory],
+        trace: Optional[TurnTrace],
+    ) -> Iterator[str]:
+        # runs on the prefetch thread, so the turn is passed in explicitly
+        parts: List[str] = []
+        first_token = self._tracer.span("llm_first_token", trace)
+        try:
+            with self._tracer.span("llm", trace):
+                for chunk in chunks:
+                    if not parts:
+                        first_token.end()
+                    parts.append(chunk)
+                    yield chunk
+        finally:
+            # an interrupted reply is remembered as far as it got
+            if memory is not None and parts:
+                memory.add_turn(text, "".join(parts))
+            if parts:
+                self._events.publish(
+                    "reply", turn=_turn_id(trace), route="chat", text="".join(parts)
+                )
 
-    def _register_default_hardware(self) -> None:
+    def _deliver(self, reply: Reply) -> Optional[float]:
+        """Speak ``reply``, close its turn and return the latency to first audio."""
+
+        first_audio = self._speak(reply)
+        self._end_turn(reply, first_audio=first_audio)
+        return first_audio
+
+    def _end_turn(self, reply: Reply, *, first_audio: Optional[float]) -> None:
+        trace = reply.trace
+        self._tracer.end_turn(trace, route=reply.route, first_audio=first_audio)
+        self._events.publish(
+            "turn",
+            turn=_turn_id(trace),
+            route=reply.route,
+            first_audio=first_audio,
+            seconds=trace.seconds if trace is not None else None,
+            spans=trace.as_dict()["spans"] if trace is not None else [],
+        )
+
+    def _speak(self, reply: Reply) -> Optional[float]:
+        if reply.chunks is None:
+            if not reply.text:
+                return None
+            first_audio = time.perf_counter() - reply.started_at
+            self._responder.speak(reply.text)
+            return first_audio
+
+        try:
+            stats = self._responder.speak_stream(reply.chunks, started_at=reply.started_at)
+        except Exception as exc:
+            self._log.exception("OpenAI request failed: %s", exc)
+            self._responder.speak(_OPENAI_ERROR_REPLY)
+            return None
+        if stats.time_to_first_audio is not None:
+            self._log.info(
+                "Streamed reply: first audio after %.0f ms, %d sentence(s) in %.0f ms.",
+                stats.time_to_first_audio * 1000,
+                stats.sentences,
+                stats.total_seconds * 1000,
+            )
+        return stats.time_to_first_audio
+
+    def _serve_dashboard(self) -> Optional[Union[DashboardServer, MetricsServer]]:
+        dashboard = self._settings.dashboard
+        try:
+            try:
+                server: Union[DashboardServer, MetricsServer] = DashboardServer(
+                    dashboard,
+                    run_skill=self._run_dashboard_skill,
+                    run_action=lambda name, args: self._hardware.execute(name, **args),
+                    actions=lambda: self._hardware.summary(),
+                )
+            except RuntimeError as exc:
+                self._log.warning("%s Serving metrics only.", exc)
+                server = MetricsServer(dashboard.host, dashboard.port)
+            return server.start()
+        except OSError as exc:
+            self._log.warning("Could not start the dashboard on port %d: %s", dashboard.port, exc)
+            return None
+
+    def _run_dashboard_skill(self, text: str) -> Optional[str]:
+        """Answer a command typed on the dashboard with a skill, without speaking."""
+
+        result = self._skills.handle(text, self._context)
+        if not result or not result.handled:
+            return None
+        response = result.response or "Done."
+        self._events.publish("reply", turn=None, route="skill", source="dashboard", text=response)
+        return response
+
+    def _collect_metrics(self) -> Iterator[Sample]:
+        """Expose transport, cache, device, STT, single-flight, routing and speculation counters."""
+
+        transport = self._openai.transport_metrics()
+        for field_name in _TRANSPORT_COUNTERS:
+            yield (
+                f"jarvis_openai_{field_name}_total",
+                "counter",
+                f"OpenAI transport {field_name.replace('_', ' ')}.",
+                {},
+                getattr(transport, field_name),
+            )
+        yield (
+            "jarvis_openai_circuit_open",
+            "gauge",
+            "1 while the OpenAI circuit breaker is open.",
+            {},
+            float(transport.circuit_state == OPEN),
+        )
+        cache = self._openai.cache_stats()
+        if cache is not None:
+            for result, value in (
+                ("memory_hit", cache.memory_hits),
+                ("disk_hit", cache.disk_hits),
+                ("miss", cache.misses),
+            ):
+                yield (
+                    "jarvis_response_cache_lookups_total",
+                    "counter",
+                    "Response cache lookups by result.",
+                    {"result": result},
+                    value,
+                )
+        # never block a scrape on a backend that is still starting
+        if self._started("hardware"):
+            stats = self._hardware.executor_stats()
+            for outcome in ("submitted", "executed", "coalesced", "failed"):
+                yield (
+                    "jarvis_device_commands_total",
+                    "counter",
+                    "Device commands by outcome.",
+                    {"outcome": outcome},
+                    getattr(stats, outcome),
+                )
+        if self._started("voice_input"):
+            for backend, backend_stats in self._listener.transcription_stats().items():
+                labels = {"backend": backend}
+                yield (
+                    "jarvis_stt_calls_total",
+                    "counter",
+                    "Transcription calls per backend.",
+                    labels,
+                    backend_stats.calls,
+                )
+                yield (
+                    "jarvis_stt_errors_total",
+                    "counter",
+                    "Failed transcription calls per backend.",
+                    labels,
+                    backend_stats.errors,
+                )
+        flights = self._openai.flight_stats()
+        if self._started("voice_output"):
+            flights["synthesis"] = self._responder.synthesis_stats()
+        for call, flight in flights.items():
+            yield (
+                "jarvis_singleflight_calls_total",
+                "counter",
+                "Upstream calls made, per call type.",
+                {"call": call},
+                flight.calls,
+            )
+            yield (
+                "jarvis_singleflight_saved_total",
+                "counter",
+                "Calls answered by joining an identical call already in flight.",
+                {"call": call},
+                flight.saved,
+            )
+        speculation = self._speculator.stats()
+        for outcome in ("used", "cancelled"):
+            yield (
+                "jarvis_speculation_total",
+                "counter",
+                "Speculative chat requests by outcome (used: no skill claimed the turn).",
+                {"outcome": outcome},
+                getattr(speculation, outcome),
+            )
+        for kind in ("prompt", "completion"):
+            yield (
+                "jarvis_speculation_wasted_tokens_total",
+                "counter",
+                "Estimated tokens spent on speculative requests that a skill made unnecessary.",
+                {"kind": kind},
+                getattr(speculation, f"wasted_{kind}_tokens"),
+            )
+        yield (
+            "jarvis_speculation_head_start_seconds_total",
+            "counter",
+            "Time used speculative requests had been running when routing reached them.",
+            {},
+            speculation.head_start_seconds,
+        )
+        for model, model_stats in (self._openai.router_stats() or {}).items():
+            labels = {"model": model}
+            for field_name, help_text in _ROUTER_COUNTERS:
+                yield (
+                    f"jarvis_model_{field_name}_total",
+                    "counter",
+                    help_text,
+                    labels,
+                    getattr(model_stats, field_name),
+                )
+            yield (
+                "jarvis_model_latency_seconds",
+                "gauge",
+                "Moving average of each model's reply (or first token) latency.",
+                labels,
+                model_stats.latency_seconds or 0.0,
+            )
+
+    def _prewarm_phrases(self) -> None:
+        if not (self._started("skills", wait=True) and self._started("voice_output", wait=True)):
+            return  # run() reports the failure
+        phrases = [
+            "Goodbye!",
+            _CAPTURE_ERROR_REPLY,
+            _OPENAI_ERROR_REPLY,
+            *self._skills.static_responses(),
+        ]
+        rendered = self._responder.prewarm(phrases)
+        if rendered:
+            self._log.debug("Pre-rendered %d phrase(s) into the TTS cache.", rendered)
+
+    def _build_hardware(self) -> HardwareController:
+        hardware = HardwareController(self._settings.hardware)
         # Register a simulated LED so users can observe the flow before wiring hardware.
-        self._hardware.attach_example_led(pin=17, name="desk_lamp")
+        hardware.attach_example_led(pin=17, name="desk_lamp")
+        return hardware
 
-    def _build_skill_registry(self) -> SkillRegistry:
+    def _build_skill_registry(self, skills: List[Skill], *, intents: bool = True) -> SkillRegistry:
+        config = self._settings.intents
         registry = SkillRegistry(
-            skills=[
-                SystemControlSkill(),
-                LightingSkill(device_name="desk_lamp"),
-            ]
+            skills=skills,
+            intent_threshold=config.threshold if intents and config.enabled else None,
         )
+        registry.prepare()
         self._log.debug("Loaded skills: %s", ", ".join(registry.names()))
         return registry
+
+
+def _turn_id(trace: Optional[TurnTrace]) -> Optional[int]:
+    return trace.id if trace is not None else None
@@ -0,0 +1,181 @@
+"""Headless batch mode: answer a file of utterances and record every reply as JSONL."""
+from __future__ import annotations
+
+import csv
+import json
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional, TextIO
+
+from jarvis.core.assistant import JarvisAssistant
+from jarvis.utils.logger import get_logger
+
+
+@dataclass(slots=True)
+class Utterance:
+    """One input record; ``line`` numbers records from 1 and is what resume keys on."""
+
+    line: int
+    text: str
+    id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class BatchReport:
+    """Totals for one batch run."""
+
+    answered: int = 0
+    failed: int = 0
+    resumed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def turns_per_second(self) -> float:
+        total = self.answered + self.failed
+        return total / self.seconds if self.seconds else 0.0
+
+
+def read_utterances(path: Path) -> Iterator[Utterance]:
+    """Stream utterances from a ``.csv`` or JSONL file without loading it whole.
+
+    JSONL lines are objects with a ``text`` field and an optional ``id``, or
+    bare JSON strings. CSV files need a header row; the ``text`` column is
+    used, or the first column when there is none.
+    """
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(handle)
+            fields = reader.fieldnames or []
+            column = "text" if "text" in fields else (fields[0] if fields else "text")
+            for line, row in enumerate(reader, start=1):
+                yield Utterance(line=line, text=row.get(column) or "", id=row.get("id"))
+            return
+
+        line = 0
+        for raw in handle:
+            if not raw.strip():
+                continue
+            line += 1
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError as exc:
+                raise RuntimeError(f"{path}: record {line} is not valid JSON: {exc}") from exc
+            if isinstance(record, str):
+                yield Utterance(line=line, text=record)
+            elif not isinstance(record, dict):
+                raise RuntimeError(
+                    f"{path}: record {line} is {type(record).__name__}, "
+                    "not an object or a string"
+                )
+            else:
+                identifier = record.get("id")
+                yield Utterance(
+                    line=line,
+                    text=str(record.get("text") or ""),
+                    id=None if identifier is None else str(identifier),
+                )
+
+
+class BatchRunner:
+    """Answer utterances ``concurrency`` at a time and write the replies in input order.
+
+    Each utterance is answered on its own, with an empty conversation, so
+    results do not depend on scheduling. Replies are written as soon as every
+    earlier one is, and at most a few times ``concurrency`` utterances are in
+    flight, so memory stays flat however long the input is. The output file
+    doubles as the checkpoint: with ``resume=True`` the records already in it
+    are kept, a record cut short by a crash is dropped, and the run carries
+    on after the last complete one.
+    """
+
+    def __init__(self, assistant: JarvisAssistant, *, concurrency: int = 4) -> None:
+        self._assistant = assistant
+        self._concurrency = max(1, concurrency)
+        self._window = self._concurrency * 4
+        self._log = get_logger("jarvis.batch")
+
+    def run(self, source: Path, output: Path, *, resume: bool = False) -> BatchReport:
+        report = BatchReport()
+        done = _checkpoint(output) if resume else 0
+        report.resumed = done
+        if done:
+            self._log.info("Resuming after record %d of %s.", done, source)
+
+        started = time.perf_counter()
+        pending: Deque[Future] = deque()
+        pool = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="jarvis-batch")
+        with pool, output.open("a" if resume else "w", encoding="utf-8") as sink:
+            for utterance in read_utterances(source):
+                if utterance.line <= done:
+                    continue
+                pending.append(pool.submit(self._answer, utterance))
+                # write finished records in order; wait only once the window is full
+                while pending and (len(pending) >= self._window or pending[0].done()):
+                    self._write(sink, pending.popleft(), report)
+            while pending:
+                self._write(sink, pending.popleft(), report)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    # ------------------------------------------------------------------
+    def _answer(self, utterance: Utterance) -> Dict[str, Any]:
+        record: Dict[str, Any] = {
+            "line": utterance.line,
+            "id": utterance.id,
+            "text": utterance.text,
+        }
+        try:
+            result = self._assistant.answer(utterance.text, memory=self._assistant.new_memory())
+        except Exception as exc:
+            self._log.warning("Record %d failed: %s", utterance.line, exc)
+            record["error"] = str(exc)
+            return record
+        if result is None:
+            record["error"] = "Empty utterance."
+            return record
+        record.update(
+            route=result.route,
+            skill=result.skill,
+            response=result.reply,
+            first_reply_seconds=result.first_reply_seconds,
+            seconds=result.seconds,
+            stages=result.stages,
+        )
+        if result.error is not None:
+            record["error"] = result.error
+        return record
+
+    @staticmethod
+    def _write(sink: TextIO, future: Future, report: BatchReport) -> None:
+        record = future.result()
+        if "error" in record:
+            report.failed += 1
+        else:
+            report.answered += 1
+        sink.write(json.dumps(record) + "\n")
+        sink.flush()  # a crash loses at most the records still in flight
+
+
+def _checkpoint(output: Path) -> int:
+    """Return the last record number already in ``output``, dropping a torn final line."""
+
+    if not output.exists():
+        return 0
+    done = 0
+    keep = 0
+    with output.open("rb") as handle:
+        for raw in handle:
+            if not raw.endswith(b"\n"):
+                break
+            try:
+                done = int(json.loads(raw)["line"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                break
+            keep += len(raw)
+    with output.open("r+b") as handle:
+        handle.truncate(keep)
+    return done
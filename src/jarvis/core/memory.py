@@ -0,0 +1,159 @@
+"""Token-budgeted conversation memory that feeds follow-up questions to ChatGPT."""
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import math
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional
+
+_PIECE_PATTERN = re.compile(r"\w+|[^\w\s]")
+# chat format overhead per message (role marker and separators)
+_MESSAGE_OVERHEAD = 4
+_SUMMARY_HEADER = "Summary of the earlier conversation:"
+
+
+def _load_encoder(model: str) -> Optional[Callable[[str], int]]:
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+    tiktoken = importlib.import_module("tiktoken")
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    return lambda text: len(encoding.encode(text))
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count: one per word or symbol, long words split every 4 chars."""
+
+    return sum(math.ceil(len(piece) / 4) for piece in _PIECE_PATTERN.findall(text))
+
+
+@dataclass(slots=True)
+class _Message:
+    role: str
+    content: str
+    tokens: int
+
+
+@dataclass(slots=True)
+class _Turn:
+    user: _Message
+    assistant: _Message
+
+    @property
+    def tokens(self) -> int:
+        return self.user.tokens + self.assistant.tokens
+
+
+def summarize_turn(user: str, assistant: str, *, max_words: int = 16) -> str:
+    """Condense one exchange into a single line for the running summary."""
+
+    def _clip(text: str) -> str:
+        words = text.split()
+        clipped = " ".join(words[:max_words])
+        return clipped + ("..." if len(words) > max_words else "")
+
+    return f"- User: {_clip(user)} / Jarvis: {_clip(assistant)}"
+
+
+class ConversationMemory:
+    """Ring buffer of recent turns kept under a hard prompt token budget.
+
+    Every message is tokenized once when it is added and the running total is
+    updated incrementally, so building the history for a request never
+    re-counts anything. When the turns (plus the summary) exceed
+    ``max_tokens``, the oldest turns are folded into a running summary made of
+    one condensed line per turn; the summary itself is capped at
+    ``summary_max_tokens`` by dropping its oldest lines. ``summarize`` can be
+    replaced, e.g. with a model-backed summarizer.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: int = 1500,
+        max_turns: int = 50,
+        summary_max_tokens: int = 300,
+        model: str = "gpt-4o-mini",
+        summarize: Callable[[str, str], str] = summarize_turn,
+    ) -> None:
+        self._max_tokens = max_tokens
+        self._turns: Deque[_Turn] = deque()
+        self._max_turns = max(1, max_turns)
+        self._summary: Deque[_Message] = deque()
+        self._turn_tokens = 0
+        self._summary_tokens = 0
+        self._summarize = summarize
+        self._count = _load_encoder(model) or estimate_tokens
+        self._header_tokens = self._count(_SUMMARY_HEADER) + _MESSAGE_OVERHEAD
+        self._summary_max_tokens = min(summary_max_tokens, max_tokens - self._header_tokens)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> int:
+        """Tokens the current history adds to a prompt."""
+
+        with self._lock:
+            return self._history_tokens()
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def count_tokens(self, text: str) -> int:
+        return self._count(text) + _MESSAGE_OVERHEAD
+
+    def add_turn(self, user: str, assistant: str) -> None:
+        """Remember one exchange and enforce the ring size and token budget."""
+
+        turn = _Turn(
+            user=_Message("user", user, self.count_tokens(user)),
+            assistant=_Message("assistant", assistant, self.count_tokens(assistant)),
+        )
+        with self._lock:
+            self._turns.append(turn)
+            self._turn_tokens += turn.tokens
+            while len(self._turns) > self._max_turns:
+                self._fold_oldest()
+            while self._turns and self._history_tokens() > self._max_tokens:
+                self._fold_oldest()
+
+    def messages(self) -> List[Dict[str, str]]:
+        """Return the history as chat messages, summary first."""
+
+        with self._lock:
+            history: List[Dict[str, str]] = []
+            if self._summary:
+                lines = "\n".join(line.content for line in self._summary)
+                history.append({"role": "system", "content": f"{_SUMMARY_HEADER}\n{lines}"})
+            for turn in self._turns:
+                history.append({"role": "user", "content": turn.user.content})
+                history.append({"role": "assistant", "content": turn.assistant.content})
+            return history
+
+    def clear(self) -> None:
+        with self._lock:
+            self._turns.clear()
+            self._summary.clear()
+            self._turn_tokens = 0
+            self._summary_tokens = 0
+
+    # ------------------------------------------------------------------
+    def _history_tokens(self) -> int:
+        summary = self._summary_tokens + self._header_tokens if self._summary else 0
+        return self._turn_tokens + summary
+
+    def _fold_oldest(self) -> None:
+        turn = self._turns.popleft()
+        self._turn_tokens -= turn.tokens
+        line = self._summarize(turn.user.content, turn.assistant.content)
+        # summary lines are joined by newlines, so count them without message overhead
+        entry = _Message("summary", line, self._count(line) + 1)
+        self._summary.append(entry)
+        self._summary_tokens += entry.tokens
+        while self._summary_tokens > self._summary_max_tokens and self._summary:
+            self._summary_tokens -= self._summary.popleft().tokens
@@ -0,0 +1,279 @@
+"""Asyncio turn pipeline that overlaps listening, thinking, and speaking."""
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar
+
+from jarvis.io.voice_listener import VoiceListener
+from jarvis.io.voice_responder import VoiceResponder
+from jarvis.telemetry.tracing import TurnTrace, get_tracer
+from jarvis.utils.cancellation import CancelScope
+from jarvis.utils.logger import get_logger
+
+T = TypeVar("T")
+
+_SHUTDOWN = object()
+_STREAM_DONE = object()
+
+
+@dataclass(slots=True)
+class Reply:
+    """What the assistant wants to say in response to one utterance.
+
+    Either ``text`` is spoken at once or ``chunks`` is streamed sentence by
+    sentence. ``started_at`` is the ``time.perf_counter()`` reading taken when
+    the utterance was captured and anchors the turn latency measurement.
+    ``route`` says how the reply was produced (and ``skill`` which skill, when
+    one did), ``error`` why it is an apology instead of an answer, and
+    ``trace`` is the turn it belongs to; the turn is closed once the reply
+    has been spoken.
+    """
+
+    text: Optional[str] = None
+    chunks: Optional[Iterable[str]] = None
+    final: bool = False
+    started_at: float = field(default_factory=time.perf_counter)
+    route: Optional[str] = None
+    skill: Optional[str] = None
+    error: Optional[str] = None
+    trace: Optional[TurnTrace] = None
+
+
+class PrefetchedStream:
+    """Start consuming a chunk iterator immediately and buffer what arrives.
+
+    Wrapping an LLM stream lets the request make progress while the reply is
+    still waiting for the speaker. :meth:`cancel` stops pulling from the
+    upstream iterator and closes it. Upstream reads run in a
+    :class:`CancelScope`, so a stream that registered an abort (the OpenAI
+    client does) is cut off at once instead of when its next chunk arrives.
+    """
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._chunks = chunks
+        self._buffer: "queue.Queue[object]" = queue.Queue()
+        self._cancelled = threading.Event()
+        self._scope = CancelScope()
+        self._thread = threading.Thread(
+            target=self._pump, name="jarvis-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            item = self._buffer.get()
+            if item is _STREAM_DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield str(item)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        self._scope.cancel()
+
+    # ------------------------------------------------------------------
+    def _pump(self) -> None:
+        with self._scope.active():
+            iterator = iter(self._chunks)
+            try:
+                for chunk in iterator:
+                    if self._cancelled.is_set():
+                        break
+                    self._buffer.put(chunk)
+            except BaseException as exc:  # re-raised on the consuming thread
+                if not self._cancelled.is_set():  # an aborted read is expected, not an error
+                    self._buffer.put(exc)
+            finally:
+                close = getattr(iterator, "close", None)
+                if self._cancelled.is_set() and callable(close):
+                    close()
+                self._buffer.put(_STREAM_DONE)
+
+
+class TurnPipeline:
+    """Run capture, transcription, reasoning and synthesis as concurrent stages.
+
+    Stages are joined by bounded queues so a slow stage applies backpressure
+    instead of buffering without limit. Capture runs on its own daemon thread,
+    so the next utterance is recorded while earlier replies are still being
+    generated or spoken. With ``barge_in`` enabled, a new non-empty transcript
+    interrupts playback and drops replies that have not started yet.
+    """
+
+    def __init__(
+        self,
+        listener: VoiceListener,
+        responder: VoiceResponder,
+        *,
+        reason: Callable[[str, float], Optional[Reply]],
+        deliver: Callable[[Reply], Optional[float]],
+        queue_size: int = 2,
+        barge_in: bool = True,
+        prompt: str = "You> ",
+        capture_error_reply: str = "I could not hear you. Please try again.",
+        error_reply: str = "Sorry, something went wrong with that request.",
+    ) -> None:
+        self._log = get_logger("jarvis.pipeline")
+        self._listener = listener
+        self._responder = responder
+        self._reason = reason
+        self._deliver = deliver
+        self._queue_size = max(1, queue_size)
+        self._barge_in = barge_in
+        self._prompt = prompt
+        self._capture_error_reply = capture_error_reply
+        self._error_reply = error_reply
+        self._tracer = get_tracer()
+        self.turn_latencies: List[float] = []
+
+    def run(self) -> None:
+        """Block until an exit reply is spoken or input ends."""
+
+        asyncio.run(self._run())
+
+    # ------------------------------------------------------------------
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._audio_q: asyncio.Queue[Any] = asyncio.Queue(self._queue_size)
+        self._text_q: asyncio.Queue[Any] = asyncio.Queue(self._queue_size)
+        self._speech_q: asyncio.Queue[Any] = asyncio.Queue(self._queue_size)
+        self._stopped = asyncio.Event()
+        self._closing = threading.Event()
+
+        capture = threading.Thread(
+            target=self._capture_loop, args=(loop,), name="jarvis-capture", daemon=True
+        )
+        capture.start()
+        stages = [
+            asyncio.create_task(self._transcribe_stage()),
+            asyncio.create_task(self._reason_stage()),
+            asyncio.create_task(self._speak_stage()),
+        ]
+        try:
+            await self._stopped.wait()
+        finally:
+            self._closing.set()
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+
+    def _capture_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        while not self._closing.is_set():
+            trace = self._tracer.begin_turn()
+            try:
+                with self._tracer.activate(trace):
+                    audio = self._listener.capture(prompt=self._prompt)
+            except EOFError:
+                self._submit(loop, self._audio_q, _SHUTDOWN)
+                return
+            except Exception as exc:
+                self._log.exception("Failed to capture audio: %s", exc)
+                self._submit(loop, self._speech_q, Reply(text=self._capture_error_reply))
+                continue
+            captured_at = time.perf_counter()
+            if trace is not None:
+                trace.started_at = captured_at  # the turn is timed from the end of speech
+            self._submit(loop, self._audio_q, (audio, captured_at, trace))
+
+    def _submit(self, loop: asyncio.AbstractEventLoop, target: asyncio.Queue, item: Any) -> None:
+        if self._closing.is_set():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(target.put(item), loop).result()
+        except (RuntimeError, asyncio.CancelledError):
+            pass  # the loop shut down while we were waiting for room
+
+    async def _transcribe_stage(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._audio_q.get()
+            if item is _SHUTDOWN:
+                await self._text_q.put(_SHUTDOWN)
+                return
+            audio, captured_at, trace = item
+            try:
+                text = await loop.run_in_executor(
+                    None, self._in_turn, trace, self._listener.transcribe, audio
+                )
+            except Exception as exc:
+                self._log.exception("Failed to transcribe audio: %s", exc)
+                await self._speech_q.put(Reply(text=self._capture_error_reply))
+                continue
+            if not text.strip():
+                continue
+            if self._barge_in:
+                self._interrupt_playback()
+            await self._text_q.put((text, captured_at, trace))
+
+    async def _reason_stage(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._text_q.get()
+            if item is _SHUTDOWN:
+                await self._speech_q.put(_SHUTDOWN)
+                return
+            text, captured_at, trace = item
+            try:
+                reply = await loop.run_in_executor(
+                    None, self._in_turn, trace, self._reason, text, captured_at
+                )
+            except Exception as exc:
+                self._log.exception("Failed to answer %r: %s", text, exc)
+                await self._speech_q.put(Reply(text=self._error_reply))
+                continue
+            if reply is None:
+                continue
+            await self._speech_q.put(reply)
+            if reply.final:
+                return
+
+    async def _speak_stage(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            reply = await self._speech_q.get()
+            if reply is _SHUTDOWN:
+                self._stopped.set()
+                return
+            if not self._barge_in:
+                self._listener.pause()  # without barge-in, do not capture our own voice
+            try:
+                first_audio = await loop.run_in_executor(
+                    None, self._in_turn, reply.trace, self._deliver, reply
+                )
+            except Exception as exc:
+                # speaking an apology would most likely fail the same way
+                self._log.exception("Failed to speak a reply: %s", exc)
+                first_audio = None
+            finally:
+                if not self._barge_in:
+                    self._listener.resume()
+            if first_audio is not None:
+                self.turn_latencies.append(first_audio)
+                self._log.debug("Turn latency: %.0f ms", first_audio * 1000)
+            if reply.final:
+                self._stopped.set()
+                return
+
+    def _in_turn(self, trace: Optional[TurnTrace], run: Callable[..., T], *args: Any) -> T:
+        # executor threads do not inherit the capture thread's current turn
+        with self._tracer.activate(trace):
+            return run(*args)
+
+    def _interrupt_playback(self) -> None:
+        self._responder.stop()
+        while True:
+            try:
+                pending = self._speech_q.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if pending is _SHUTDOWN or getattr(pending, "final", False):
+                self._speech_q.put_nowait(pending)
+                return
+            cancel = getattr(pending.chunks, "cancel", None)
+            if callable(cancel):
+                cancel()
@@ -0,0 +1,119 @@
+"""Speculative chat: start the LLM request while skills are still deciding."""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Iterable, Iterator, List
+
+from jarvis.core.memory import estimate_tokens
+from jarvis.core.pipeline import PrefetchedStream
+
+
+@dataclass(slots=True)
+class SpeculationStats:
+    """How speculative chat requests turned out."""
+
+    started: int = 0
+    # no skill claimed the turn, so the early request became the reply
+    used: int = 0
+    # a skill claimed the turn and the request was dropped
+    cancelled: int = 0
+    # estimated tokens sent and received by cancelled requests
+    wasted_prompt_tokens: int = 0
+    wasted_completion_tokens: int = 0
+    # how long used requests had been running by the time routing reached them
+    head_start_seconds: float = 0.0
+
+    @property
+    def win_rate(self) -> float:
+        settled = self.used + self.cancelled
+        return self.used / settled if settled else 0.0
+
+
+class Speculator:
+    """Start speculative chat streams and keep score of how they end."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats = SpeculationStats()
+
+    def start(self, chunks: Iterable[str], *, prompt_tokens: int) -> "Speculation":
+        """Begin pulling ``chunks`` in the background; the caller must adopt or cancel it."""
+
+        with self._lock:
+            self._stats.started += 1
+        return Speculation(self, chunks, prompt_tokens=prompt_tokens)
+
+    def stats(self) -> SpeculationStats:
+        with self._lock:
+            return replace(self._stats)
+
+    # ------------------------------------------------------------------
+    def _used(self, head_start: float) -> None:
+        with self._lock:
+            self._stats.used += 1
+            self._stats.head_start_seconds += head_start
+
+    def _cancelled(self, prompt_tokens: int, completion_tokens: int) -> None:
+        with self._lock:
+            self._stats.cancelled += 1
+            self._stats.wasted_prompt_tokens += prompt_tokens
+            self._stats.wasted_completion_tokens += completion_tokens
+
+
+class Speculation:
+    """One chat stream started before routing knew whether a skill would answer.
+
+    The stream is consumed in the background as in :class:`PrefetchedStream`,
+    so by the time every skill has declined part of the reply may already be
+    buffered. Exactly one of :meth:`adopt` and :meth:`cancel` is called.
+    Cancelling stops pulling and closes the upstream stream; what it had
+    received by then is counted as waste.
+    """
+
+    def __init__(self, owner: Speculator, chunks: Iterable[str], *, prompt_tokens: int) -> None:
+        self._owner = owner
+        self._prompt_tokens = prompt_tokens
+        self._started = time.perf_counter()
+        self._received: List[str] = []
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._finished = False
+        self._stream = PrefetchedStream(self._record(chunks))
+
+    def adopt(self) -> Iterator[str]:
+        """Take over the stream as the reply, from its first chunk."""
+
+        self._owner._used(time.perf_counter() - self._started)
+        return self._follow()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            finished = self._finished
+        self._stream.cancel()
+        if finished:  # the whole reply arrived before a skill claimed the turn
+            self._settle()
+
+    # ------------------------------------------------------------------
+    def _record(self, chunks: Iterable[str]) -> Iterator[str]:
+        try:
+            for chunk in chunks:
+                self._received.append(chunk)
+                yield chunk
+        finally:
+            with self._lock:
+                self._finished = True
+                cancelled = self._cancelled
+            if cancelled:
+                self._settle()
+
+    def _settle(self) -> None:
+        self._owner._cancelled(self._prompt_tokens, estimate_tokens("".join(self._received)))
+
+    def _follow(self) -> Iterator[str]:
+        try:
+            yield from self._stream
+        finally:
+            self._stream.cancel()  # the reader stopped early (barge-in); stop pulling too
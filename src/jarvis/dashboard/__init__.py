@@ -0,0 +1,5 @@
+"""Web dashboard for watching the assistant and triggering skills and devices."""
+
+from jarvis.dashboard.server import DashboardServer
+
+__all__ = ["DashboardServer"]
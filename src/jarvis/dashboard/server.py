@@ -0,0 +1,281 @@
+"""Flask + Socket.IO dashboard that streams assistant events and accepts commands."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from jarvis.config import DashboardConfig
+from jarvis.telemetry.events import Event, EventBus, get_event_bus
+from jarvis.telemetry.exporter import PROMETHEUS_CONTENT_TYPE, dump
+from jarvis.telemetry.metrics import MetricsRegistry, get_registry
+from jarvis.telemetry.tracing import Tracer, get_tracer
+from jarvis.utils.logger import get_logger
+from jarvis.utils.startup import lazy_import
+
+_TEMPLATES = Path(__file__).resolve().parent / "templates"
+
+
+@dataclass(slots=True)
+class _Client:
+    sid: str
+    cursor: int
+    in_flight: bool = False
+    sent_at: float = 0.0
+
+
+class DashboardServer:
+    """Serve the dashboard page, a Socket.IO event stream and control endpoints.
+
+    A single emitter thread forwards bus events to every connected client in
+    batches. A client receives its next batch only after acknowledging the
+    previous one (or after ``ack_timeout``), so a slow client falls behind in
+    the bus ring and loses the oldest events instead of growing a queue or
+    holding up the other clients. The assistant never waits on any of this.
+
+    ``run_skill`` answers a typed command with a skill, ``run_action`` queues a
+    hardware action with keyword arguments, and ``actions`` lists the actions
+    the page offers. ``/metrics``, ``/metrics.json`` and ``/traces`` expose the
+    telemetry on the same port.
+    """
+
+    def __init__(
+        self,
+        config: DashboardConfig,
+        *,
+        run_skill: Callable[[str], Optional[str]],
+        run_action: Callable[[str, Dict[str, Any]], Future],
+        actions: Callable[[], Dict[str, str]],
+        bus: Optional[EventBus] = None,
+        registry: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+        batch_interval: float = 0.05,
+        batch_size: int = 100,
+        ack_timeout: float = 5.0,
+        backlog: int = 50,
+    ) -> None:
+        self._flask = lazy_import("flask")
+        flask_socketio = lazy_import("flask_socketio")
+        serving = lazy_import("werkzeug.serving")
+        if self._flask is None or flask_socketio is None or serving is None:
+            raise RuntimeError("The dashboard requires flask and flask-socketio.")
+
+        self._run_skill = run_skill
+        self._run_action = run_action
+        self._actions = actions
+        self._bus = bus or get_event_bus()
+        self._registry = registry or get_registry()
+        self._tracer = tracer or get_tracer()
+        self._batch_interval = batch_interval
+        self._batch_size = max(1, batch_size)
+        self._ack_timeout = ack_timeout
+        self._backlog = backlog
+        self._clients: Dict[str, _Client] = {}
+        self._clients_lock = threading.Lock()
+        self._closing = threading.Event()
+        self._log = get_logger("jarvis.dashboard")
+        # one access log line per long-poll would drown out the assistant's output
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+        self._connected = self._registry.gauge(
+            "jarvis_dashboard_clients", "Connected dashboard clients."
+        )
+        self._batches = self._registry.counter(
+            "jarvis_dashboard_batches_total", "Event batches emitted to dashboard clients."
+        )
+        self._sent = self._registry.counter(
+            "jarvis_dashboard_events_sent_total", "Events delivered to dashboard clients."
+        )
+        self._dropped = self._registry.counter(
+            "jarvis_dashboard_events_dropped_total",
+            "Events slow dashboard clients missed because the ring moved past them.",
+        )
+
+        self._app = self._flask.Flask("jarvis.dashboard", template_folder=str(_TEMPLATES))
+        self._socketio = flask_socketio.SocketIO(self._app, async_mode="threading")
+        self._register_routes()
+        self._register_socket_handlers()
+        self._server = serving.make_server(config.host, config.port, self._app, threaded=True)
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def address(self) -> str:
+        return f"http://{self._server.host}:{self._server.port}"
+
+    @property
+    def clients(self) -> int:
+        return len(self._clients)
+
+    def start(self) -> "DashboardServer":
+        self._threads = [
+            threading.Thread(
+                target=self._server.serve_forever, name="jarvis-dashboard", daemon=True
+            ),
+            threading.Thread(
+                target=self._emit_loop, name="jarvis-dashboard-emit", daemon=True
+            ),
+        ]
+        for thread in self._threads:
+            thread.start()
+        self._log.info("Dashboard running on %s", self.address)
+        return self
+
+    def close(self) -> None:
+        self._closing.set()
+        if self._threads:
+            self._server.shutdown()
+            for thread in self._threads:
+                thread.join(timeout=2.0)
+            self._threads = []
+        self._server.server_close()
+
+    # ------------------------------------------------------------------
+    def _register_routes(self) -> None:
+        flask = self._flask
+        app = self._app
+
+        @app.get("/")
+        def _index() -> Any:
+            return flask.render_template("dashboard.html")
+
+        @app.get("/api/actions")
+        def _list_actions() -> Any:
+            return flask.jsonify(self._actions())
+
+        @app.post("/api/command")
+        def _post_command() -> Any:
+            return flask.jsonify(self._command(flask.request.get_json(silent=True) or {}))
+
+        @app.post("/api/actions/<name>")
+        def _post_action(name: str) -> Any:
+            args = flask.request.get_json(silent=True) or {}
+            return flask.jsonify(self._action({"name": name, "args": args}))
+
+        @app.get("/api/events")
+        def _poll_events() -> Any:
+            # a plain HTTP alternative to the socket stream
+            since = flask.request.args.get("since", type=int)
+            limit = flask.request.args.get("limit", default=self._batch_size, type=int)
+            if since is None:
+                since = max(0, self._bus.head - self._backlog)
+            events, cursor, dropped = self._bus.read(since, limit)
+            return flask.jsonify(
+                events=[event.as_dict() for event in events], next=cursor, dropped=dropped
+            )
+
+        @app.get("/metrics")
+        def _metrics() -> Any:
+            body = self._registry.render_prometheus()
+            return flask.Response(body, content_type=PROMETHEUS_CONTENT_TYPE)
+
+        @app.get("/metrics.json")
+        def _metrics_json() -> Any:
+            return flask.jsonify(dump(self._registry, self._tracer))
+
+        @app.get("/traces")
+        def _traces() -> Any:
+            return flask.jsonify(self._tracer.recent_turns())
+
+    def _register_socket_handlers(self) -> None:
+        flask = self._flask
+        socketio = self._socketio
+
+        @socketio.on("connect")
+        def _connect(_auth: Any = None) -> None:
+            # new clients start with a little history so the page is not empty
+            client = _Client(sid=flask.request.sid, cursor=max(0, self._bus.head - self._backlog))
+            with self._clients_lock:
+                self._clients[client.sid] = client
+                self._connected.set(len(self._clients))
+
+        @socketio.on("disconnect")
+        def _disconnect(*_args: Any) -> None:
+            with self._clients_lock:
+                self._clients.pop(flask.request.sid, None)
+                self._connected.set(len(self._clients))
+
+        @socketio.on("command")
+        def _on_command(message: Any) -> Dict[str, Any]:
+            return self._command(message if isinstance(message, dict) else {})
+
+        @socketio.on("action")
+        def _on_action(message: Any) -> Dict[str, Any]:
+            return self._action(message if isinstance(message, dict) else {})
+
+    def _command(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        text = str(message.get("text") or "").strip()
+        if not text:
+            return {"ok": False, "error": "Type a command first."}
+        try:
+            response = self._run_skill(text)
+        except Exception as exc:
+            self._log.exception("Dashboard command failed: %s", exc)
+            return {"ok": False, "error": str(exc)}
+        if response is None:
+            return {"ok": False, "error": "No skill handled that."}
+        return {"ok": True, "response": response}
+
+    def _action(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        name = str(message.get("name") or "")
+        args = message.get("args") or {}
+        if not isinstance(args, dict):
+            return {"ok": False, "error": "Action arguments must be an object."}
+        try:
+            self._run_action(name, args)
+        except (KeyError, TypeError, ValueError) as exc:
+            return {"ok": False, "error": str(exc).strip("'\"")}
+        # the outcome arrives as a hardware event once the device finishes
+        return {"ok": True, "queued": name}
+
+    def _emit_loop(self) -> None:
+        while not self._closing.is_set():
+            with self._clients_lock:
+                clients = list(self._clients.values())
+            cursor = min((client.cursor for client in clients), default=self._bus.head)
+            if not self._bus.wait(cursor, timeout=0.5):
+                continue
+            # let a burst of events collect into one batch per client
+            if self._closing.wait(self._batch_interval):
+                return
+            payloads: Dict[int, Dict[str, Any]] = {}
+            for client in clients:
+                self._flush(client, payloads)
+
+    def _flush(self, client: _Client, payloads: Dict[int, Dict[str, Any]]) -> None:
+        now = time.monotonic()
+        if client.in_flight and now - client.sent_at < self._ack_timeout:
+            return  # still digesting the previous batch; let the ring absorb the rest
+        events, cursor, dropped = self._bus.read(client.cursor, self._batch_size)
+        if not events:
+            return
+        client.cursor = cursor
+        client.in_flight = True
+        client.sent_at = now
+        batch = {"events": [self._payload(event, payloads) for event in events], "dropped": dropped}
+        try:
+            self._socketio.emit(
+                "events", batch, to=client.sid, callback=lambda *_: self._acked(client)
+            )
+        except Exception as exc:  # a client vanishing mid-emit must not stop the loop
+            self._log.debug("Dropping dashboard batch for %s: %s", client.sid, exc)
+            return
+        self._batches.inc()
+        self._sent.inc(len(events))
+        if dropped:
+            self._dropped.inc(dropped)
+
+    @staticmethod
+    def _acked(client: _Client) -> None:
+        client.in_flight = False
+
+    @staticmethod
+    def _payload(event: Event, payloads: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        # clients at the same position share one serialized copy per pass
+        payload = payloads.get(event.seq)
+        if payload is None:
+            payload = payloads[event.seq] = event.as_dict()
+        return payload
@@ -1,5 +1,14 @@
 """Hardware abstraction layer for physical device control."""
 
 from jarvis.hardware.controller import HardwareController
+from jarvis.hardware.devices import Device, DeviceState, SceneReport
+from jarvis.hardware.executor import DeviceExecutor, ExecutorStats
 
-__all__ = ["HardwareController"]
+__all__ = [
+    "Device",
+    "DeviceExecutor",
+    "DeviceState",
+    "ExecutorStats",
+    "HardwareController",
+    "SceneReport",
+]
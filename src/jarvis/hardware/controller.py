@@ -2,79 +2,301 @@
 from __future__ import annotations
 
 import platform
-from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Mapping, Optional, Union
 
 from jarvis.config import HardwareConfig
+from jarvis.hardware.devices import Device, DeviceState, SceneReport
+from jarvis.hardware.executor import DeviceExecutor, ExecutorStats
+from jarvis.utils.startup import lazy_import
 
 
 @dataclass(slots=True)
 class HardwareAction:
-    """Encapsulate a callable action and optional human-readable description."""
+    """Encapsulate a callable action and optional human-readable description.
+
+    ``device`` names the queue the action runs on (defaults to the action
+    itself); actions sharing a device and ``slot`` supersede each other while
+    still pending. Actions created by :meth:`HardwareController.register_device`
+    carry the ``state`` they apply instead of calling ``handler`` directly.
+    """
 
     handler: Callable[..., None]
     description: str = ""
+    device: str = ""
+    slot: Optional[str] = None
+    state: Optional[DeviceState] = None
 
 
 class HardwareController:
-    """Manage interactions with physical devices, with graceful fallbacks."""
+    """Manage interactions with physical devices, with graceful fallbacks.
+
+    Actions run on a :class:`DeviceExecutor`, so :meth:`execute` returns a
+    future immediately instead of blocking on slow devices. Devices registered
+    with :meth:`register_device` keep a shadow of their state: writes that
+    would not change anything are skipped, skills can read the state without
+    touching the hardware, and scenes set many devices at once.
+    """
 
     def __init__(self, config: HardwareConfig) -> None:
         self._config = config
         self._actions: Dict[str, HardwareAction] = {}
+        self._devices: Dict[str, Device] = {}
+        self._scenes: Dict[str, Dict[str, DeviceState]] = {}
+        self._state_lock = threading.Lock()
+        self._skipped_writes = 0
+        self._executor = DeviceExecutor(max_workers=config.executor_workers)
         self._platform = platform.system()
 
         self._gpio_ready = self._config.enable_gpio and self._platform != "Windows"
         if self._gpio_ready:
             try:
-                import gpiozero  # type: ignore  # pragma: no cover
-
-                self._gpio_lib = gpiozero
+                self._gpio_lib = lazy_import("gpiozero")  # pragma: no cover
             except ImportError:
-                self._gpio_ready = False
                 self._gpio_lib = None
+            self._gpio_ready = self._gpio_lib is not None
         else:
             self._gpio_lib = None
 
-    def register_action(self, name: str, handler: Callable[..., None], *, description: str = "") -> None:
-        self._actions[name.lower()] = HardwareAction(handler=handler, description=description)
+    def register_action(
+        self,
+        name: str,
+        handler: Callable[..., None],
+        *,
+        description: str = "",
+        device: Optional[str] = None,
+        slot: Optional[str] = None,
+    ) -> None:
+        key = name.lower()
+        self._actions[key] = HardwareAction(
+            handler=handler,
+            description=description,
+            device=(device or key).lower(),
+            slot=slot,
+        )
 
     def has_action(self, name: str) -> bool:
         return name.lower() in self._actions
 
-    def execute(self, name: str, **kwargs) -> None:
-        action = self._actions.get(name.lower())
+    def execute(self, name: str, **kwargs) -> Future:
+        """Queue ``name`` on its device and return a future for its result."""
+
+        key = name.lower()
+        action = self._actions.get(key)
         if not action:
             raise KeyError(f"No hardware action registered under '{name}'.")
-        action.handler(**kwargs)
+        if action.state is not None:
+            return self._apply(self._device(action.device), action.state)
+        return self._executor.submit(
+            action.device,
+            lambda: action.handler(**kwargs),
+            name=key,
+            slot=action.slot,
+        )
 
     def summary(self) -> Dict[str, str]:
         return {name: action.description for name, action in self._actions.items()}
 
+    def executor_stats(self) -> ExecutorStats:
+        return self._executor.stats()
+
+    # Devices ----------------------------------------------------------
+    def register_device(
+        self,
+        name: str,
+        *,
+        set_power: Callable[[bool], None],
+        set_level: Optional[Callable[[int], None]] = None,
+        description: str = "",
+        initial: DeviceState = DeviceState(),
+    ) -> None:
+        """Register a device and its ``turn_on_<name>`` / ``turn_off_<name>`` actions."""
+
+        key = name.lower()
+        writers: Dict[str, Callable[..., None]] = {"power": set_power}
+        if set_level is not None:
+            writers["level"] = set_level
+        with self._state_lock:
+            self._devices[key] = Device(
+                name=key,
+                writers=writers,
+                description=description,
+                shadow=initial,
+                desired=initial,
+            )
+        for verb, power in (("turn_on", True), ("turn_off", False)):
+            self._actions[f"{verb}_{key}"] = HardwareAction(
+                handler=set_power,
+                description=description,
+                device=key,
+                slot="power",
+                state=DeviceState(power=power),
+            )
+
+    def has_device(self, name: str) -> bool:
+        return name.lower() in self._devices
+
+    def state(self, name: str, *, confirmed: bool = False) -> DeviceState:
+        """Return a device's state from the shadow without touching the hardware.
+
+        By default queued writes count as applied; pass ``confirmed=True`` for
+        the state of the last write that finished successfully.
+        """
+
+        device = self._device(name)
+        with self._state_lock:
+            return device.shadow if confirmed else device.desired
+
+    def set_state(
+        self, name: str, *, power: Optional[bool] = None, level: Optional[int] = None
+    ) -> Future:
+        """Queue the writes needed to reach the given state; unchanged attributes are skipped."""
+
+        return self._apply(self._device(name), DeviceState(power=power, level=level))
+
+    def define_scene(self, name: str, states: Mapping[str, DeviceState]) -> None:
+        for device in states:
+            self._device(device)
+        self._scenes[name.lower()] = {device.lower(): state for device, state in states.items()}
+
+    def scenes(self) -> List[str]:
+        return sorted(self._scenes)
+
+    def apply_scene(
+        self,
+        scene: Union[str, Mapping[str, DeviceState]],
+        *,
+        timeout: Optional[float] = None,
+    ) -> SceneReport:
+        """Set every device in ``scene`` concurrently and wait for the writes to finish."""
+
+        if isinstance(scene, str):
+            if scene.lower() not in self._scenes:
+                raise KeyError(f"No scene registered under '{scene}'.")
+            scene = self._scenes[scene.lower()]
+        started = time.perf_counter()
+        report = SceneReport()
+        pending: Dict[str, Future] = {}
+        for name, target in scene.items():
+            writes = self._submit(self._device(name), target)
+            if writes:
+                pending[name] = _gather(writes)
+            else:
+                report.skipped.append(name)
+        deadline = None if timeout is None else started + timeout
+        for name, future in pending.items():
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0.0)
+            try:
+                future.result(timeout=remaining)
+            except Exception as exc:
+                report.failed[name] = str(exc) or type(exc).__name__
+            else:
+                report.changed.append(name)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    @property
+    def skipped_writes(self) -> int:
+        """Writes avoided because the device was already in the requested state."""
+
+        return self._skipped_writes
+
+    def close(self) -> None:
+        self._executor.close()
+
+    # ------------------------------------------------------------------
+    def _device(self, name: str) -> Device:
+        device = self._devices.get(name.lower())
+        if device is None:
+            raise KeyError(f"No device registered under '{name}'.")
+        return device
+
+    def _apply(self, device: Device, target: DeviceState) -> Future:
+        return _gather(self._submit(device, target))
+
+    def _submit(self, device: Device, target: DeviceState) -> List[Future]:
+        futures: List[Future] = []
+        with self._state_lock:
+            for attribute, value in target.changes().items():
+                if attribute not in device.writers:
+                    raise ValueError(f"Device '{device.name}' has no {attribute} control.")
+                if getattr(device.desired, attribute) == value:
+                    self._skipped_writes += 1
+                    continue
+                device.desired = replace(device.desired, **{attribute: value})
+                futures.append(
+                    self._executor.submit(
+                        device.name,
+                        lambda attribute=attribute, value=value: self._write(
+                            device, attribute, value
+                        ),
+                        name=f"{device.name}.{attribute}",
+                        slot=attribute,
+                    )
+                )
+        return futures
+
+    def _write(self, device: Device, attribute: str, value: object) -> None:
+        # runs on the device's queue, so writes to one device never interleave
+        try:
+            device.writers[attribute](value)
+        except Exception:
+            with self._state_lock:
+                device.shadow = replace(device.shadow, **{attribute: None})
+                if getattr(device.desired, attribute) == value:
+                    device.desired = replace(device.desired, **{attribute: None})
+            raise
+        with self._state_lock:
+            device.shadow = replace(device.shadow, **{attribute: value})
+
     # Example handlers -------------------------------------------------
     def attach_example_led(self, pin: int, name: str = "desk_lamp") -> None:
         if not self._gpio_ready:
             print("[hardware] GPIO not active; using simulated LED toggle.")
-            self.register_action(
-                f"turn_on_{name}",
-                lambda: print(f"[hardware] {name} -> ON"),
-                description=f"Simulated LED on pin {pin}",
-            )
-            self.register_action(
-                f"turn_off_{name}",
-                lambda: print(f"[hardware] {name} -> OFF"),
+            self.register_device(
+                name,
+                set_power=lambda on: print(f"[hardware] {name} -> {'ON' if on else 'OFF'}"),
                 description=f"Simulated LED on pin {pin}",
             )
             return
 
         led = self._gpio_lib.LED(pin)  # type: ignore[attr-defined]
-        self.register_action(
-            f"turn_on_{name}",
-            led.on,
-            description=f"LED on pin {pin}",
-        )
-        self.register_action(
-            f"turn_off_{name}",
-            led.off,
+        self.register_device(
+            name,
+            set_power=lambda on: led.on() if on else led.off(),
             description=f"LED on pin {pin}",
         )
+
+
+def _gather(futures: List[Future]) -> Future:
+    """Combine ``futures`` into one that fails with the first error, if any."""
+
+    if len(futures) == 1:
+        return futures[0]
+    combined: Future = Future()
+    if not futures:
+        combined.set_result(None)
+        return combined
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def _done(_: Future) -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        errors = [
+            future.exception() for future in futures
+            if not future.cancelled() and future.exception() is not None
+        ]
+        if errors:
+            combined.set_exception(errors[0])
+        else:
+            combined.set_result(None)
+
+    for future in futures:
+        future.add_done_callback(_done)
+    return combined
@@ -0,0 +1,48 @@
+"""Typed device model: writers, cached shadow state and scene reports."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceState:
+    """Known or desired state of a device; ``None`` means unknown or unchanged."""
+
+    power: Optional[bool] = None
+    level: Optional[int] = None
+
+    def changes(self) -> Dict[str, object]:
+        """Return only the attributes that are set."""
+
+        return {
+            item.name: getattr(self, item.name)
+            for item in fields(self)
+            if getattr(self, item.name) is not None
+        }
+
+
+@dataclass(slots=True)
+class Device:
+    """A controllable device with one writer per state attribute.
+
+    ``shadow`` is the last state confirmed by a successful write; ``desired``
+    also includes writes that are queued but not yet done. Both are read
+    without touching the hardware.
+    """
+
+    name: str
+    writers: Dict[str, Callable[..., None]]
+    description: str = ""
+    shadow: DeviceState = field(default_factory=DeviceState)
+    desired: DeviceState = field(default_factory=DeviceState)
+
+
+@dataclass(slots=True)
+class SceneReport:
+    """What applying a scene did and how long it took."""
+
+    changed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    seconds: float = 0.0
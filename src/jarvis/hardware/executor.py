@@ -0,0 +1,160 @@
+"""Background executor that runs device commands off the assistant thread."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from jarvis.telemetry.events import get_event_bus
+from jarvis.telemetry.tracing import TurnTrace, get_tracer
+from jarvis.utils.logger import get_logger
+
+
+@dataclass(slots=True)
+class ExecutorStats:
+    """Counters for submitted, executed, coalesced and failed device commands."""
+
+    submitted: int = 0
+    executed: int = 0
+    coalesced: int = 0
+    failed: int = 0
+
+
+@dataclass(slots=True)
+class _Command:
+    device: str
+    name: str
+    slot: Optional[str]
+    run: Callable[[], Any]
+    future: Future
+    # futures of pending commands this one replaced; they resolve with it
+    superseded: List[Future] = field(default_factory=list)
+    # the turn that issued the command, so its span lands in that trace
+    trace: Optional[TurnTrace] = None
+
+
+class DeviceExecutor:
+    """Run commands on a thread pool with one ordered queue per device.
+
+    Commands for the same device execute one at a time in submission order,
+    while different devices proceed in parallel. A command tagged with a
+    ``slot`` (for example ``"power"``) replaces any still-pending command for
+    the same device and slot, so a burst of on, off, on collapses into a
+    single on. Every submission returns a :class:`~concurrent.futures.Future`;
+    a coalesced command's future resolves with the command that replaced it.
+    Wrap it with :func:`asyncio.wrap_future` to await it.
+    """
+
+    def __init__(self, *, max_workers: int = 4) -> None:
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="jarvis-device"
+        )
+        self._queues: Dict[str, Deque[_Command]] = {}
+        self._active: Set[str] = set()
+        self._stats = ExecutorStats()
+        self._lock = threading.Lock()
+        self._log = get_logger("jarvis.hardware")
+        self._tracer = get_tracer()
+        self._events = get_event_bus()
+
+    def submit(
+        self,
+        device: str,
+        run: Callable[[], Any],
+        *,
+        name: str = "",
+        slot: Optional[str] = None,
+    ) -> Future:
+        command = _Command(
+            device=device,
+            name=name or device,
+            slot=slot,
+            run=run,
+            future=Future(),
+            trace=self._tracer.current(),
+        )
+        with self._lock:
+            self._stats.submitted += 1
+            queue = self._queues.setdefault(device, deque())
+            if slot is not None:
+                for pending in [item for item in queue if item.slot == slot]:
+                    queue.remove(pending)
+                    command.superseded.extend([pending.future, *pending.superseded])
+                    self._stats.coalesced += 1
+            queue.append(command)
+            if device not in self._active:
+                self._active.add(device)
+                self._pool.submit(self._drain, device)
+        return command.future
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                submitted=self._stats.submitted,
+                executed=self._stats.executed,
+                coalesced=self._stats.coalesced,
+                failed=self._stats.failed,
+            )
+
+    def pending(self, device: str) -> int:
+        with self._lock:
+            return len(self._queues.get(device, ()))
+
+    def close(self, *, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    # ------------------------------------------------------------------
+    def _drain(self, device: str) -> None:
+        while True:
+            with self._lock:
+                queue = self._queues[device]
+                if not queue:
+                    self._active.discard(device)
+                    return
+                command = queue.popleft()
+            self._execute(command)
+
+    def _execute(self, command: _Command) -> None:
+        futures = [
+            future
+            for future in (command.future, *command.superseded)
+            if future.set_running_or_notify_cancel()
+        ]
+        if not futures:
+            return  # every caller cancelled
+        span = self._tracer.span("hardware", command.trace)
+        started = time.perf_counter()
+        try:
+            result = command.run()
+        except Exception as exc:
+            span.end(failed=True)
+            self._publish(command, started, error=exc)
+            self._log.error("Device command %s failed: %s", command.name, exc)
+            with self._lock:
+                self._stats.executed += 1
+                self._stats.failed += 1
+            for future in futures:
+                future.set_exception(exc)
+            return
+        span.end()
+        self._publish(command, started)
+        with self._lock:
+            self._stats.executed += 1
+        for future in futures:
+            future.set_result(result)
+
+    def _publish(
+        self, command: _Command, started: float, *, error: Optional[Exception] = None
+    ) -> None:
+        self._events.publish(
+            "hardware",
+            device=command.device,
+            command=command.name,
+            ok=error is None,
+            error=None if error is None else str(error),
+            seconds=time.perf_counter() - started,
+            turn=command.trace.id if command.trace is not None else None,
+        )
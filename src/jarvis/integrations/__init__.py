@@ -1,5 +1,20 @@
 """External service integrations for JARVIS."""
 
-from jarvis.integrations.openai_client import OpenAIClient
+from jarvis.integrations.model_router import ModelChoice, ModelRouter, ModelStats
+from jarvis.integrations.openai_client import OpenAIClient, ToolCall, ToolPlan
+from jarvis.integrations.response_cache import CacheStats, ResponseCache
+from jarvis.integrations.transport import CircuitOpenError, ResilientTransport, TransportMetrics
 
-__all__ = ["OpenAIClient"]
+__all__ = [
+    "CacheStats",
+    "CircuitOpenError",
+    "ModelChoice",
+    "ModelRouter",
+    "ModelStats",
+    "OpenAIClient",
+    "ResilientTransport",
+    "ResponseCache",
+    "ToolCall",
+    "ToolPlan",
+    "TransportMetrics",
+]
@@ -0,0 +1,281 @@
+"""Choose the chat model and token budget per request from complexity and live latency."""
+from __future__ import annotations
+
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, Optional, TypeVar
+
+from jarvis.config import OpenAIConfig
+from jarvis.utils.logger import get_logger
+
+T = TypeVar("T")
+
+# weight of the newest sample in the per-model moving averages
+_SMOOTHING = 0.3
+# a model avoided for being slow or failing gets another chance after this long
+_RECHECK_SECONDS = 30.0
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_CODE_OR_MATH_RE = re.compile(r"```|\b\w+\(.*\)|\d\s*[-+*/^%=]\s*\d")
+_SMALL_TALK = {
+    "hi",
+    "hello",
+    "hey",
+    "thanks",
+    "thank you",
+    "good morning",
+    "good evening",
+    "good night",
+    "how are you",
+    "what's up",
+    "bye",
+    "goodbye",
+}
+_COMPLEX_CUES = {
+    "why",
+    "how",
+    "explain",
+    "compare",
+    "difference",
+    "analyze",
+    "analyse",
+    "summarize",
+    "summarise",
+    "plan",
+    "write",
+    "code",
+    "function",
+    "script",
+    "algorithm",
+    "debug",
+    "derive",
+    "calculate",
+    "prove",
+    "recommend",
+    "pros",
+    "cons",
+    "step",
+    "steps",
+}
+
+
+def estimate_complexity(prompt: str, history: Iterable[dict] = ()) -> float:
+    """Score how demanding ``prompt`` looks, from 0 (small talk) to 1.
+
+    A cheap heuristic, not a classifier: longer requests, words that ask for
+    reasoning or writing ("why", "explain", "compare", "write"), code or
+    arithmetic, several sentences and follow-ups to an earlier exchange all
+    push the score up.
+    """
+
+    words = _WORD_RE.findall(prompt.lower())
+    if not words or " ".join(words) in _SMALL_TALK:
+        return 0.0
+    score = 0.4 * min(len(words) / 25, 1.0)
+    score += 0.3 * min(sum(1 for word in words if word in _COMPLEX_CUES), 2)
+    if _CODE_OR_MATH_RE.search(prompt):
+        score += 0.3
+    if len([part for part in re.split(r"[.?!]+", prompt) if part.strip()]) > 1:
+        score += 0.1
+    if any(True for _ in history):
+        score += 0.1
+    return min(score, 1.0)
+
+
+@dataclass(slots=True)
+class ModelChoice:
+    """Which model answers a request, with what budget, and who backs it up."""
+
+    model: str
+    max_tokens: int
+    complexity: float
+    # the other model, asked when ``model`` fails or runs late; None with only one model
+    fallback: Optional[str]
+    # "simple" or "complex", or "slow"/"failing" when the usual model was avoided
+    reason: str
+
+
+@dataclass(slots=True)
+class ModelStats:
+    """Live counters and moving averages for one model."""
+
+    chosen: int = 0
+    requests: int = 0
+    errors: int = 0
+    # times a slow or failed answer from this model was backed up by the other one
+    hedged: int = 0
+    # times this model's answer was used in place of the one it backed up
+    rescues: int = 0
+    latency_seconds: Optional[float] = None
+    error_rate: float = 0.0
+    updated_at: float = 0.0
+
+
+class ModelRouter:
+    """Route each chat request to the fast or the smart model and keep it on time.
+
+    :meth:`choose` sends small talk to ``fast_model`` with a short token
+    budget and involved questions to ``smart_model`` with the full one, unless
+    the live statistics say that model is currently slower than the deadline
+    or failing, in which case the other one is used. :meth:`run` then makes
+    the call: if it fails, the other model is asked instead (escalating from
+    fast to smart, or retrying on the faster one); if nothing has come back
+    once ``hedge_after`` of the deadline has passed, the other model is asked
+    too and whichever answers first is used.
+    """
+
+    def __init__(self, config: OpenAIConfig) -> None:
+        routing = config.routing
+        self._config = routing
+        self._fast = routing.fast_model or config.model
+        self._smart = routing.smart_model or config.model
+        self._smart_tokens = config.response_max_tokens
+        self._fast_tokens = min(routing.fast_max_tokens, config.response_max_tokens)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, ModelStats] = {}
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(4, 2 * config.transport.max_connections),
+            thread_name_prefix="jarvis-router",
+        )
+        self._log = get_logger("jarvis.router")
+
+    def choose(self, prompt: str, history: Iterable[dict] = ()) -> ModelChoice:
+        complexity = estimate_complexity(prompt, history)
+        involved = complexity >= self._config.complexity_threshold
+        model, other = (self._smart, self._fast) if involved else (self._fast, self._smart)
+        choice = ModelChoice(
+            model=model,
+            max_tokens=self._smart_tokens if involved else self._fast_tokens,
+            complexity=complexity,
+            fallback=other if other != model else None,
+            reason="complex" if involved else "simple",
+        )
+        if choice.fallback is not None:
+            problem = self._problem(model)
+            if problem is not None and self._problem(choice.fallback) is None:
+                choice = replace(choice, model=choice.fallback, fallback=model, reason=problem)
+        with self._lock:
+            self._stats.setdefault(choice.model, ModelStats()).chosen += 1
+        self._log.debug(
+            "Routing to %s (%s, complexity %.2f, %d tokens).",
+            choice.model,
+            choice.reason,
+            complexity,
+            choice.max_tokens,
+        )
+        return choice
+
+    def run(
+        self,
+        choice: ModelChoice,
+        attempt: Callable[[str, int], T],
+        *,
+        discard: Optional[Callable[[T], None]] = None,
+    ) -> T:
+        """Call ``attempt(model, max_tokens)`` and fall back or hedge as described above.
+
+        ``discard`` receives a result that finished but was not used, for
+        example a stream opened by the slower model, so it can be closed.
+        """
+
+        if choice.fallback is None:
+            return self._timed(choice.model, attempt, choice.max_tokens)
+
+        primary = self._pool.submit(self._timed, choice.model, attempt, choice.max_tokens)
+        hedge_at = self._config.deadline_seconds * self._config.hedge_after
+        done, _ = wait([primary], timeout=hedge_at)
+        if primary in done and primary.exception() is None:
+            return primary.result()
+
+        self._count_hedge(choice.model)
+        if primary in done:
+            self._log.warning(
+                "%s failed (%s); asking %s instead.",
+                choice.model,
+                primary.exception(),
+                choice.fallback,
+            )
+        else:
+            self._log.info(
+                "%s has not answered after %.1fs; asking %s too.",
+                choice.model,
+                hedge_at,
+                choice.fallback,
+            )
+        backup = self._pool.submit(self._timed, choice.fallback, attempt, choice.max_tokens)
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda item: item is not primary):
+                error = future.exception()
+                if error is not None:
+                    continue
+                if future is backup:
+                    self._count_rescue(choice.fallback)
+                for loser in pending:
+                    loser.add_done_callback(lambda late: self._discard(late, discard))
+                for extra in done - {future}:
+                    self._discard(extra, discard)
+                return future.result()
+        assert error is not None
+        raise error
+
+    def stats(self) -> Dict[str, ModelStats]:
+        with self._lock:
+            return {model: replace(stats) for model, stats in self._stats.items()}
+
+    # ------------------------------------------------------------------
+    def _timed(self, model: str, attempt: Callable[[str, int], T], max_tokens: int) -> T:
+        started = time.perf_counter()
+        try:
+            result = attempt(model, max_tokens)
+        except Exception:
+            self._record(model, None)
+            raise
+        self._record(model, time.perf_counter() - started)
+        return result
+
+    def _record(self, model: str, seconds: Optional[float]) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(model, ModelStats())
+            stats.requests += 1
+            stats.updated_at = time.monotonic()
+            failed = 1.0 if seconds is None else 0.0
+            stats.error_rate += _SMOOTHING * (failed - stats.error_rate)
+            if seconds is None:
+                stats.errors += 1
+            elif stats.latency_seconds is None:
+                stats.latency_seconds = seconds
+            else:
+                stats.latency_seconds += _SMOOTHING * (seconds - stats.latency_seconds)
+
+    def _problem(self, model: str) -> Optional[str]:
+        with self._lock:
+            stats = self._stats.get(model)
+            if stats is None or time.monotonic() - stats.updated_at > _RECHECK_SECONDS:
+                return None
+            if stats.error_rate > self._config.max_error_rate:
+                return "failing"
+            if (stats.latency_seconds or 0.0) > self._config.deadline_seconds:
+                return "slow"
+            return None
+
+    def _count_hedge(self, model: str) -> None:
+        with self._lock:
+            self._stats.setdefault(model, ModelStats()).hedged += 1
+
+    def _count_rescue(self, model: str) -> None:
+        with self._lock:
+            self._stats.setdefault(model, ModelStats()).rescues += 1
+
+    def _discard(self, future: Future, discard: Optional[Callable[[T], None]]) -> None:
+        if discard is None or future.cancelled() or future.exception() is not None:
+            return
+        try:
+            discard(future.result())
+        except Exception as exc:  # pragma: no cover - best effort
+            self._log.debug("Discarding an unused reply failed: %s", exc)
@@ -1,25 +1,161 @@
 """Wrapper around the OpenAI SDK for text and audio tasks."""
 from __future__ import annotations
 
+import hashlib
+import json
+import socket
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
-from openai import OpenAI
+from jarvis.config import OpenAIConfig
+from jarvis.integrations.model_router import ModelChoice, ModelRouter, ModelStats
+from jarvis.integrations.response_cache import CacheStats, ResponseCache, make_cache_key
+from jarvis.integrations.transport import (
+    CircuitOpenError,
+    ResilientTransport,
+    TransportMetrics,
+    build_http_client,
+)
+from jarvis.utils.cancellation import abortable
+from jarvis.utils.logger import get_logger
+from jarvis.utils.singleflight import FlightStats, SingleFlight, SingleFlightStream
+from jarvis.utils.startup import lazy_import
 
-try:  # pragma: no cover - import path differs by SDK version
-    from openai import OpenAIError  # type: ignore[attr-defined]
-except ImportError:  # pragma: no cover
-    from openai.error import OpenAIError  # type: ignore[no-redef]
+if TYPE_CHECKING:  # pragma: no cover
+    from openai import OpenAI
+
+_WARM_UP_TIMEOUT = 5.0
+_TRANSIENT_NAMES = (
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+)
+
+
+def _openai() -> Any:
+    # the SDK takes a noticeable share of startup, so it loads on first use
+    module = lazy_import("openai")
+    if module is None:
+        raise RuntimeError("The openai package is not installed.")
+    return module
+
+
+def _openai_error() -> Type[BaseException]:
+    module = _openai()
+    if hasattr(module, "OpenAIError"):
+        return module.OpenAIError
+    return lazy_import("openai.error").OpenAIError  # type: ignore[union-attr]  # pragma: no cover
+
+
+def _transient_errors() -> Tuple[Type[BaseException], ...]:
+    module = _openai()
+    return tuple(getattr(module, name) for name in _TRANSIENT_NAMES if hasattr(module, name))
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, _transient_errors()):
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def _abort_stream(stream: Any) -> None:
+    """Drop a streaming response's connection so a read blocked on it fails at once.
+
+    Closing the response alone does not wake a thread already waiting for the
+    next token; shutting the socket down does, and tells the server to stop.
+    """
+
+    response = getattr(stream, "response", None)
+    network = response.extensions.get("network_stream") if response is not None else None
+    sock = network.get_extra_info("socket") if network is not None else None
+    if sock is None:
+        stream.close()
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # already closed
 
-from jarvis.config import OpenAIConfig
+
+@dataclass(slots=True)
+class ToolCall:
+    """One function call requested by the model."""
+
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    id: str = ""
+
+
+@dataclass(slots=True)
+class ToolPlan:
+    """A completion that may contain prose, tool calls, or both."""
+
+    calls: List[ToolCall] = field(default_factory=list)
+    text: Optional[str] = None
 
 
 class OpenAIClient:
-    """Thin convenience layer to centralize OpenAI interactions."""
+    """Thin convenience layer to centralize OpenAI interactions.
+
+    Identical chat, streaming and transcription requests made at the same
+    time (several sessions asking the same question, a quick retry) share
+    one upstream call; see :meth:`flight_stats`. With model routing enabled,
+    chat replies come from the fast or the smart model as chosen by a
+    :class:`ModelRouter`; see :meth:`router_stats`.
+    """
 
     def __init__(self, config: OpenAIConfig) -> None:
         self._config = config
-        self._client = OpenAI(api_key=config.api_key)
+        self._log = get_logger("jarvis.openai")
+        transport_config = config.transport
+        self._transport = ResilientTransport(transport_config, retryable=_is_transient)
+        self._sdk_client: Optional["OpenAI"] = None
+        self._sdk_lock = threading.Lock()
+        self._chat_flight: SingleFlight[str] = SingleFlight()
+        self._stream_flight: SingleFlightStream[str] = SingleFlightStream()
+        self._transcription_flight: SingleFlight[str] = SingleFlight()
+        self._router = ModelRouter(config) if config.routing.enabled else None
+
+        cache_config = config.cache
+        self._cache: Optional[ResponseCache] = None
+        if cache_config.enabled:
+            self._cache = ResponseCache(
+                path=cache_config.path,
+                ttl_seconds=cache_config.ttl_seconds,
+                max_memory_entries=cache_config.max_memory_entries,
+                max_disk_bytes=cache_config.max_disk_bytes,
+            )
+
+        if transport_config.warm_up:
+            threading.Thread(target=self.warm_up, name="jarvis-openai-warmup", daemon=True).start()
+
+    def warm_up(self) -> bool:
+        """Load the SDK and open a pooled connection (DNS, TCP, TLS) before the first request."""
+
+        try:
+            self._client.models.list(timeout=_WARM_UP_TIMEOUT)
+        except Exception as exc:  # pragma: no cover - best effort
+            self._log.debug("OpenAI warm-up failed: %s", exc)
+            return False
+        return True
 
     def generate_response(
         self,
@@ -30,21 +166,222 @@ class OpenAIClient:
     ) -> str:
         """Request a chat completion from the configured model."""
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        if conversation_history:
-            messages.extend(conversation_history)
-        messages.append({"role": "user", "content": prompt})
+        history = list(conversation_history or [])
+        choice = self._choose(prompt, history)
+        cache_key = self._cache_key(prompt, system_prompt, history, choice)
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)  # type: ignore[union-attr]
+            if cached is not None:
+                return cached
+
+        messages = self._build_messages(prompt, system_prompt, history)
+        return self._chat_flight.do(
+            self._flight_key(prompt, system_prompt, history, choice),
+            lambda: self._routed_complete(messages, cache_key, choice),
+        )
+
+    def plan_tool_calls(
+        self,
+        prompt: str,
+        *,
+        tools: Sequence[dict],
+        system_prompt: Optional[str] = None,
+        conversation_history: Optional[Iterable[dict]] = None,
+    ) -> ToolPlan:
+        """Ask the model for every tool call needed to satisfy ``prompt`` in one completion."""
+
+        messages = self._build_messages(prompt, system_prompt, list(conversation_history or []))
+        try:
+            response = self._transport.call(
+                lambda timeout: self._client.chat.completions.create(
+                    model=self._config.model,
+                    messages=messages,
+                    temperature=self._config.temperature,
+                    max_tokens=self._config.response_max_tokens,
+                    tools=list(tools),
+                    tool_choice="auto",
+                    parallel_tool_calls=True,
+                    timeout=timeout,
+                )
+            )
+        except CircuitOpenError:
+            self._log.warning("OpenAI circuit open; answering with the canned response.")
+            return ToolPlan(text=self._config.transport.canned_response)
+        except _openai_error() as exc:
+            raise RuntimeError(f"OpenAI chat completion failed: {exc}") from exc
+
+        if not response.choices:
+            raise RuntimeError("OpenAI returned no completion choices.")
+        message = response.choices[0].message
+        plan = ToolPlan(text=message.content or None)
+        for call in message.tool_calls or []:
+            try:
+                arguments = json.loads(call.function.arguments or "{}")
+            except json.JSONDecodeError:
+                self._log.warning(
+                    "Dropping tool call %s with malformed arguments.", call.function.name
+                )
+                continue
+            plan.calls.append(ToolCall(name=call.function.name, arguments=arguments, id=call.id))
+        return plan
+
+    def stream_response(
+        self,
+        prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
+        conversation_history: Optional[Iterable[dict]] = None,
+    ) -> Iterator[str]:
+        """Yield completion text deltas as the model produces them.
+
+        Use :meth:`generate_response` when the whole string is needed at once.
+        """
+
+        history = list(conversation_history or [])
+        choice = self._choose(prompt, history)
+        cache_key = self._cache_key(prompt, system_prompt, history, choice)
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)  # type: ignore[union-attr]
+            if cached is not None:
+                yield cached
+                return
+
+        messages = self._build_messages(prompt, system_prompt, history)
+        yield from self._stream_flight.stream(
+            self._flight_key(prompt, system_prompt, history, choice),
+            lambda: self._routed_stream(messages, cache_key, choice),
+        )
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Return response cache counters, or ``None`` when caching is disabled."""
 
+        return self._cache.stats() if self._cache else None
+
+    def transport_metrics(self) -> TransportMetrics:
+        """Return connection, retry and circuit breaker counters."""
+
+        return self._transport.metrics()
+
+    def flight_stats(self) -> Dict[str, FlightStats]:
+        """Upstream calls made and calls saved by sharing one already in flight."""
+
+        return {
+            "chat": self._chat_flight.stats(),
+            "chat_stream": self._stream_flight.stats(),
+            "transcription": self._transcription_flight.stats(),
+        }
+
+    def router_stats(self) -> Optional[Dict[str, ModelStats]]:
+        """Per-model routing counters and latency, or ``None`` when routing is disabled."""
+
+        return self._router.stats() if self._router else None
+
+    def transcribe_audio(
+        self,
+        audio: Union[Path, bytes, bytearray, memoryview, BinaryIO],
+        *,
+        model: str = "whisper-1",
+        filename: str = "audio.wav",
+    ) -> str:
+        """Send audio to the Whisper API and return the transcript.
+
+        ``audio`` may be a file path, raw encoded bytes, or a readable binary
+        buffer; bytes and buffers are uploaded straight from memory.
+        ``filename`` tells the API which container/codec the bytes use.
+        """
+
+        if isinstance(audio, Path):
+            payload, filename = audio.read_bytes(), audio.name
+        else:
+            payload = audio.read() if hasattr(audio, "read") else bytes(audio)
+        key = (model, filename, hashlib.sha256(payload).hexdigest())
+        return self._transcription_flight.do(
+            key, lambda: self._transcribe(payload, model=model, filename=filename)
+        )
+
+    def close(self) -> None:
+        """Write pending cache bookkeeping to disk and close the cache."""
+
+        if self._cache is not None:
+            self._cache.close()
+
+    # ------------------------------------------------------------------
+    def _choose(self, prompt: str, history: List[dict]) -> Optional[ModelChoice]:
+        return self._router.choose(prompt, history) if self._router else None
+
+    def _routed_complete(
+        self, messages: List[dict], cache_key: Optional[str], choice: Optional[ModelChoice]
+    ) -> str:
+        if choice is None:
+            return self._complete(
+                messages, cache_key, self._config.model, self._config.response_max_tokens
+            )
+        try:
+            return self._router.run(  # type: ignore[union-attr]
+                choice,
+                lambda model, max_tokens: self._complete(
+                    messages, cache_key, model, max_tokens, circuit=model
+                ),
+            )
+        except CircuitOpenError:
+            self._log.warning("OpenAI circuits open; answering with the canned response.")
+            return self._config.transport.canned_response
+
+    def _routed_stream(
+        self, messages: List[dict], cache_key: Optional[str], choice: Optional[ModelChoice]
+    ) -> Iterator[str]:
+        if choice is None:
+            yield from self._stream_completion(
+                messages, cache_key, self._config.model, self._config.response_max_tokens
+            )
+            return
+        # the models race to the first token; the rest of the winner's stream follows
         try:
-            response = self._client.chat.completions.create(
-                model=self._config.model,
-                messages=messages,
-                temperature=self._config.temperature,
-                max_tokens=self._config.response_max_tokens,
+            first, chunks = self._router.run(  # type: ignore[union-attr]
+                choice,
+                lambda model, max_tokens: self._open_stream(messages, cache_key, model, max_tokens),
+                discard=lambda opened: opened[1].close(),
             )
-        except OpenAIError as exc:
+        except CircuitOpenError:
+            self._log.warning("OpenAI circuits open; answering with the canned response.")
+            yield self._config.transport.canned_response
+            return
+        if first is not None:
+            yield first
+            yield from chunks
+
+    def _open_stream(
+        self, messages: List[dict], cache_key: Optional[str], model: str, max_tokens: int
+    ) -> Tuple[Optional[str], Generator[str, None, None]]:
+        chunks = self._stream_completion(messages, cache_key, model, max_tokens, circuit=model)
+        return next(chunks, None), chunks
+
+    def _complete(
+        self,
+        messages: List[dict],
+        cache_key: Optional[str],
+        model: str,
+        max_tokens: int,
+        *,
+        circuit: Optional[str] = None,
+    ) -> str:
+        try:
+            response = self._transport.call(
+                lambda timeout: self._client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=self._config.temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout,
+                ),
+                circuit=circuit,
+            )
+        except CircuitOpenError:
+            if circuit is not None:
+                raise  # this model's circuit only; the router asks the other one
+            self._log.warning("OpenAI circuit open; answering with the canned response.")
+            return self._config.transport.canned_response
+        except _openai_error() as exc:
             raise RuntimeError(f"OpenAI chat completion failed: {exc}") from exc
 
         if not response.choices:
@@ -53,20 +390,67 @@ class OpenAIClient:
         message = response.choices[0].message
         if not message or not message.content:
             raise RuntimeError("OpenAI completion contained no message content.")
+        if cache_key is not None:
+            self._cache.put(cache_key, message.content)  # type: ignore[union-attr]
         return message.content
 
-    def transcribe_audio(
-        self, audio_path: Path, *, model: str = "whisper-1"
-    ) -> str:
-        """Send an audio file to the Whisper API and return the transcript."""
+    def _stream_completion(
+        self,
+        messages: List[dict],
+        cache_key: Optional[str],
+        model: str,
+        max_tokens: int,
+        *,
+        circuit: Optional[str] = None,
+    ) -> Generator[str, None, None]:
+        parts: List[str] = []
+        try:
+            # only opening the stream is retried; a reply cannot be retried once spoken
+            stream = self._transport.call(
+                lambda timeout: self._client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=self._config.temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    timeout=timeout,
+                ),
+                circuit=circuit,
+            )
+        except CircuitOpenError:
+            if circuit is not None:
+                raise
+            self._log.warning("OpenAI circuit open; answering with the canned response.")
+            yield self._config.transport.canned_response
+            return
+        except _openai_error() as exc:
+            raise RuntimeError(f"OpenAI chat completion failed: {exc}") from exc
+        try:
+            # a cancelled reader (e.g. a dropped speculative request) aborts the connection
+            for chunk in abortable(stream, lambda: _abort_stream(stream)):
+                if not chunk.choices:
+                    continue
+                content = getattr(chunk.choices[0].delta, "content", None)
+                if content:
+                    parts.append(content)
+                    yield content
+        except _openai_error() as exc:
+            raise RuntimeError(f"OpenAI chat completion failed: {exc}") from exc
+        finally:
+            stream.close()
+        if cache_key is not None and parts:
+            self._cache.put(cache_key, "".join(parts))  # type: ignore[union-attr]
 
+    def _transcribe(self, payload: bytes, *, model: str, filename: str) -> str:
         try:
-            with audio_path.open("rb") as handle:
-                transcript = self._client.audio.transcriptions.create(
+            transcript = self._transport.call(
+                lambda timeout: self._client.audio.transcriptions.create(
                     model=model,
-                    file=handle,
+                    file=(filename, payload),
+                    timeout=timeout,
                 )
-        except OpenAIError as exc:
+            )
+        except _openai_error() as exc:
             raise RuntimeError(f"Audio transcription failed: {exc}") from exc
 
         text = getattr(transcript, "text", None) or getattr(transcript, "data", None)
@@ -75,3 +459,80 @@ class OpenAIClient:
         if isinstance(text, dict) and "text" in text:
             return str(text["text"])
         raise RuntimeError("Unexpected response format from Whisper API.")
+
+    @property
+    def _client(self) -> "OpenAI":
+        """The SDK client, created (and ``openai`` imported) on first use."""
+
+        if self._sdk_client is None:
+            with self._sdk_lock:
+                if self._sdk_client is None:
+                    transport_config = self._config.transport
+                    self._sdk_client = _openai().OpenAI(
+                        api_key=self._config.api_key,
+                        base_url=transport_config.base_url,
+                        max_retries=0,  # retries are handled by ResilientTransport
+                        timeout=transport_config.request_timeout,
+                        http_client=build_http_client(transport_config, self._transport),
+                    )
+        return self._sdk_client
+
+    def _cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        history: List[dict],
+        choice: Optional[ModelChoice],
+    ) -> Optional[str]:
+        if self._cache is None:
+            return None
+        cache_config = self._config.cache
+        if history and cache_config.history_turns <= 0:
+            return None
+        if self._config.temperature > cache_config.max_temperature:
+            return None
+        # only the latest exchanges; see ResponseCacheConfig.history_turns
+        recent = history[-2 * cache_config.history_turns :] if history else []
+        return make_cache_key(
+            prompt,
+            system_prompt=system_prompt,
+            model=self._config.model,
+            temperature=self._config.temperature,
+            max_tokens=self._max_tokens(choice),
+            conversation_history=recent,
+        )
+
+    def _flight_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        history: List[dict],
+        choice: Optional[ModelChoice],
+    ) -> str:
+        # identical requests only: the whole history, whether or not the cache applies
+        return make_cache_key(
+            prompt,
+            system_prompt=system_prompt,
+            model=self._config.model,
+            temperature=self._config.temperature,
+            max_tokens=self._max_tokens(choice),
+            conversation_history=history,
+        )
+
+    def _max_tokens(self, choice: Optional[ModelChoice]) -> int:
+        # a routed reply is keyed on its token budget, not on the model that won the race
+        return choice.max_tokens if choice is not None else self._config.response_max_tokens
+
+    @staticmethod
+    def _build_messages(
+        prompt: str,
+        system_prompt: Optional[str],
+        conversation_history: Optional[Iterable[dict]],
+    ) -> List[dict]:
+        messages: List[dict] = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        if conversation_history:
+            messages.extend(conversation_history)
+        messages.append({"role": "user", "content": prompt})
+        return messages
@@ -0,0 +1,226 @@
+"""Two-tier (memory + SQLite) cache for ChatGPT fallback responses."""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+# memory-tier hits are written back to the disk tier's ``accessed`` column in batches
+_TOUCH_BATCH = 32
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Hit and miss counters for a :class:`ResponseCache`."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case-fold, collapse whitespace and drop trailing punctuation."""
+
+    return _WHITESPACE.sub(" ", prompt).strip().rstrip("?!. ").lower()
+
+
+def make_cache_key(
+    prompt: str,
+    *,
+    system_prompt: Optional[str],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    conversation_history: Optional[Iterable[dict]] = None,
+) -> str:
+    payload = json.dumps(
+        [
+            normalize_prompt(prompt),
+            system_prompt or "",
+            model,
+            round(float(temperature), 4),
+            int(max_tokens),
+            list(conversation_history or []),
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """LRU memory tier in front of an optional SQLite tier that survives restarts.
+
+    Entries expire after ``ttl_seconds``. The memory tier holds at most
+    ``max_memory_entries`` responses; the disk tier evicts least recently used
+    rows once their combined size exceeds ``max_disk_bytes``. Hits served by
+    the memory tier refresh a row's ``accessed`` time too, batched and written
+    at the latest before the next eviction, so the hottest entries go last.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Optional[Path] = None,
+        ttl_seconds: float = 24 * 3600,
+        max_memory_entries: int = 256,
+        max_disk_bytes: int = 8 * 1024 * 1024,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_memory_entries = max(0, max_memory_entries)
+        self._max_disk_bytes = max(0, max_disk_bytes)
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        # key -> time of the latest memory hit not yet written to the disk tier
+        self._touched: Dict[str, float] = {}
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("DELETE FROM responses WHERE created < ?", (time.time() - self._ttl,))
+            self._db.commit()
+            row = self._db.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM responses").fetchone()
+            self._disk_bytes = int(row[0])
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created = entry
+                if now - created <= self._ttl:
+                    self._memory.move_to_end(key)
+                    self._stats.memory_hits += 1
+                    if self._db is not None:
+                        self._touched[key] = now
+                        if len(self._touched) >= _TOUCH_BATCH:
+                            self._flush_touched()
+                            self._db.commit()
+                    return value
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, created = row
+                    if now - created <= self._ttl:
+                        self._db.execute(
+                            "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                        )
+                        self._db.commit()
+                        self._remember(key, value, created)
+                        self._stats.disk_hits += 1
+                        return value
+                    self._delete_row(key, value)
+
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self._stats.stores += 1
+            if self._db is None:
+                return
+            previous = self._db.execute(
+                "SELECT LENGTH(value) FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if previous is not None:
+                self._disk_bytes -= int(previous[0])
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created, accessed)"
+                " VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._disk_bytes += len(value)
+            self._touched.pop(key, None)
+            self._flush_touched()
+            self._evict_disk()
+            self._db.commit()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                memory_hits=self._stats.memory_hits,
+                disk_hits=self._stats.disk_hits,
+                misses=self._stats.misses,
+                stores=self._stats.stores,
+                evictions=self._stats.evictions,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._flush_touched()
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    # ------------------------------------------------------------------
+    def _remember(self, key: str, value: str, created: float) -> None:
+        if not self._max_memory_entries:
+            return
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _flush_touched(self) -> None:
+        assert self._db is not None
+        if self._touched:
+            self._db.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _delete_row(self, key: str, value: str) -> None:
+        assert self._db is not None
+        self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._db.commit()
+        self._disk_bytes -= len(value)
+
+    def _evict_disk(self) -> None:
+        assert self._db is not None
+        if self._disk_bytes <= self._max_disk_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT key, LENGTH(value) FROM responses ORDER BY accessed ASC"
+        ).fetchall()
+        for key, size in rows:
+            if self._disk_bytes <= self._max_disk_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._disk_bytes -= int(size)
+            self._stats.evictions += 1
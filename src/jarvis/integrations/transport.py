@@ -0,0 +1,219 @@
+"""Resilient HTTP transport: pooling, deadlines, retries, and circuit breaking."""
+from __future__ import annotations
+
+import dataclasses
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from jarvis.config import TransportConfig
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling upstream while the circuit breaker is open."""
+
+
+@dataclass(slots=True)
+class TransportMetrics:
+    """Counters describing connection reuse and retry behaviour."""
+
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    short_circuits: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    circuit_state: str = CLOSED
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    def __init__(self, *, max_retries: int, base_delay: float, max_delay: float) -> None:
+        self.max_retries = max(0, max_retries)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        ceiling = min(self._max_delay, self._base_delay * (2**attempt))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Open after ``failure_threshold`` consecutive failures; probe after ``reset_seconds``.
+
+    While open every call fails fast. Once the reset period has passed a
+    single probe is let through (half-open); its outcome closes or re-opens
+    the circuit.
+    """
+
+    def __init__(self, *, failure_threshold: int, reset_seconds: float) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_seconds = reset_seconds
+        self._failures = 0
+        self._changed_at = 0.0
+        self._state = CLOSED
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if time.monotonic() - self._changed_at < self._reset_seconds:
+                return False
+            # reset period elapsed (or a probe went missing): let one probe through
+            self._state = HALF_OPEN
+            self._changed_at = time.monotonic()
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = OPEN
+                self._changed_at = time.monotonic()
+
+
+class ResilientTransport:
+    """Run upstream calls under a deadline with retries and a circuit breaker.
+
+    ``retryable`` decides which exceptions are transient (timeouts, connection
+    resets, 429/5xx). Only those count against the breaker; anything else is
+    re-raised immediately. Calls may name a ``circuit`` to get a breaker of
+    their own, so one failing model does not cut off another.
+    """
+
+    def __init__(
+        self, config: TransportConfig, *, retryable: Callable[[BaseException], bool]
+    ) -> None:
+        self._config = config
+        self._retryable = retryable
+        self._retry = RetryPolicy(
+            max_retries=config.max_retries,
+            base_delay=config.backoff_base_seconds,
+            max_delay=config.backoff_max_seconds,
+        )
+        self._breaker = self._new_breaker()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._metrics = TransportMetrics()
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        operation: Callable[[float], T],
+        *,
+        deadline: Optional[float] = None,
+        circuit: Optional[str] = None,
+    ) -> T:
+        """Call ``operation(timeout)`` until it succeeds or retries/deadline run out.
+
+        ``deadline`` is a per-call budget in seconds (defaults to the configured
+        request timeout); each attempt receives whatever budget remains.
+        ``circuit`` selects a separate breaker; by default all calls share one.
+        """
+
+        breaker = self._breaker if circuit is None else self._circuit(circuit)
+        budget = deadline if deadline is not None else self._config.request_timeout
+        expires = time.monotonic() + budget
+        self._count("requests")
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                self._count("short_circuits")
+                raise CircuitOpenError("Upstream circuit breaker is open.")
+            remaining = expires - time.monotonic()
+            self._count("attempts")
+            try:
+                result = operation(max(remaining, 0.001))
+            except Exception as exc:
+                if not self._retryable(exc):
+                    breaker.record_success()  # upstream answered, just not happily
+                    raise
+                breaker.record_failure()
+                pause = self._retry.delay(attempt)
+                out_of_time = time.monotonic() + pause >= expires
+                if attempt >= self._retry.max_retries or out_of_time:
+                    self._count("failures")
+                    raise
+                attempt += 1
+                self._count("retries")
+                time.sleep(pause)
+                continue
+            breaker.record_success()
+            return result
+
+    def trace(self, event: str, info: Any) -> None:
+        """httpcore trace hook that counts new TCP connections and TLS handshakes."""
+
+        if event == "connection.connect_tcp.complete":
+            self._count("connections_opened")
+        elif event == "connection.start_tls.complete":
+            self._count("tls_handshakes")
+
+    def metrics(self) -> TransportMetrics:
+        with self._lock:
+            snapshot = dataclasses.replace(self._metrics)
+        with self._lock:
+            breakers = [self._breaker, *self._breakers.values()]
+        # the worst circuit: open if any is open
+        states = {breaker.state for breaker in breakers}
+        snapshot.circuit_state = next(
+            (state for state in (OPEN, HALF_OPEN) if state in states), CLOSED
+        )
+        return snapshot
+
+    # ------------------------------------------------------------------
+    def _new_breaker(self) -> CircuitBreaker:
+        return CircuitBreaker(
+            failure_threshold=self._config.breaker_failure_threshold,
+            reset_seconds=self._config.breaker_reset_seconds,
+        )
+
+    def _circuit(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = self._new_breaker()
+            return breaker
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self._metrics, name, getattr(self._metrics, name) + 1)
+
+
+def build_http_client(config: TransportConfig, transport: ResilientTransport) -> Any:
+    """Create a keep-alive ``httpx.Client`` whose connections report to ``transport``."""
+
+    import httpx
+
+    def _attach_trace(request: "httpx.Request") -> None:
+        request.extensions["trace"] = transport.trace
+
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(config.request_timeout, connect=config.connect_timeout),
+        event_hooks={"request": [_attach_trace]},
+    )
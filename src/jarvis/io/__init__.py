@@ -1,6 +1,20 @@
 """Voice input and output interfaces."""
 
 from jarvis.io.voice_listener import VoiceListener
-from jarvis.io.voice_responder import VoiceResponder
+from jarvis.io.sentence_segmenter import SentenceSegmenter
+from jarvis.io.transcription import (
+    TranscriptionBackend,
+    TranscriptionCancelled,
+    TranscriptionCoordinator,
+)
+from jarvis.io.voice_responder import SpeechStreamStats, VoiceResponder
 
-__all__ = ["VoiceListener", "VoiceResponder"]
+__all__ = [
+	"SentenceSegmenter",
+	"SpeechStreamStats",
+	"TranscriptionBackend",
+	"TranscriptionCancelled",
+	"TranscriptionCoordinator",
+	"VoiceListener",
+	"VoiceResponder",
+]
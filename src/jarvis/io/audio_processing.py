@@ -0,0 +1,126 @@
+"""Helpers that shrink captured audio before it is uploaded for transcription."""
+from __future__ import annotations
+
+import math
+import shutil
+import subprocess
+from array import array
+from typing import Any, Optional, Set, Tuple
+
+from jarvis.utils.logger import get_logger
+
+UPLOAD_SAMPLE_RATE = 16000
+_SAMPLE_WIDTH = 2
+
+_log = get_logger("jarvis.audio")
+# codec fallbacks already reported; each is logged once rather than every utterance
+_reported: Set[Tuple[str, str]] = set()
+_CODEC_NAMES = {"opus": "Opus", "flac": "FLAC", "wav": "WAV"}
+
+
+def frame_rms(frame: bytes) -> float:
+    """Root-mean-square energy of a frame of signed 16-bit samples."""
+
+    samples = array("h", frame[: len(frame) - len(frame) % 2])
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+
+
+def trim_silence(
+    pcm: bytes,
+    *,
+    sample_rate: int,
+    threshold: Optional[float] = None,
+    frame_ms: int = 20,
+    padding_ms: int = 150,
+) -> bytes:
+    """Drop leading and trailing silence from 16-bit mono ``pcm``.
+
+    Frames quieter than ``threshold`` count as silence; by default the
+    threshold is a tenth of the loudest frame. ``padding_ms`` of audio is kept
+    on either side of the speech so word edges survive. Returns ``b""`` when
+    nothing rises above the threshold.
+    """
+
+    frame_bytes = max(1, sample_rate * frame_ms // 1000) * _SAMPLE_WIDTH
+    levels = [
+        frame_rms(pcm[offset : offset + frame_bytes])
+        for offset in range(0, len(pcm), frame_bytes)
+    ]
+    if not levels:
+        return b""
+    if threshold is None:
+        threshold = max(max(levels) * 0.1, 100.0)
+
+    voiced = [index for index, level in enumerate(levels) if level > threshold]
+    if not voiced:
+        return b""
+    padding = padding_ms // frame_ms
+    first = max(voiced[0] - padding, 0)
+    last = min(voiced[-1] + padding + 1, len(levels))
+    return pcm[first * frame_bytes : last * frame_bytes]
+
+
+def prepare_upload(
+    audio: Any,
+    sr_module: Any,
+    *,
+    codec: str = "flac",
+    trim: bool = True,
+) -> Tuple[bytes, str]:
+    """Turn SpeechRecognition ``AudioData`` into a compact in-memory upload.
+
+    Returns the encoded bytes and a file name whose extension tells the API
+    which codec was used. ``codec`` is ``"flac"``, ``"opus"`` (needs ffmpeg on
+    ``PATH``) or ``"wav"``; Opus falls back to FLAC and FLAC to WAV when
+    unavailable, with a warning the first time. The file name shows which
+    codec was actually used. The bytes are empty when trimming found no speech
+    at all.
+    """
+
+    pcm = audio.get_raw_data(convert_rate=UPLOAD_SAMPLE_RATE, convert_width=_SAMPLE_WIDTH)
+    if trim:
+        pcm = trim_silence(pcm, sample_rate=UPLOAD_SAMPLE_RATE)
+        if not pcm:
+            return b"", "audio.wav"
+    clip = sr_module.AudioData(pcm, UPLOAD_SAMPLE_RATE, _SAMPLE_WIDTH)
+
+    codec = codec.lower()
+    if codec == "opus":
+        if not shutil.which("ffmpeg"):
+            _report_fallback("opus", "flac", "ffmpeg is not on PATH")
+        else:
+            encoded = _encode_opus(clip.get_wav_data())
+            if encoded:
+                return encoded, "audio.ogg"
+            _report_fallback("opus", "flac", "ffmpeg could not encode Opus")
+    if codec in ("flac", "opus"):
+        try:
+            return clip.get_flac_data(), "audio.flac"
+        except OSError as exc:  # no FLAC encoder available on this platform
+            _report_fallback("flac", "wav", str(exc))
+    return clip.get_wav_data(), "audio.wav"
+
+
+def _report_fallback(wanted: str, used: str, reason: str) -> None:
+    if (wanted, used) in _reported:
+        return
+    _reported.add((wanted, used))
+    _log.warning(
+        "Uploading %s audio instead of %s: %s.", _CODEC_NAMES[used], _CODEC_NAMES[wanted], reason
+    )
+
+
+def _encode_opus(wav: bytes) -> Optional[bytes]:
+    result = subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "wav", "-i", "pipe:0",
+            "-c:a", "libopus", "-b:a", "24k", "-f", "ogg", "pipe:1",
+        ],
+        input=wav,
+        capture_output=True,
+        check=False,
+    )
+    return result.stdout if result.returncode == 0 and result.stdout else None
@@ -0,0 +1,253 @@
+"""Long-lived microphone capture that cuts utterances out of a continuous stream."""
+from __future__ import annotations
+
+import collections
+import contextlib
+import queue
+import threading
+from typing import Any, Callable, Deque, List, Optional
+
+from jarvis.io.audio_processing import frame_rms
+from jarvis.utils.logger import get_logger
+
+_MIN_THRESHOLD = 50.0
+# backoff between attempts to reopen a device whose reads fail
+_RETRY_BASE_SECONDS = 0.1
+_RETRY_MAX_SECONDS = 2.0
+# queued after the last utterance once the stream has given up on the device
+_CLOSED = object()
+
+
+class MicrophoneStream:
+    """Open the microphone once and segment utterances on a reader thread.
+
+    The energy threshold is calibrated once against ambient noise and then
+    tracks the room level between utterances. A short ring buffer of recent
+    frames is prepended to every utterance as pre-roll, so the first syllable
+    is not clipped and no audio is lost between turns.
+
+    When ``vad_factory`` is given it is called with the device sample rate and
+    the resulting :class:`~jarvis.io.vad.VoiceActivityDetector` replaces the
+    energy threshold; utterances then end as soon as its hangover expires
+    rather than after ``pause_seconds``.
+
+    A failed read is retried after an exponential backoff, reopening the
+    device first. After ``max_read_failures`` failures in a row the stream
+    stops: :attr:`closed` becomes true and :meth:`next_utterance` returns
+    ``None`` instead of blocking.
+    """
+
+    def __init__(
+        self,
+        sr_module: Any,
+        *,
+        device_index: Optional[int] = None,
+        energy_threshold: Optional[float] = None,
+        calibration_seconds: float = 1.0,
+        pre_roll_seconds: float = 0.3,
+        pause_seconds: float = 0.8,
+        phrase_time_limit: Optional[float] = None,
+        dynamic_ratio: float = 1.5,
+        dynamic_damping: float = 0.15,
+        max_pending: int = 8,
+        vad_factory: Optional[Callable[[int], Any]] = None,
+        max_read_failures: int = 5,
+    ) -> None:
+        self._sr = sr_module
+        self._device_index = device_index
+        self._energy_threshold = energy_threshold
+        self._calibration_seconds = calibration_seconds
+        self._pre_roll_seconds = pre_roll_seconds
+        self._pause_seconds = pause_seconds
+        self._phrase_time_limit = phrase_time_limit
+        self._dynamic_ratio = dynamic_ratio
+        self._dynamic_damping = dynamic_damping
+        self._vad_factory = vad_factory
+        self._max_read_failures = max(1, max_read_failures)
+        self._vad: Any = None
+        self._log = get_logger("jarvis.microphone")
+
+        self._utterances: "queue.Queue[Any]" = queue.Queue(max_pending)
+        self._stop = threading.Event()
+        self._closed = threading.Event()
+        self._paused = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._source: Any = None
+        self._threshold = energy_threshold or 300.0
+
+    @property
+    def energy_threshold(self) -> float:
+        return self._threshold
+
+    @property
+    def closed(self) -> bool:
+        """True once the stream was closed or gave up on a failing device."""
+
+        return self._closed.is_set()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._source = self._open()
+        if self._vad_factory is not None:
+            self._vad = self._vad_factory(self._source.SAMPLE_RATE)
+        if self._calibration_seconds > 0 and (
+            self._vad is not None or self._energy_threshold is None
+        ):
+            self._calibrate()
+        self._thread = threading.Thread(
+            target=self._read_loop, name="jarvis-microphone", daemon=True
+        )
+        self._thread.start()
+
+    def next_utterance(self, timeout: Optional[float] = None) -> Any:
+        """Block until the next utterance is complete and return it as ``AudioData``.
+
+        Returns ``None`` once the stream has stopped because the device failed.
+        """
+
+        self.start()
+        audio = self._utterances.get(timeout=timeout)
+        if audio is _CLOSED:
+            self._emit(_CLOSED)  # later calls return straight away too
+            return None
+        return audio
+
+    def pause(self) -> None:
+        """Discard incoming audio, e.g. while the assistant itself is speaking."""
+
+        self._paused.set()
+
+    def resume(self) -> None:
+        self._paused.clear()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._source is not None:
+            with contextlib.suppress(Exception):
+                self._source.__exit__(None, None, None)
+            self._source = None
+
+    # ------------------------------------------------------------------
+    def _open(self) -> Any:
+        kwargs = {}
+        if self._device_index is not None:
+            kwargs["device_index"] = self._device_index
+        source = self._sr.Microphone(**kwargs)
+        source.__enter__()
+        return source
+
+    def _reopen(self) -> None:
+        with contextlib.suppress(Exception):
+            self._source.__exit__(None, None, None)
+        self._source = None
+        try:
+            self._source = self._open()
+        except Exception as exc:  # PortAudio raises OSError, a missing device may not
+            self._log.debug("Reopening the microphone failed: %s", exc)
+
+    def _read(self, chunk: int) -> bytes:
+        stream = getattr(self._source, "stream", None)
+        if stream is None:
+            raise OSError("the microphone is not open")
+        try:
+            return stream.read(chunk, exception_on_overflow=False)
+        except TypeError:  # older PyAudio without exception_on_overflow
+            return stream.read(chunk)
+
+    def _calibrate(self) -> None:
+        chunk, rate = self._source.CHUNK, self._source.SAMPLE_RATE
+        count = max(1, int(self._calibration_seconds * rate / chunk))
+        frames = [self._source.stream.read(chunk) for _ in range(count)]
+        if self._vad is not None:
+            self._vad.calibrate(b"".join(frames))
+            self._log.info("Calibrated voice activity detector on ambient noise.")
+            return
+        ambient = sum(frame_rms(frame) for frame in frames) / len(frames)
+        self._threshold = max(ambient * self._dynamic_ratio, _MIN_THRESHOLD)
+        self._log.info("Calibrated microphone energy threshold to %.0f.", self._threshold)
+
+    def _read_loop(self) -> None:
+        source = self._source
+        chunk, rate, width = source.CHUNK, source.SAMPLE_RATE, source.SAMPLE_WIDTH
+        frame_seconds = chunk / rate
+        pre_roll: Deque[bytes] = collections.deque(
+            maxlen=max(1, int(self._pre_roll_seconds / frame_seconds))
+        )
+        damping = self._dynamic_damping**frame_seconds
+        utterance: List[bytes] = []
+        silence = 0.0
+        failures = 0
+
+        while not self._stop.is_set():
+            try:
+                frame = self._read(chunk)
+            except OSError as exc:
+                failures += 1
+                if failures >= self._max_read_failures:
+                    self._log.error(
+                        "Microphone failed %d times in a row (%s); stopping the stream.",
+                        failures,
+                        exc,
+                    )
+                    self._closed.set()
+                    self._emit(_CLOSED)
+                    return
+                delay = min(_RETRY_BASE_SECONDS * 2 ** (failures - 1), _RETRY_MAX_SECONDS)
+                self._log.warning(
+                    "Microphone read failed (%s); reopening it in %.1fs.", exc, delay
+                )
+                if self._stop.wait(delay):
+                    return
+                self._reopen()
+                utterance = []  # the audio on either side of the gap does not belong together
+                continue
+            failures = 0
+            if self._paused.is_set():
+                utterance = []
+                pre_roll.clear()
+                if self._vad is not None:
+                    self._vad.reset(keep_noise_floor=True)
+                continue
+            if self._vad is not None:
+                self._vad.process(frame)
+                voiced = self._vad.in_speech
+            else:
+                energy = frame_rms(frame)
+                voiced = energy > self._threshold
+
+            if not utterance:
+                if voiced:
+                    utterance = [*pre_roll, frame]
+                    silence = 0.0
+                    continue
+                if self._vad is None:
+                    target = energy * self._dynamic_ratio
+                    self._threshold = max(
+                        self._threshold * damping + target * (1 - damping), _MIN_THRESHOLD
+                    )
+                pre_roll.append(frame)
+                continue
+
+            utterance.append(frame)
+            silence = 0.0 if voiced else silence + frame_seconds
+            # the detector's hangover already covers the pause between words
+            finished = not voiced if self._vad is not None else silence >= self._pause_seconds
+            duration = len(utterance) * frame_seconds
+            limit_reached = self._phrase_time_limit and duration >= self._phrase_time_limit
+            if finished or limit_reached:
+                self._emit(self._sr.AudioData(b"".join(utterance), rate, width))
+                utterance = []
+                pre_roll.clear()
+
+    def _emit(self, audio: Any) -> None:
+        try:
+            self._utterances.put_nowait(audio)
+        except queue.Full:
+            with contextlib.suppress(queue.Empty):
+                self._utterances.get_nowait()  # drop the oldest unclaimed utterance
+            self._utterances.put_nowait(audio)
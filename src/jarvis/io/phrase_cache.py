@@ -0,0 +1,149 @@
+"""Content-addressed cache of pre-synthesized speech stored as raw PCM."""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import mmap
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class PcmFormat:
+    """Layout of the raw samples in a cached phrase."""
+
+    sample_rate: int
+    channels: int = 1
+    sample_width: int = 2
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPhrase:
+    path: Path
+    format: PcmFormat
+    size: int
+
+
+def phrase_key(
+    text: str,
+    *,
+    engine: str,
+    voice_id: Optional[str],
+    rate: Optional[int],
+    volume: Optional[float],
+) -> str:
+    """Hash everything that influences how ``text`` sounds."""
+
+    payload = "\x1f".join(
+        [text.strip(), engine, voice_id or "", repr(rate), repr(volume)]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PhraseCache:
+    """Directory of ``<key>.<rate>x<channels>x<width>.pcm`` files.
+
+    The format lives in the file name so a hit needs no parsing before the
+    samples can be memory-mapped and handed to the audio device. Files are
+    evicted least-recently-played first once the directory exceeds
+    ``max_bytes``.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CachedPhrase] = {}
+        self._total_bytes = 0
+
+        directory.mkdir(parents=True, exist_ok=True)
+        for path in directory.glob("*.pcm"):
+            phrase = self._parse(path)
+            if phrase is None:
+                continue
+            key = path.name.split(".", 1)[0]
+            self._entries[key] = phrase
+            self._total_bytes += phrase.size
+
+    def lookup(self, key: str) -> Optional[CachedPhrase]:
+        with self._lock:
+            phrase = self._entries.get(key)
+        if phrase is None:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(phrase.path)  # mtime doubles as the LRU clock
+        return phrase
+
+    def store(self, key: str, pcm: bytes, audio_format: PcmFormat) -> CachedPhrase:
+        name = (
+            f"{key}.{audio_format.sample_rate}x{audio_format.channels}"
+            f"x{audio_format.sample_width}.pcm"
+        )
+        path = self._directory / name
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(pcm)
+        os.replace(temp_path, path)
+
+        phrase = CachedPhrase(path=path, format=audio_format, size=len(pcm))
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                self._total_bytes -= previous.size
+                if previous.path != path:
+                    with contextlib.suppress(FileNotFoundError):
+                        previous.path.unlink()
+            self._entries[key] = phrase
+            self._total_bytes += phrase.size
+            self._evict(keep=key)
+        return phrase
+
+    @contextlib.contextmanager
+    def open(self, phrase: CachedPhrase) -> Iterator[mmap.mmap]:
+        """Memory-map the samples of ``phrase`` for zero-copy playback."""
+
+        with phrase.path.open("rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    # ------------------------------------------------------------------
+    def _evict(self, *, keep: str) -> None:
+        if self._total_bytes <= self._max_bytes:
+            return
+
+        def _last_played(item) -> float:
+            try:
+                return item[1].path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for key, phrase in sorted(self._entries.items(), key=_last_played):
+            if self._total_bytes <= self._max_bytes:
+                break
+            if key == keep:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                phrase.path.unlink()
+            del self._entries[key]
+            self._total_bytes -= phrase.size
+
+    @staticmethod
+    def _parse(path: Path) -> Optional[CachedPhrase]:
+        try:
+            _, layout, _ = path.name.split(".")
+            sample_rate, channels, width = (int(part) for part in layout.split("x"))
+            size = path.stat().st_size
+        except (ValueError, OSError):
+            return None
+        if size == 0:
+            return None
+        return CachedPhrase(path=path, format=PcmFormat(sample_rate, channels, width), size=size)
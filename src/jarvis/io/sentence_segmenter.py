@@ -0,0 +1,71 @@
+"""Incremental sentence splitting for streamed assistant replies."""
+from __future__ import annotations
+
+from typing import List, Optional
+
+_TERMINATORS = ".!?"
+_CLOSERS = "\"')]"
+_ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e"}
+
+
+class SentenceSegmenter:
+    """Accumulate text deltas and emit sentences as soon as they are complete.
+
+    A sentence ends at ``.``, ``!`` or ``?`` followed by whitespace, or at a
+    newline. The whitespace requirement keeps decimals such as ``3.5`` intact;
+    common abbreviations are never treated as sentence ends.
+    """
+
+    def __init__(self, *, min_chars: int = 2) -> None:
+        self._min_chars = min_chars
+        self._buffer = ""
+        self._scan_from = 0
+
+    def feed(self, delta: str) -> List[str]:
+        """Add ``delta`` and return every sentence it completed."""
+
+        self._buffer += delta
+        sentences: List[str] = []
+        start = 0
+        index = max(self._scan_from, 0)
+        length = len(self._buffer)
+        while index < length:
+            char = self._buffer[index]
+            end: Optional[int] = None
+            if char == "\n":
+                end = index + 1
+            elif char in _TERMINATORS:
+                end = index + 1
+                while end < length and self._buffer[end] in _TERMINATORS + _CLOSERS:
+                    end += 1
+                if end >= length:
+                    # need the following character to know whether this is a boundary
+                    break
+                if not self._buffer[end].isspace() or self._is_abbreviation(start, index):
+                    end = None
+
+            if end is not None:
+                sentence = self._buffer[start:end].strip()
+                if len(sentence) >= self._min_chars:
+                    sentences.append(sentence)
+                    start = end
+                index = end
+                continue
+            index += 1
+
+        self._buffer = self._buffer[start:]
+        self._scan_from = index - start
+        return sentences
+
+    def flush(self) -> Optional[str]:
+        """Return whatever text remains once the stream has finished."""
+
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        self._scan_from = 0
+        return remainder or None
+
+    # ------------------------------------------------------------------
+    def _is_abbreviation(self, start: int, index: int) -> bool:
+        words = self._buffer[start:index].split()
+        return bool(words) and words[-1].lower() in _ABBREVIATIONS
@@ -0,0 +1,237 @@
+"""Coordinate one or more speech-to-text backends with racing and hedging."""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from jarvis.utils.logger import get_logger
+
+STRATEGIES = ("single", "race", "hedge")
+
+
+class TranscriptionCancelled(RuntimeError):
+    """Raised by a cancellable backend that stopped because another one already won."""
+
+
+@dataclass(slots=True)
+class TranscriptionBackend:
+    """A named speech-to-text callable that turns captured audio into text.
+
+    Cancelling a call that is already running cannot interrupt it, so a
+    losing Whisper request would still upload and spend quota. A backend with
+    ``cancellable`` set is called as ``transcribe(audio, cancelled=event)``;
+    the event is set once a transcript has been accepted, and the backend
+    should check it before each expensive step and raise
+    :class:`TranscriptionCancelled`. A request already on the wire still runs
+    to completion.
+    """
+
+    name: str
+    transcribe: Callable[..., str]
+    cancellable: bool = False
+
+
+@dataclass(slots=True)
+class BackendStats:
+    """Snapshot of one backend's recent behaviour."""
+
+    calls: int
+    errors: int
+    p50: Optional[float]
+    p90: Optional[float]
+
+
+class LatencyTracker:
+    """Fixed-size ring of recent latencies plus call and error counters."""
+
+    def __init__(self, window: int = 64) -> None:
+        self._samples = [0.0] * window
+        self._count = 0
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples[self._count % len(self._samples)] = seconds
+            self._count += 1
+            self.calls += 1
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.calls += 1
+            self.errors += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        with self._lock:
+            filled = min(self._count, len(self._samples))
+            if not filled:
+                return None
+            ordered = sorted(self._samples[:filled])
+        index = min(int(fraction * filled), filled - 1)
+        return ordered[index]
+
+    def snapshot(self) -> BackendStats:
+        return BackendStats(
+            calls=self.calls,
+            errors=self.errors,
+            p50=self.percentile(0.5),
+            p90=self.percentile(0.9),
+        )
+
+
+class TranscriptionCoordinator:
+    """Send captured audio to several STT backends and keep the first good answer.
+
+    ``single`` tries backends in order and fails over on errors. ``race``
+    starts all of them at once. ``hedge`` starts the first backend and only
+    launches the next one if no answer arrived within the first backend's
+    ``hedge_percentile`` latency, so the hedge delay tunes itself from live
+    statistics. A failing backend triggers the next one immediately. Once an
+    acceptable transcript is in, calls that have not started are cancelled,
+    cancellable backends are told to stop, and late results are discarded
+    (their latency is still recorded).
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[TranscriptionBackend],
+        *,
+        strategy: str = "single",
+        hedge_percentile: float = 0.9,
+        default_hedge_delay: float = 1.0,
+        min_hedge_delay: float = 0.05,
+        accept: Callable[[str], bool] = lambda text: bool(text.strip()),
+    ) -> None:
+        if not backends:
+            raise ValueError("At least one transcription backend is required.")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown transcription strategy '{strategy}'.")
+        self._backends = list(backends)
+        self._strategy = strategy
+        self._hedge_percentile = hedge_percentile
+        self._default_hedge_delay = default_hedge_delay
+        self._min_hedge_delay = min_hedge_delay
+        self._accept = accept
+        self._trackers: Dict[str, LatencyTracker] = {
+            backend.name: LatencyTracker() for backend in self._backends
+        }
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._log = get_logger("jarvis.transcription")
+
+    @property
+    def strategy(self) -> str:
+        return self._strategy
+
+    def transcribe(self, audio: Any) -> str:
+        if self._strategy == "single" or len(self._backends) == 1:
+            return self._transcribe_in_order(audio)
+        return self._transcribe_concurrently(audio)
+
+    def stats(self) -> Dict[str, BackendStats]:
+        return {name: tracker.snapshot() for name, tracker in self._trackers.items()}
+
+    def hedge_delay(self, backend: TranscriptionBackend) -> float:
+        observed = self._trackers[backend.name].percentile(self._hedge_percentile)
+        if observed is None:
+            return self._default_hedge_delay
+        return max(observed, self._min_hedge_delay)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    def _call(
+        self, backend: TranscriptionBackend, audio: Any, cancelled: threading.Event
+    ) -> str:
+        tracker = self._trackers[backend.name]
+        started = time.perf_counter()
+        try:
+            if backend.cancellable:
+                text = backend.transcribe(audio, cancelled=cancelled)
+            else:
+                text = backend.transcribe(audio)
+        except TranscriptionCancelled:
+            raise  # cut short on purpose; neither a latency sample nor an error
+        except Exception:
+            tracker.record_error()
+            raise
+        tracker.record(time.perf_counter() - started)
+        return text
+
+    def _transcribe_in_order(self, audio: Any) -> str:
+        errors: List[str] = []
+        fallback = ""
+        cancelled = threading.Event()  # one backend at a time; nothing to cancel
+        for backend in self._backends:
+            try:
+                text = self._call(backend, audio, cancelled)
+            except Exception as exc:
+                self._log.warning("Transcription backend %s failed: %s", backend.name, exc)
+                errors.append(f"{backend.name}: {exc}")
+                continue
+            if self._accept(text):
+                return text
+            fallback = fallback or text
+        if errors and len(errors) == len(self._backends):
+            raise RuntimeError("All transcription backends failed: " + "; ".join(errors))
+        return fallback
+
+    def _transcribe_concurrently(self, audio: Any) -> str:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self._backends) * 2, thread_name_prefix="jarvis-stt"
+            )
+        waiting = list(self._backends)
+        running: Dict[Future, TranscriptionBackend] = {}
+        errors: List[str] = []
+        fallback = ""
+        cancelled = threading.Event()
+
+        def _launch() -> None:
+            backend = waiting.pop(0)
+            running[self._executor.submit(self._call, backend, audio, cancelled)] = backend
+
+        _launch()
+        if self._strategy == "race":
+            while waiting:
+                _launch()
+
+        try:
+            while running:
+                timeout = None
+                if waiting:
+                    first = next(iter(running.values()))
+                    timeout = self.hedge_delay(first)
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    self._log.debug("Hedging transcription with %s.", waiting[0].name)
+                    _launch()
+                    continue
+                for future in done:
+                    backend = running.pop(future)
+                    try:
+                        text = future.result()
+                    except Exception as exc:
+                        errors.append(f"{backend.name}: {exc}")
+                        if waiting:
+                            _launch()
+                        continue
+                    if self._accept(text):
+                        return text
+                    fallback = fallback or text
+                    if waiting and not running:
+                        _launch()
+        finally:
+            cancelled.set()
+            for future in running:
+                future.cancel()
+
+        if errors and len(errors) == len(self._backends):
+            raise RuntimeError("All transcription backends failed: " + "; ".join(errors))
+        return fallback
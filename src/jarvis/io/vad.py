@@ -0,0 +1,155 @@
+"""Frame-based voice activity detection vectorized with NumPy."""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+_EPSILON = 1e-10
+
+
+class VoiceActivityDetector:
+    """Classify 16-bit mono PCM frames as speech or non-speech.
+
+    For every frame the detector computes log energy, zero-crossing rate and
+    spectral flatness in one pass over the whole frame matrix. A frame is
+    voiced when it is ``energy_margin_db`` above the tracked noise floor and
+    looks tonal (low flatness) or speech-like (moderate zero-crossing rate).
+    Raw decisions are smoothed: ``onset_frames`` consecutive voiced frames open
+    a segment and ``hangover_ms`` of non-speech closes it.
+
+    :meth:`process` is incremental and keeps partial frames and smoothing
+    history between calls, so it can sit directly behind a microphone.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        *,
+        frame_ms: int = 20,
+        hangover_ms: int = 200,
+        onset_frames: int = 2,
+        energy_margin_db: float = 10.0,
+        flatness_max: float = 0.45,
+        zcr_max: float = 0.25,
+        noise_adaptation: float = 0.1,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.frame_length = max(1, sample_rate * frame_ms // 1000)
+        self._frame_seconds = self.frame_length / sample_rate
+        self._onset = max(1, onset_frames)
+        self._hangover = max(0, round(hangover_ms / frame_ms))
+        self._margin_db = energy_margin_db
+        self._flatness_max = flatness_max
+        self._zcr_max = zcr_max
+        self._adaptation = noise_adaptation
+        self._window = np.hanning(self.frame_length).astype(np.float32)
+        self.reset()
+
+    def reset(self, *, keep_noise_floor: bool = False) -> None:
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._history = np.zeros(self._onset + self._hangover, dtype=bool)
+        if not keep_noise_floor:
+            self._noise_db: Optional[float] = None
+        self.in_speech = False
+
+    @property
+    def frame_seconds(self) -> float:
+        return self._frame_seconds
+
+    def calibrate(self, pcm: bytes) -> None:
+        """Seed the noise floor from audio known to contain no speech."""
+
+        energy_db, _, _ = self.features(self._frames(self._to_float(pcm)))
+        if energy_db.size:
+            self._noise_db = float(np.median(energy_db))
+
+    def features(self, frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return per-frame log energy (dB), zero-crossing rate and spectral flatness."""
+
+        if not frames.size:
+            empty = np.zeros(0, dtype=np.float32)
+            return empty, empty, empty
+        energy_db = 10.0 * np.log10(np.mean(frames * frames, axis=1) + _EPSILON)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frames.shape[1]
+        power = np.abs(np.fft.rfft(frames * self._window, axis=1)) ** 2 + _EPSILON
+        flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+        return energy_db, zcr, flatness
+
+    def process(self, pcm: bytes) -> np.ndarray:
+        """Consume ``pcm`` and return the smoothed speech flag of each whole frame."""
+
+        samples = np.concatenate([self._pending, self._to_float(pcm)])
+        whole = len(samples) // self.frame_length * self.frame_length
+        self._pending = samples[whole:]
+        frames = self._frames(samples[:whole])
+        if not len(frames):
+            return np.zeros(0, dtype=bool)
+
+        energy_db, zcr, flatness = self.features(frames)
+        if self._noise_db is None:
+            self._noise_db = float(np.percentile(energy_db, 10))
+        loud = energy_db > self._noise_db + self._margin_db
+        raw = loud & ((flatness < self._flatness_max) | (zcr < self._zcr_max))
+
+        quiet = energy_db[~raw]
+        if quiet.size:
+            self._noise_db += self._adaptation * (float(np.mean(quiet)) - self._noise_db)
+
+        smoothed = self._smooth(raw)
+        self.in_speech = bool(smoothed[-1])
+        return smoothed
+
+    def segments(self, pcm: bytes) -> List[Tuple[float, float]]:
+        """Return ``(start, end)`` times in seconds of every speech segment in ``pcm``.
+
+        Meant for whole clips: it resets any streaming state of this detector.
+        """
+
+        self.reset()
+        flags = self.process(pcm)
+        self.reset()
+        if not flags.any():
+            return []
+        edges = np.diff(np.concatenate([[False], flags, [False]]).astype(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        # onset smoothing confirms speech late; shift starts back to the first voiced frame
+        starts = np.maximum(starts - (self._onset - 1), 0)
+        return [
+            (float(start * self._frame_seconds), float(end * self._frame_seconds))
+            for start, end in zip(starts, ends)
+        ]
+
+    def trim(self, pcm: bytes, *, padding_ms: int = 100) -> bytes:
+        """Cut ``pcm`` down to the span between the first and last speech segment."""
+
+        spans = self.segments(pcm)
+        if not spans:
+            return b""
+        padding = padding_ms / 1000
+        start = max(spans[0][0] - padding, 0.0)
+        end = spans[-1][1] + padding
+        first = int(start * self.sample_rate) * 2
+        last = int(end * self.sample_rate) * 2
+        return pcm[first:last]
+
+    # ------------------------------------------------------------------
+    def _smooth(self, raw: np.ndarray) -> np.ndarray:
+        history = np.concatenate([self._history, raw])
+        length = len(history)
+        runs = np.convolve(history, np.ones(self._onset, dtype=np.int32))[:length]
+        confirmed = runs >= self._onset
+        held = np.convolve(confirmed, np.ones(self._hangover + 1, dtype=np.int32))[:length] > 0
+        self._history = history[-(self._onset + self._hangover) :]
+        return held[len(history) - len(raw) :]
+
+    def _frames(self, samples: np.ndarray) -> np.ndarray:
+        count = len(samples) // self.frame_length
+        return samples[: count * self.frame_length].reshape(count, self.frame_length)
+
+    @staticmethod
+    def _to_float(pcm: bytes) -> np.ndarray:
+        usable = len(pcm) - len(pcm) % 2
+        return np.frombuffer(pcm[:usable], dtype="<i2").astype(np.float32) / 32768.0
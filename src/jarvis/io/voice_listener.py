@@ -2,18 +2,22 @@
 from __future__ import annotations
 
 import contextlib
-import importlib
 import importlib.util
-import tempfile
-from pathlib import Path
-from typing import Any, Optional
+import threading
+from typing import Any, Dict, List, Optional
 
 from jarvis.config import SpeechInputConfig
 from jarvis.integrations.openai_client import OpenAIClient
-
-sr = None
-if importlib.util.find_spec("speech_recognition"):
-    sr = importlib.import_module("speech_recognition")
+from jarvis.io.audio_processing import prepare_upload
+from jarvis.io.microphone_stream import MicrophoneStream
+from jarvis.io.transcription import (
+    BackendStats,
+    TranscriptionBackend,
+    TranscriptionCancelled,
+    TranscriptionCoordinator,
+)
+from jarvis.telemetry.tracing import get_tracer
+from jarvis.utils.startup import lazy_import
 
 
 class VoiceListener:
@@ -29,23 +33,47 @@ class VoiceListener:
         self._config = config
         self._openai_client = openai_client
         self._fallback_to_text = fallback_to_text
+        self._tracer = get_tracer()
+        # recognition backends only load when the microphone is in use
+        sr = lazy_import("speech_recognition") if config.enable_microphone else None
+        vad = None
+        if sr and config.vad_enabled and importlib.util.find_spec("numpy"):
+            vad = lazy_import("jarvis.io.vad")
+        self._sr = sr
+        self._vad = vad
         self._recognizer = sr.Recognizer() if sr else None
 
         if self._recognizer and self._config.energy_threshold:
             self._recognizer.energy_threshold = self._config.energy_threshold
 
+        # Device enumeration is slow, so it happens once rather than every turn.
+        self._microphone_available: Optional[bool] = None
+        self._stream: Optional[MicrophoneStream] = None
+        self._use_vad = vad is not None
+        self._coordinator: Optional[TranscriptionCoordinator] = None
+        if self._recognizer:
+            self._coordinator = TranscriptionCoordinator(
+                self._build_backends(),
+                strategy=config.stt_strategy,
+                hedge_percentile=config.stt_hedge_percentile,
+            )
+
     def listen(self, *, prompt: str = "") -> str:
         """Record audio once and return the recognized transcript."""
 
-        microphone_ready = (
-            self._config.enable_microphone
-            and self._recognizer
-            and sr
-            and sr.Microphone.list_microphone_names()
-        )
+        return self.transcribe(self.capture(prompt=prompt))
+
+    def capture(self, *, prompt: str = "") -> Any:
+        """Record one utterance without transcribing it.
 
-        if microphone_ready:
-            return self._listen_with_microphone(prompt=prompt)
+        Returns microphone audio, or the typed line when running in text mode.
+        Splitting capture from :meth:`transcribe` lets the next utterance be
+        recorded while the previous one is still being recognized.
+        """
+
+        if self._microphone_ready():
+            with self._tracer.span("capture"):
+                return self._capture_from_microphone(prompt=prompt)
 
         if self._fallback_to_text:
             displayed_prompt = prompt or "You> "
@@ -54,43 +82,158 @@ class VoiceListener:
             "SpeechRecognition microphone not available and text fallback disabled."
         )
 
+    def transcribe(self, captured: Any) -> str:
+        """Convert the result of :meth:`capture` to text."""
+
+        if isinstance(captured, str):
+            return captured
+        assert self._recognizer and self._sr  # audio only comes from the microphone
+        if not captured.frame_data:
+            return ""
+        assert self._coordinator
+        with self._tracer.span("stt"):
+            return self._coordinator.transcribe(captured)
+
+    def transcription_stats(self) -> Dict[str, BackendStats]:
+        """Per-backend latency percentiles and error counts."""
+
+        return self._coordinator.stats() if self._coordinator else {}
+
+    def pause(self) -> None:
+        """Ignore microphone audio until :meth:`resume`, e.g. while Jarvis talks."""
+
+        if self._stream is not None:
+            self._stream.pause()
+
+    def resume(self) -> None:
+        if self._stream is not None:
+            self._stream.resume()
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._coordinator is not None:
+            self._coordinator.close()
+
     # ------------------------------------------------------------------
-    def _listen_with_microphone(self, *, prompt: str) -> str:
-        assert self._recognizer and sr  # guarded by listen
+    def _build_backends(self) -> List[TranscriptionBackend]:
+        names = [name.strip().lower() for name in self._config.stt_backends.split(",")]
+        names = [name for name in names if name]
+        if not names:
+            names = ["whisper" if self._config.use_whisper_api else "google"]
+
+        available = {
+            "google": self._transcribe_with_google,
+            "whisper": self._transcribe_with_whisper,
+            "sphinx": self._transcribe_with_sphinx,
+        }
+        backends = []
+        for name in names:
+            if name not in available:
+                raise RuntimeError(f"Unknown speech-to-text backend '{name}'.")
+            backends.append(
+                TranscriptionBackend(
+                    name=name, transcribe=available[name], cancellable=name == "whisper"
+                )
+            )
+        return backends
+
+    def _transcribe_with_google(self, audio: Any) -> str:
+        assert self._recognizer and self._sr
+        try:
+            return self._recognizer.recognize_google(audio)
+        except self._sr.UnknownValueError:
+            return ""
+        except self._sr.RequestError as exc:
+            raise RuntimeError(f"SpeechRecognition request failed: {exc}") from exc
+
+    def _transcribe_with_sphinx(self, audio: Any) -> str:
+        assert self._recognizer and self._sr
+        try:
+            return self._recognizer.recognize_sphinx(audio)
+        except self._sr.UnknownValueError:
+            return ""
+        except self._sr.RequestError as exc:
+            raise RuntimeError(f"PocketSphinx recognition failed: {exc}") from exc
+
+    def _microphone_ready(self) -> bool:
+        if self._microphone_available is None:
+            self._microphone_available = bool(
+                self._config.enable_microphone
+                and self._recognizer
+                and self._sr
+                and self._sr.Microphone.list_microphone_names()
+            )
+        return self._microphone_available
+
+    def _capture_from_microphone(self, *, prompt: str) -> Any:
+        assert self._recognizer and self._sr  # guarded by capture
+
+        if self._config.persistent_stream:
+            if self._stream is None:
+                self._stream = MicrophoneStream(
+                    self._sr,
+                    device_index=self._config.device_index,
+                    energy_threshold=self._config.energy_threshold,
+                    calibration_seconds=self._config.calibration_seconds,
+                    pre_roll_seconds=self._config.pre_roll_seconds,
+                    pause_seconds=self._config.pause_seconds,
+                    phrase_time_limit=self._config.phrase_time_limit,
+                    vad_factory=self._make_vad if self._use_vad else None,
+                )
+                self._stream.start()
+            print(prompt or "Listening... (speak now)")
+            audio = self._stream.next_utterance()
+            if audio is None:
+                # the stream gave up on the device; later turns fall back to typed input
+                self._stream.close()
+                self._stream = None
+                self._microphone_available = False
+                raise RuntimeError("The microphone stopped responding.")
+            return audio
 
         microphone_kwargs = {}
         if self._config.device_index is not None:
             microphone_kwargs["device_index"] = self._config.device_index
 
         with contextlib.ExitStack() as stack:
-            microphone = stack.enter_context(sr.Microphone(**microphone_kwargs))
+            microphone = stack.enter_context(self._sr.Microphone(**microphone_kwargs))
             print(prompt or "Listening... (speak now)")
             audio = self._recognizer.listen(
                 microphone,
                 timeout=None,
                 phrase_time_limit=self._config.phrase_time_limit,
             )
+        if not self._use_vad:
+            return audio
+        # recognizer.listen waits out its own pause threshold; cut that silence off
+        with self._tracer.span("vad"):
+            detector = self._make_vad(audio.sample_rate)
+            speech = detector.trim(audio.get_raw_data(convert_width=2))
+        return self._sr.AudioData(speech, audio.sample_rate, 2)
+
+    def _make_vad(self, sample_rate: int) -> Any:
+        assert self._vad
+        return self._vad.VoiceActivityDetector(
+            sample_rate, hangover_ms=self._config.vad_hangover_ms
+        )
 
-        if self._config.use_whisper_api:
-            if not self._openai_client:
-                raise RuntimeError("Whisper API requested but OpenAI client is missing.")
-            return self._transcribe_with_whisper(audio)
-
-        try:
-            return self._recognizer.recognize_google(audio)
-        except sr.UnknownValueError:
-            return ""
-        except sr.RequestError as exc:
-            raise RuntimeError(f"SpeechRecognition request failed: {exc}") from exc
-
-    def _transcribe_with_whisper(self, audio: Any) -> str:
-        assert self._openai_client
-        wav_bytes = audio.get_wav_data(convert_rate=16000)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as handle:
-            handle.write(wav_bytes)
-            tmp_path = Path(handle.name)
-        try:
-            return self._openai_client.transcribe_audio(tmp_path)
-        finally:
-            with contextlib.suppress(FileNotFoundError):
-                tmp_path.unlink()
+    def _transcribe_with_whisper(
+        self, audio: Any, *, cancelled: Optional[threading.Event] = None
+    ) -> str:
+        if not self._openai_client:
+            raise RuntimeError("Whisper API requested but OpenAI client is missing.")
+        assert self._sr
+        payload, filename = prepare_upload(
+            audio,
+            self._sr,
+            codec=self._config.whisper_upload_format,
+            trim=self._config.trim_silence and not self._use_vad,
+        )
+        if not payload:
+            return ""  # nothing but silence; skip the round-trip
+        if cancelled is not None and cancelled.is_set():
+            # another backend won while this one was encoding; skip the paid upload
+            raise TranscriptionCancelled("Whisper upload skipped.")
+        return self._openai_client.transcribe_audio(payload, filename=filename)
@@ -1,11 +1,38 @@
 """Voice synthesis wrappers for local and cloud backends."""
 from __future__ import annotations
 
-import importlib
-import importlib.util
-from typing import Optional
+import mmap
+import queue
+import tempfile
+import threading
+import time
+import wave
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Set, Tuple, Union
 
 from jarvis.config import SpeechOutputConfig
+from jarvis.io.phrase_cache import PcmFormat, PhraseCache, phrase_key
+from jarvis.io.sentence_segmenter import SentenceSegmenter
+from jarvis.telemetry.tracing import get_tracer
+from jarvis.utils.logger import get_logger
+from jarvis.utils.singleflight import FlightStats, SingleFlight
+from jarvis.utils.startup import lazy_import
+
+_STREAM_DONE = object()
+_ELEVENLABS_MODEL = "eleven_multilingual_v2"
+_ELEVENLABS_PCM_RATE = 22050
+
+
+@dataclass(slots=True)
+class SpeechStreamStats:
+    """Timing information captured while speaking a streamed reply."""
+
+    text: str
+    sentences: int
+    time_to_first_audio: Optional[float]
+    total_seconds: float
 
 
 class VoiceResponder:
@@ -17,10 +44,20 @@ class VoiceResponder:
         self._config = config
         self._text_fallback = text_fallback
         self._engine_name = (config.engine or "").lower()
+        # one interrupt flag per utterance in progress, so stop() cannot be undone
+        # by an utterance that starts just after it
+        self._speaking: Set[threading.Event] = set()
+        self._speaking_lock = threading.Lock()
+        self._engine_lock = threading.Lock()
+        self._log = get_logger("jarvis.voice")
+        self._tracer = get_tracer()
+        # identical phrases rendered at the same time share one synthesis request
+        self._synthesis: SingleFlight[Tuple[bytes, PcmFormat]] = SingleFlight()
 
         self._tts_engine = None
-        if self._engine_name == "pyttsx3" and importlib.util.find_spec("pyttsx3"):
-            pyttsx3 = importlib.import_module("pyttsx3")
+        # each backend is imported only when it is the configured engine
+        pyttsx3 = lazy_import("pyttsx3") if self._engine_name == "pyttsx3" else None
+        if pyttsx3 is not None:
             self._tts_engine = pyttsx3.init()
             if config.rate is not None:
                 self._tts_engine.setProperty("rate", config.rate)
@@ -30,16 +67,151 @@ class VoiceResponder:
                 self._tts_engine.setProperty("voice", config.voice_id)
 
         self._elevenlabs = None
-        if (
-            self._engine_name == "elevenlabs"
-            and config.elevenlabs_api_key
-            and importlib.util.find_spec("elevenlabs")
-        ):
-            elevenlabs = importlib.import_module("elevenlabs")
+        elevenlabs = None
+        if self._engine_name == "elevenlabs" and config.elevenlabs_api_key:
+            elevenlabs = lazy_import("elevenlabs")
+        if elevenlabs is not None:
             elevenlabs.set_api_key(config.elevenlabs_api_key)
             self._elevenlabs = elevenlabs
 
+        self._phrase_cache: Optional[PhraseCache] = None
+        self._pyaudio = None
+        pyaudio = None
+        if config.phrase_cache_dir is not None and (self._tts_engine or self._elevenlabs):
+            pyaudio = lazy_import("pyaudio")
+        if pyaudio is not None:
+            self._pyaudio = pyaudio.PyAudio()
+            self._phrase_cache = PhraseCache(
+                config.phrase_cache_dir, max_bytes=config.phrase_cache_max_bytes
+            )
+
     def speak(self, message: str) -> None:
+        with self._utterance() as interrupted:
+            self._say(message, interrupted)
+
+    def prewarm(self, phrases: Iterable[str]) -> int:
+        """Render ``phrases`` into the phrase cache and return how many were new.
+
+        Call this once at startup with every fixed response so those phrases
+        play straight from disk instead of being synthesized on demand.
+        """
+
+        if not self._phrase_cache:
+            return 0
+        rendered = 0
+        for phrase in dict.fromkeys(text.strip() for text in phrases):
+            if not phrase:
+                continue
+            key = self._phrase_key(phrase)
+            if self._phrase_cache.lookup(key):
+                continue
+            try:
+                pcm, audio_format = self._render(phrase)
+            except Exception as exc:
+                self._log.debug("Could not pre-render %r: %s", phrase, exc)
+                continue
+            if pcm:
+                self._phrase_cache.store(key, pcm, audio_format)
+                rendered += 1
+        return rendered
+
+    def synthesis_stats(self) -> FlightStats:
+        """Synthesis requests made and those saved by joining an identical one."""
+
+        return self._synthesis.stats()
+
+    def stop(self) -> None:
+        """Interrupt the replies that are currently being spoken (barge-in).
+
+        pyttsx3 playback is cut immediately; other backends finish the current
+        sentence and skip the rest of a streamed reply. Replies that start
+        after the call are not affected.
+        """
+
+        with self._speaking_lock:
+            for interrupted in self._speaking:
+                interrupted.set()
+        if self._tts_engine:
+            self._tts_engine.stop()
+
+    def speak_stream(
+        self, chunks: Iterable[str], *, started_at: Optional[float] = None
+    ) -> SpeechStreamStats:
+        """Speak each sentence of ``chunks`` as soon as it is complete.
+
+        The stream is drained on a background thread so generation keeps going
+        while earlier sentences are being spoken. ``started_at`` is a
+        ``time.perf_counter()`` reading used as the origin for the
+        time-to-first-audio metric; it defaults to the moment of the call.
+        """
+
+        origin = started_at if started_at is not None else time.perf_counter()
+        with self._utterance() as interrupted:
+            return self._speak_sentences(chunks, origin, interrupted)
+
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _utterance(self) -> Iterator[threading.Event]:
+        """Register a fresh interrupt flag that :meth:`stop` sets while it is active."""
+
+        interrupted = threading.Event()
+        with self._speaking_lock:
+            self._speaking.add(interrupted)
+        try:
+            yield interrupted
+        finally:
+            with self._speaking_lock:
+                self._speaking.discard(interrupted)
+
+    def _speak_sentences(
+        self, chunks: Iterable[str], origin: float, interrupted: threading.Event
+    ) -> SpeechStreamStats:
+        sentences: "queue.Queue[object]" = queue.Queue()
+
+        def _produce() -> None:
+            segmenter = SentenceSegmenter()
+            try:
+                for chunk in chunks:
+                    for sentence in segmenter.feed(chunk):
+                        sentences.put(sentence)
+                remainder = segmenter.flush()
+                if remainder:
+                    sentences.put(remainder)
+            except BaseException as exc:  # surfaced on the speaking thread
+                sentences.put(exc)
+            finally:
+                sentences.put(_STREAM_DONE)
+
+        producer = threading.Thread(target=_produce, name="jarvis-tts-stream", daemon=True)
+        producer.start()
+
+        spoken = []
+        first_audio: Optional[float] = None
+        while True:
+            item = sentences.get()
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, BaseException):
+                producer.join()
+                raise item
+            if interrupted.is_set():
+                cancel = getattr(chunks, "cancel", None)
+                if callable(cancel):
+                    cancel()
+                break
+            if first_audio is None:
+                first_audio = time.perf_counter() - origin
+            self._say(str(item), interrupted)
+            spoken.append(str(item))
+
+        return SpeechStreamStats(
+            text=" ".join(spoken),
+            sentences=len(spoken),
+            time_to_first_audio=first_audio,
+            total_seconds=time.perf_counter() - origin,
+        )
+
+    def _say(self, message: str, interrupted: threading.Event) -> None:
         message = message.strip()
         if not message:
             return
@@ -51,21 +223,111 @@ class VoiceResponder:
         if self._engine_name in self._TEXT_ONLY_ENGINES:
             return
 
+        with self._tracer.span("tts"):
+            self._synthesize(message, interrupted, printed=should_print)
+
+    def _synthesize(self, message: str, interrupted: threading.Event, *, printed: bool) -> None:
+        if self._play_cached(message, interrupted):
+            return
+
         if self._tts_engine:
-            self._tts_engine.say(message)
-            self._tts_engine.runAndWait()
+            with self._engine_lock:
+                self._tts_engine.say(message)
+                self._tts_engine.runAndWait()
             return
 
+        if self._elevenlabs and self._pyaudio:
+            # rendering through _render lets concurrent speakers of one sentence share it
+            pcm, audio_format = self._render(message)
+            if self._play_pcm(pcm, audio_format, interrupted):
+                return
+
         if self._elevenlabs:
             voice = self._config.voice_id or "Rachel"
             self._elevenlabs.generate_and_play_audio(
                 text=message,
                 voice=voice,
-                model="eleven_multilingual_v2",
+                model=_ELEVENLABS_MODEL,
             )
             return
 
-        if should_print:
+        if printed:
             return
 
         raise RuntimeError("No speech synthesis backend is available.")
+
+    def _phrase_key(self, message: str) -> str:
+        return phrase_key(
+            message,
+            engine=self._engine_name,
+            voice_id=self._config.voice_id,
+            rate=self._config.rate,
+            volume=self._config.volume,
+        )
+
+    def _play_cached(self, message: str, interrupted: threading.Event) -> bool:
+        if not self._phrase_cache or not self._pyaudio:
+            return False
+        phrase = self._phrase_cache.lookup(self._phrase_key(message))
+        if phrase is None:
+            return False
+        with self._phrase_cache.open(phrase) as samples:
+            return self._play_pcm(samples, phrase.format, interrupted)
+
+    def _play_pcm(
+        self,
+        samples: Union[bytes, mmap.mmap],
+        audio_format: PcmFormat,
+        interrupted: threading.Event,
+    ) -> bool:
+        if not self._pyaudio:
+            return False
+        block = audio_format.sample_rate // 20 * audio_format.channels * audio_format.sample_width
+        try:
+            stream = self._pyaudio.open(
+                format=self._pyaudio.get_format_from_width(audio_format.sample_width),
+                channels=audio_format.channels,
+                rate=audio_format.sample_rate,
+                output=True,
+            )
+        except OSError as exc:
+            self._log.debug("PCM playback unavailable: %s", exc)
+            return False
+        try:
+            for offset in range(0, len(samples), block):
+                if interrupted.is_set():
+                    break
+                stream.write(samples[offset : offset + block])
+        finally:
+            stream.stop_stream()
+            stream.close()
+        return True
+
+    def _render(self, message: str) -> Tuple[bytes, PcmFormat]:
+        return self._synthesis.do(self._phrase_key(message), lambda: self._synthesize_pcm(message))
+
+    def _synthesize_pcm(self, message: str) -> Tuple[bytes, PcmFormat]:
+        if self._tts_engine:
+            with tempfile.TemporaryDirectory() as scratch:
+                target = Path(scratch) / "phrase.wav"
+                with self._engine_lock:
+                    self._tts_engine.save_to_file(message, str(target))
+                    self._tts_engine.runAndWait()
+                with wave.open(str(target), "rb") as rendered:
+                    audio_format = PcmFormat(
+                        sample_rate=rendered.getframerate(),
+                        channels=rendered.getnchannels(),
+                        sample_width=rendered.getsampwidth(),
+                    )
+                    return rendered.readframes(rendered.getnframes()), audio_format
+
+        assert self._elevenlabs
+        audio = self._elevenlabs.generate(
+            text=message,
+            voice=self._config.voice_id or "Rachel",
+            model=_ELEVENLABS_MODEL,
+            output_format=f"pcm_{_ELEVENLABS_PCM_RATE}",
+        )
+        if not isinstance(audio, (bytes, bytearray)):
+            audio = b"".join(audio)
+        return bytes(audio), PcmFormat(sample_rate=_ELEVENLABS_PCM_RATE)
@@ -0,0 +1,19 @@
+"""Multi-session server mode: many concurrent clients answered by one assistant."""
+
+from jarvis.server.app import JarvisServer
+from jarvis.server.sessions import (
+    Session,
+    SessionBusyError,
+    SessionLimitError,
+    SessionManager,
+    TurnScheduler,
+)
+
+__all__ = [
+    "JarvisServer",
+    "Session",
+    "SessionBusyError",
+    "SessionLimitError",
+    "SessionManager",
+    "TurnScheduler",
+]
@@ -0,0 +1,253 @@
+"""HTTP and Socket.IO front end that serves many clients from one assistant."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from jarvis.config import ServerConfig
+from jarvis.core.assistant import JarvisAssistant
+from jarvis.server.sessions import (
+    Session,
+    SessionBusyError,
+    SessionLimitError,
+    SessionManager,
+    TurnScheduler,
+)
+from jarvis.telemetry.exporter import PROMETHEUS_CONTENT_TYPE
+from jarvis.telemetry.metrics import MetricsRegistry, get_registry
+from jarvis.telemetry.tracing import Tracer, get_tracer
+from jarvis.utils.logger import get_logger
+from jarvis.utils.startup import lazy_import
+
+# the largest upload Whisper accepts
+_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
+class JarvisServer:
+    """Answer text and audio turns for many concurrent sessions.
+
+    Every session keeps its own conversation memory while the OpenAI
+    connection pool, response cache, skill index and hardware belong to the
+    one shared :class:`JarvisAssistant`. Turns run on a
+    :class:`TurnScheduler`, which bounds how many are answered at once and
+    takes sessions in turn.
+
+    HTTP clients ``POST /sessions`` and then ``POST /sessions/<id>/turns``
+    with ``{"text": ...}`` or a raw audio body. Socket.IO clients get a
+    session per connection, send ``turn`` events and receive the reply as
+    ``chunk`` events followed by the acknowledgement.
+    """
+
+    def __init__(
+        self,
+        assistant: JarvisAssistant,
+        config: ServerConfig,
+        *,
+        registry: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
+        self._flask = lazy_import("flask")
+        flask_socketio = lazy_import("flask_socketio")
+        serving = lazy_import("werkzeug.serving")
+        if self._flask is None or flask_socketio is None or serving is None:
+            raise RuntimeError("Server mode requires flask and flask-socketio.")
+
+        self._assistant = assistant
+        self._registry = registry or get_registry()
+        self._tracer = tracer or get_tracer()
+        self._sessions = SessionManager(
+            max_sessions=config.max_sessions,
+            idle_seconds=config.session_idle_seconds,
+            memory_factory=assistant.new_memory,
+            registry=self._registry,
+        )
+        self._scheduler = TurnScheduler(
+            workers=config.workers, session_queue=config.session_queue, registry=self._registry
+        )
+        self._socket_sessions: Dict[str, str] = {}
+        self._log = get_logger("jarvis.server")
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+        self._app = self._flask.Flask("jarvis.server")
+        self._app.config["MAX_CONTENT_LENGTH"] = _MAX_UPLOAD_BYTES
+        self._socketio = flask_socketio.SocketIO(self._app, async_mode="threading")
+        self._register_routes()
+        self._register_socket_handlers()
+        self._server = serving.make_server(config.host, config.port, self._app, threaded=True)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        return f"http://{self._server.host}:{self._server.port}"
+
+    def start(self) -> "JarvisServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="jarvis-server-http", daemon=True
+        )
+        self._thread.start()
+        self._log.info("Jarvis server listening on %s", self.address)
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+
+        self._log.info("Jarvis server listening on %s", self.address)
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            self._log.info("Interrupted by user. Shutting down.")
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self._server.server_close()
+        self._scheduler.close()
+
+    # ------------------------------------------------------------------
+    def _register_routes(self) -> None:
+        flask = self._flask
+        app = self._app
+
+        @app.post("/sessions")
+        def _create_session() -> Any:
+            try:
+                session = self._sessions.create()
+            except SessionLimitError as exc:
+                return flask.jsonify(error=str(exc)), 503
+            return flask.jsonify(session=session.id), 201
+
+        @app.delete("/sessions/<session_id>")
+        def _close_session(session_id: str) -> Any:
+            if not self._sessions.close(session_id):
+                return flask.jsonify(error="Unknown session."), 404
+            return flask.jsonify(closed=session_id)
+
+        @app.post("/sessions/<session_id>/turns")
+        def _post_turn(session_id: str) -> Any:
+            request = flask.request
+            if request.is_json:
+                message = request.get_json(silent=True) or {}
+                payload, status = self._turn(session_id, text=str(message.get("text") or ""))
+            else:
+                filename = request.args.get("filename", "audio.wav")
+                payload, status = self._turn(
+                    session_id, audio=request.get_data(), filename=filename
+                )
+            return flask.jsonify(payload), status
+
+        @app.get("/health")
+        def _health() -> Any:
+            return flask.jsonify(ok=True, sessions=len(self._sessions))
+
+        @app.get("/metrics")
+        def _metrics() -> Any:
+            body = self._registry.render_prometheus()
+            return flask.Response(body, content_type=PROMETHEUS_CONTENT_TYPE)
+
+        @app.get("/traces")
+        def _traces() -> Any:
+            return flask.jsonify(self._tracer.recent_turns())
+
+    def _register_socket_handlers(self) -> None:
+        flask = self._flask
+        socketio = self._socketio
+
+        @socketio.on("connect")
+        def _connect(_auth: Any = None) -> bool:
+            try:
+                session = self._sessions.create()
+            except SessionLimitError as exc:
+                self._log.warning("Refusing socket client: %s", exc)
+                return False
+            self._socket_sessions[flask.request.sid] = session.id
+            socketio.emit("session", {"session": session.id}, to=flask.request.sid)
+            return True
+
+        @socketio.on("disconnect")
+        def _disconnect(*_args: Any) -> None:
+            session_id = self._socket_sessions.pop(flask.request.sid, None)
+            if session_id is not None:
+                self._sessions.close(session_id)
+
+        @socketio.on("turn")
+        def _on_turn(message: Any) -> Dict[str, Any]:
+            sid = flask.request.sid
+            session_id = self._socket_sessions.get(sid, "")
+            message = message if isinstance(message, dict) else {}
+
+            def _send_chunk(chunk: str) -> None:
+                socketio.emit("chunk", {"text": chunk}, to=sid)
+
+            payload, _status = self._turn(
+                session_id,
+                text=message.get("text"),
+                audio=message.get("audio"),
+                filename=str(message.get("filename") or "audio.wav"),
+                on_chunk=_send_chunk,
+            )
+            return payload
+
+    def _turn(
+        self,
+        session_id: str,
+        *,
+        text: Optional[str] = None,
+        audio: Optional[bytes] = None,
+        filename: str = "audio.wav",
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[Dict[str, Any], int]:
+        """Queue one turn for ``session_id`` and wait for its reply and HTTP status."""
+
+        if not (text and text.strip()) and not audio:
+            return {"error": "Send text or audio."}, 400
+        try:
+            session = self._sessions.get(session_id)
+        except KeyError:
+            return {"error": "Unknown session."}, 404
+
+        submitted = time.perf_counter()
+        try:
+            future = self._scheduler.submit(
+                session, lambda: self._answer(session, submitted, text, audio, filename, on_chunk)
+            )
+            payload = future.result()
+        except SessionBusyError as exc:
+            return {"error": str(exc)}, 429
+        except Exception as exc:
+            self._log.exception("Server turn failed: %s", exc)
+            return {"error": str(exc)}, 500
+        if payload is None:
+            return {"error": "Nothing was heard in that audio."}, 400
+        return payload, 200
+
+    def _answer(
+        self,
+        session: Session,
+        submitted: float,
+        text: Optional[str],
+        audio: Optional[bytes],
+        filename: str,
+        on_chunk: Optional[Callable[[str], None]],
+    ) -> Optional[Dict[str, Any]]:
+        started_at = time.perf_counter()
+        trace = self._tracer.begin_turn(started_at=started_at)
+        with self._tracer.activate(trace):
+            if audio:
+                text = self._assistant.transcribe(audio, filename=filename)
+            result = self._assistant.answer(
+                text or "", started_at=started_at, memory=session.memory, on_chunk=on_chunk
+            )
+        if result is None:
+            return None
+        if result.final:
+            self._sessions.close(session.id)  # "goodbye" ends the session, not the server
+        return {
+            "session": session.id,
+            "queued_seconds": started_at - submitted,
+            "closed": result.final,
+            **result.as_dict(),
+        }
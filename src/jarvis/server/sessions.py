@@ -0,0 +1,241 @@
+"""Per-client sessions and a fair turn scheduler for the multi-session server."""
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from jarvis.core.memory import ConversationMemory
+from jarvis.telemetry.metrics import MetricsRegistry, get_registry
+from jarvis.utils.logger import get_logger
+
+T = TypeVar("T")
+
+_Job = Tuple[Future, Callable[[], object], float]
+
+
+class SessionLimitError(RuntimeError):
+    """Raised when every session slot is taken by an active client."""
+
+
+class SessionBusyError(RuntimeError):
+    """Raised when a session already has as many turns waiting as it may queue."""
+
+
+@dataclass(slots=True)
+class Session:
+    """One client's conversation; skills, caches and devices are shared by all sessions."""
+
+    id: str
+    memory: Optional[ConversationMemory]
+    created_at: float
+    last_active: float
+    turns: int = 0
+    pending: Deque[_Job] = field(default_factory=deque)
+    running: bool = False
+    scheduled: bool = False
+    closed: bool = False
+
+    @property
+    def busy(self) -> bool:
+        return self.running or bool(self.pending)
+
+
+class SessionManager:
+    """Create, look up and expire sessions.
+
+    At most ``max_sessions`` exist at once. When the limit is reached,
+    sessions idle for longer than ``idle_seconds`` are dropped to make room,
+    and :meth:`create` raises :class:`SessionLimitError` if none are.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int,
+        idle_seconds: float,
+        memory_factory: Callable[[], Optional[ConversationMemory]],
+        registry: Optional[MetricsRegistry] = None,
+    ) -> None:
+        self._max_sessions = max(1, max_sessions)
+        self._idle_seconds = idle_seconds
+        self._memory_factory = memory_factory
+        self._sessions: Dict[str, Session] = {}
+        self._lock = threading.Lock()
+        self._log = get_logger("jarvis.server")
+        self._gauge = (registry or get_registry()).gauge(
+            "jarvis_server_sessions", "Open server sessions."
+        )
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self) -> Session:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._sessions) >= self._max_sessions:
+                self._expire(now)
+            if len(self._sessions) >= self._max_sessions:
+                raise SessionLimitError(
+                    f"All {self._max_sessions} sessions are in use; try again later."
+                )
+            session = Session(
+                id=uuid.uuid4().hex,
+                memory=self._memory_factory(),
+                created_at=now,
+                last_active=now,
+            )
+            self._sessions[session.id] = session
+            self._gauge.set(len(self._sessions))
+        return session
+
+    def get(self, session_id: str) -> Session:
+        """Return the open session ``session_id``; raises ``KeyError`` if there is none."""
+
+        session = self._sessions[session_id]
+        session.last_active = time.monotonic()
+        return session
+
+    def close(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            self._gauge.set(len(self._sessions))
+        if session is None:
+            return False
+        session.closed = True  # queued turns are cancelled when the scheduler reaches them
+        return True
+
+    # ------------------------------------------------------------------
+    def _expire(self, now: float) -> None:
+        idle = [
+            session
+            for session in self._sessions.values()
+            if not session.busy and now - session.last_active > self._idle_seconds
+        ]
+        for session in idle:
+            del self._sessions[session.id]
+            session.closed = True
+        if idle:
+            self._log.info("Expired %d idle session(s).", len(idle))
+
+
+class TurnScheduler:
+    """Run turns on a fixed pool of workers, serving sessions in round-robin order.
+
+    A session runs one turn at a time, so its memory sees turns in order, and
+    may queue ``session_queue`` more behind it; past that :meth:`submit`
+    raises :class:`SessionBusyError`. Sessions with work wait in one ready
+    queue and go to the back of it after each turn, so a client sending many
+    turns gets no more of the workers than one sending a single turn.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        session_queue: int,
+        registry: Optional[MetricsRegistry] = None,
+    ) -> None:
+        self._session_queue = max(0, session_queue)
+        self._ready: Deque[Session] = deque()
+        self._cond = threading.Condition()
+        self._closing = False
+        self._log = get_logger("jarvis.server")
+
+        registry = registry or get_registry()
+        self._running = registry.gauge(
+            "jarvis_server_turns_running", "Server turns being answered."
+        )
+        self._queued = registry.gauge(
+            "jarvis_server_turns_queued", "Server turns waiting for a worker."
+        )
+        self._completed = registry.counter(
+            "jarvis_server_turns_total", "Server turns answered, including failed ones."
+        )
+        self._rejected = registry.counter(
+            "jarvis_server_turns_rejected_total",
+            "Server turns refused because their session's queue was full.",
+        )
+        self._wait = registry.histogram(
+            "jarvis_server_queue_wait_seconds", "Time server turns waited for a worker."
+        )
+
+        self._threads: List[threading.Thread] = [
+            threading.Thread(target=self._work, name=f"jarvis-server-{index}", daemon=True)
+            for index in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, session: Session, fn: Callable[[], T]) -> "Future[T]":
+        future: Future = Future()
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("The server is shutting down.")
+            if len(session.pending) + session.running > self._session_queue:
+                self._rejected.inc()
+                raise SessionBusyError("This session already has turns waiting.")
+            session.pending.append((future, fn, time.perf_counter()))
+            self._queued.inc()
+            if not session.running and not session.scheduled:
+                self._schedule(session)
+        return future
+
+    def close(self) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=5.0)
+        for session in self._ready:
+            self._cancel(session)
+        self._ready.clear()
+
+    # ------------------------------------------------------------------
+    def _schedule(self, session: Session) -> None:
+        session.scheduled = True
+        self._ready.append(session)
+        self._cond.notify()
+
+    def _cancel(self, session: Session) -> None:
+        while session.pending:
+            future, _fn, _queued_at = session.pending.popleft()
+            self._queued.dec()
+            future.cancel()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._ready and not self._closing:
+                    self._cond.wait()
+                if self._closing:
+                    return
+                session = self._ready.popleft()
+                session.scheduled = False
+                if session.closed:
+                    self._cancel(session)
+                    continue
+                future, fn, queued_at = session.pending.popleft()
+                session.running = True
+                self._queued.dec()
+                self._running.inc()
+
+            self._wait.observe(time.perf_counter() - queued_at)
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn())
+                except BaseException as exc:
+                    future.set_exception(exc)
+
+            with self._cond:
+                session.running = False
+                session.turns += 1
+                session.last_active = time.monotonic()
+                self._running.dec()
+                self._completed.inc()
+                if session.pending:
+                    self._schedule(session)
@@ -1,15 +1,25 @@
 """Skill system enabling custom voice commands."""
 
 from jarvis.skills.base import Skill, SkillContext, SkillResult
+from jarvis.skills.intents import IntentClassifier, IntentMatch
 from jarvis.skills.lighting import LightingSkill
+from jarvis.skills.matcher import SkillMatch, TriggerIndex, normalize_utterance
 from jarvis.skills.registry import SkillRegistry
 from jarvis.skills.system_control import SystemControlSkill
+from jarvis.skills.tools import ToolBox, ToolResult
 
 __all__ = [
 	"Skill",
 	"SkillContext",
 	"SkillResult",
+	"IntentClassifier",
+	"IntentMatch",
 	"LightingSkill",
+	"SkillMatch",
 	"SkillRegistry",
 	"SystemControlSkill",
+	"ToolBox",
+	"ToolResult",
+	"TriggerIndex",
+	"normalize_utterance",
 ]
@@ -2,9 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Optional, Tuple
 
 from jarvis.hardware.controller import HardwareController
+from jarvis.skills.matcher import TriggerIndex
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jarvis.skills.intents import IntentMatch
 
 
 @dataclass(slots=True)
@@ -20,16 +25,42 @@ class SkillResult:
 
     handled: bool
     response: Optional[str] = None
+    # name of the skill that produced the result; the registry fills it in
+    skill: Optional[str] = None
 
 
 class Skill:
-    """Abstract base class for custom skills."""
+    """Abstract base class for custom skills.
+
+    Skills declare ``triggers`` (verbs such as "turn on") and optionally
+    ``entities`` (objects such as "desk lamp"). The registry compiles them into
+    one index; a skill becomes a candidate when a trigger matches and, if it
+    declares entities, at least one entity matches too. Skills without triggers
+    fall back to ``can_handle``.
+
+    ``examples`` maps intent names to sample phrasings; they train the local
+    intent classifier that catches paraphrases the triggers miss, which then
+    calls ``handle_intent``. ``slots`` maps slot names to phrases extracted
+    from the utterance when present.
+    """
 
     name: str = "generic"
     description: str = ""
+    triggers: Tuple[str, ...] = ()
+    entities: Tuple[str, ...] = ()
+    # Fixed replies that are worth pre-synthesizing at startup.
+    static_responses: Tuple[str, ...] = ()
+    # read-only defaults so no subclass can mutate a mapping shared with the others
+    examples: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+    slots: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
 
     def can_handle(self, text: str) -> bool:
-        raise NotImplementedError
+        if not self.triggers:
+            raise NotImplementedError
+        return bool(TriggerIndex([self]).match(text))
 
     def handle(self, text: str, context: SkillContext) -> SkillResult:
         raise NotImplementedError
+
+    def handle_intent(self, match: "IntentMatch", context: SkillContext) -> SkillResult:
+        return self.handle(match.text, context)
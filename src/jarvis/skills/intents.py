@@ -0,0 +1,194 @@
+"""Local character n-gram TF-IDF intent classifier trained from skill examples."""
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from jarvis.skills.matcher import normalize_utterance
+from jarvis.utils.startup import lazy_import
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jarvis.skills.base import Skill
+
+# General requests that belong to ChatGPT; they train the classifier's rejection
+# class, so a question that merely shares words with a command loses to them.
+# Keep them apart from benchmarks/bench_intent_routing.py, which scores held-out
+# utterances only.
+OUT_OF_DOMAIN: Tuple[str, ...] = (
+    "how fast does light travel through space",
+    "how much power does a fridge use in a year",
+    "what is morse code",
+    "is it worth learning to code at forty",
+    "what time do the shops open on sunday",
+    "should i switch to a cheaper phone plan",
+    "when does the new football season start",
+    "how early should i get to the airport terminal",
+    "who painted the mona lisa",
+    "how do airplanes stay in the air",
+    "why do cats purr",
+    "what year did the second world war end",
+    "convert fifty dollars to euros",
+    "how many hours of sleep do adults need",
+    "what are some stretches for back pain",
+    "recommend a book about ancient rome",
+    "how do vaccines work",
+    "define the word serendipity",
+    "how do i fix a flat bike tyre",
+    "how many people live in canada",
+    "is coffee bad for you",
+    "help me plan a trip to italy",
+    "what does a software engineer do all day",
+)
+
+
+@dataclass(slots=True)
+class IntentMatch:
+    """The best intent for an utterance, with extracted slots and a confidence in [0, 1]."""
+
+    skill: "Skill"
+    intent: str
+    confidence: float
+    text: str
+    slots: Dict[str, str] = field(default_factory=dict)
+
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = (2, 4)) -> Counter:
+    """Count character n-grams inside each word, padded with spaces at word edges."""
+
+    low, high = ngram_range
+    grams: Counter = Counter()
+    for token in normalize_utterance(text):
+        padded = f" {token} "
+        for size in range(low, high + 1):
+            for start in range(len(padded) - size + 1):
+                grams[padded[start : start + size]] += 1
+    return grams
+
+
+def _numpy() -> Any:
+    module = lazy_import("numpy")
+    if module is None:
+        raise RuntimeError("The intent classifier requires numpy.")
+    return module
+
+
+class IntentClassifier:
+    """Score utterances against every skill's example phrases in one matrix product.
+
+    Each example becomes an L2-normalized TF-IDF vector over word-bounded
+    character n-grams, which tolerates inflections and small transcription
+    errors. An utterance is vectorized the same way; its cosine similarity to
+    every example is a gather over the few columns it touches, and an intent's
+    confidence is its best-matching example. Slots are filled from the
+    winning skill's ``slots`` phrases found in the utterance.
+
+    ``out_of_domain`` phrases train a rejection class: when one of them is the
+    best match, or the winning skill declares slots and the utterance names
+    none of them, there is no match and the caller should ask ChatGPT.
+    """
+
+    def __init__(
+        self,
+        skills: Sequence["Skill"],
+        *,
+        ngram_range: Tuple[int, int] = (2, 4),
+        out_of_domain: Sequence[str] = OUT_OF_DOMAIN,
+    ) -> None:
+        self._ngram_range = ngram_range
+        self._labels: List[Tuple[Optional["Skill"], str]] = []
+        self._slot_phrases: Dict[int, List[Tuple[str, Tuple[str, ...]]]] = {}
+        documents: List[Counter] = []
+        for skill in skills:
+            self._slot_phrases[id(skill)] = [
+                (name, normalize_utterance(phrase))
+                for name, phrases in skill.slots.items()
+                for phrase in sorted(phrases, key=len, reverse=True)
+            ]
+            for intent, examples in skill.examples.items():
+                for example in examples:
+                    self._labels.append((skill, intent))
+                    documents.append(char_ngrams(example, ngram_range))
+        self._intents = len(self._labels)
+        for example in out_of_domain:
+            self._labels.append((None, ""))
+            documents.append(char_ngrams(example, ngram_range))
+
+        # numpy loads with the first classifier rather than with the skills package
+        np = self._np = _numpy()
+        self._vocabulary: Dict[str, int] = {}
+        for document in documents:
+            for gram in document:
+                self._vocabulary.setdefault(gram, len(self._vocabulary))
+        document_frequency = np.zeros(len(self._vocabulary), dtype=np.float32)
+        for document in documents:
+            document_frequency[[self._vocabulary[gram] for gram in document]] += 1
+        count = len(documents)
+        self._idf = np.log((1 + count) / (1 + document_frequency)) + 1.0
+        # n-grams never seen in training get the rarest possible weight
+        self._unseen_idf = float(np.log(1 + count)) + 1.0
+
+        self._matrix = np.zeros((count, len(self._vocabulary)), dtype=np.float32)
+        for row, document in enumerate(documents):
+            columns = [self._vocabulary[gram] for gram in document]
+            self._matrix[row, columns] = [1.0 + math.log(n) for n in document.values()]
+        self._matrix *= self._idf
+        norms = np.linalg.norm(self._matrix, axis=1, keepdims=True)
+        self._matrix /= np.maximum(norms, 1e-12)
+        # column-major copy so gathering an utterance's n-grams stays contiguous
+        self._columns = np.asfortranarray(self._matrix)
+
+    def __len__(self) -> int:
+        return self._intents
+
+    def classify(self, text: str) -> Optional[IntentMatch]:
+        if not self._intents:
+            return None
+        np = self._np
+        grams = char_ngrams(text, self._ngram_range)
+        vocabulary = self._vocabulary
+        known = [(vocabulary[gram], n) for gram, n in grams.items() if gram in vocabulary]
+        if not known:
+            return None
+        columns = np.fromiter((column for column, _ in known), dtype=np.intp, count=len(known))
+        weights = np.fromiter(
+            (1.0 + math.log(n) for _, n in known), dtype=np.float32, count=len(known)
+        )
+        weights *= self._idf[columns]
+        # unknown n-grams still count toward the utterance's norm
+        norm = math.sqrt(
+            float(weights @ weights)
+            + sum(
+                ((1.0 + math.log(n)) * self._unseen_idf) ** 2
+                for gram, n in grams.items()
+                if gram not in vocabulary
+            )
+        )
+        scores = self._columns[:, columns] @ weights
+        best = int(np.argmax(scores))
+        skill, intent = self._labels[best]
+        if skill is None:
+            return None
+        slots = self._extract_slots(skill, text)
+        if self._slot_phrases[id(skill)] and not slots:
+            return None
+        return IntentMatch(
+            skill=skill,
+            intent=intent,
+            confidence=float(scores[best]) / norm,
+            text=text,
+            slots=slots,
+        )
+
+    # ------------------------------------------------------------------
+    def _extract_slots(self, skill: "Skill", text: str) -> Dict[str, str]:
+        tokens = normalize_utterance(text)
+        slots: Dict[str, str] = {}
+        for name, phrase in self._slot_phrases[id(skill)]:
+            if name in slots or not phrase:
+                continue
+            width = len(phrase)
+            if any(tokens[i : i + width] == phrase for i in range(len(tokens) - width + 1)):
+                slots[name] = " ".join(phrase)
+        return slots
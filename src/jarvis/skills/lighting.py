@@ -1,38 +1,85 @@
 """Skill that connects natural language cues to lighting hardware actions."""
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from jarvis.skills.base import Skill, SkillContext, SkillResult
+from jarvis.skills.matcher import normalize_utterance
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jarvis.skills.intents import IntentMatch
 
 
 class LightingSkill(Skill):
     name = "lighting"
     description = "Turn lights or other GPIO devices on and off."
+    triggers = ("turn on", "turn off")
 
     def __init__(self, device_name: str = "desk_lamp") -> None:
         self._device_name = device_name.lower()
-
-    def can_handle(self, text: str) -> bool:
-        lowered = text.lower()
-        return self._device_name in lowered and (
-            "turn on" in lowered or "turn off" in lowered
+        spoken_name = self._device_name.replace("_", " ")
+        self.entities = (spoken_name,)
+        self.static_responses = (
+            f"Turning on the {spoken_name}.",
+            f"Turning off the {spoken_name}.",
+            f"The {spoken_name} is already on.",
+            f"The {spoken_name} is already off.",
+            f"I do not have control of the {self._device_name} yet.",
         )
+        self.examples = {
+            "turn_on": (
+                f"turn on the {spoken_name}",
+                f"switch the {spoken_name} on",
+                f"switch on the {spoken_name}",
+                f"power up the {spoken_name}",
+                f"{spoken_name} on please",
+                "lights on",
+                "turn the lights on",
+                "i need some light in here",
+            ),
+            "turn_off": (
+                f"turn off the {spoken_name}",
+                f"switch the {spoken_name} off",
+                f"switch off the {spoken_name}",
+                f"shut off the {spoken_name}",
+                f"kill the {spoken_name}",
+                f"{spoken_name} off please",
+                "lights off",
+                "turn the lights off",
+            ),
+        }
+        self.slots = {"device": (spoken_name, "lamp", "light", "lights")}
 
     def handle(self, text: str, context: SkillContext) -> SkillResult:
-        lowered = text.lower()
+        lowered = " ".join(normalize_utterance(text))
         if "turn on" in lowered:
-            action = f"turn_on_{self._device_name}"
-            response = f"Turning on the {self._device_name.replace('_', ' ')}."
-        elif "turn off" in lowered:
-            action = f"turn_off_{self._device_name}"
-            response = f"Turning off the {self._device_name.replace('_', ' ')}."
-        else:
+            return self._switch("turn_on", context)
+        if "turn off" in lowered:
+            return self._switch("turn_off", context)
+        return SkillResult(handled=False)
+
+    def handle_intent(self, match: "IntentMatch", context: SkillContext) -> SkillResult:
+        if match.intent not in self.examples:
             return SkillResult(handled=False)
+        return self._switch(match.intent, context)
+
+    # ------------------------------------------------------------------
+    def _switch(self, intent: str, context: SkillContext) -> SkillResult:
+        action = f"{intent}_{self._device_name}"
+        verb = "on" if intent == "turn_on" else "off"
+        spoken_name = self._device_name.replace("_", " ")
+        response = f"Turning {verb} the {spoken_name}."
+
+        hardware = context.hardware
+        if hardware.has_device(self._device_name):
+            if hardware.state(self._device_name).power == (intent == "turn_on"):
+                return SkillResult(handled=True, response=f"The {spoken_name} is already {verb}.")
 
-        if not context.hardware.has_action(action):
+        if not hardware.has_action(action):
             return SkillResult(
                 handled=True,
                 response=f"I do not have control of the {self._device_name} yet.",
             )
 
-        context.hardware.execute(action)
+        hardware.execute(action)
         return SkillResult(handled=True, response=response)
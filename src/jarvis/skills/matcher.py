@@ -0,0 +1,112 @@
+"""Compiled trigger index that routes utterances to skills in a single pass."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jarvis.skills.base import Skill
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+_TRIGGER = 0
+_ENTITY = 1
+
+
+def normalize_utterance(text: str) -> Tuple[str, ...]:
+    """Lowercase ``text`` and split it into word tokens.
+
+    Underscores count as separators so ``desk_lamp`` and ``desk lamp`` normalize
+    to the same tokens.
+    """
+
+    return tuple(_TOKEN_PATTERN.findall(text.lower().replace("_", " ")))
+
+
+@dataclass(slots=True)
+class SkillMatch:
+    """A skill whose declared phrases were found in an utterance."""
+
+    skill: "Skill"
+    score: int
+    triggers: List[str] = field(default_factory=list)
+    entities: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Node:
+    children: Dict[str, "_Node"] = field(default_factory=dict)
+    # (skill position, phrase kind, phrase text, phrase length in tokens)
+    terminals: List[Tuple[int, int, str, int]] = field(default_factory=list)
+
+
+class TriggerIndex:
+    """Token trie over every skill's trigger phrases and entities.
+
+    Matching walks the trie once from each token of the utterance, so the cost
+    depends on the utterance length and the longest phrase, not on how many
+    skills are registered.
+    """
+
+    def __init__(self, skills: Sequence["Skill"]) -> None:
+        self._skills = list(skills)
+        self._root = _Node()
+        self._needs_entity = [bool(skill.entities) for skill in self._skills]
+
+        for position, skill in enumerate(self._skills):
+            for phrase in skill.triggers:
+                self._insert(phrase, position, _TRIGGER)
+            for phrase in skill.entities:
+                self._insert(phrase, position, _ENTITY)
+
+    def match(self, text: str) -> List[SkillMatch]:
+        return self.match_tokens(normalize_utterance(text))
+
+    def match_tokens(self, tokens: Sequence[str]) -> List[SkillMatch]:
+        """Return candidate skills ranked by how much of the utterance they cover."""
+
+        hits: Dict[int, SkillMatch] = {}
+        root = self._root
+        count = len(tokens)
+        for start in range(count):
+            node = root
+            for index in range(start, count):
+                node = node.children.get(tokens[index])
+                if node is None:
+                    break
+                for position, kind, phrase, length in node.terminals:
+                    match = hits.get(position)
+                    if match is None:
+                        match = hits[position] = SkillMatch(
+                            skill=self._skills[position], score=0
+                        )
+                    if kind == _TRIGGER:
+                        match.triggers.append(phrase)
+                    else:
+                        match.entities.append(phrase)
+                    match.score += length
+
+        ranked = [
+            (position, match)
+            for position, match in hits.items()
+            if match.triggers and (match.entities or not self._needs_entity[position])
+        ]
+        ranked.sort(key=lambda item: (-item[1].score, item[0]))
+        return [match for _, match in ranked]
+
+    # ------------------------------------------------------------------
+    def _insert(self, phrase: str, position: int, kind: int) -> None:
+        tokens = normalize_utterance(phrase)
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.children.setdefault(token, _Node())
+        node.terminals.append((position, kind, " ".join(tokens), len(tokens)))
+
+
+def compile_index(skills: Iterable["Skill"]) -> TriggerIndex:
+    """Build a :class:`TriggerIndex` for the skills that declare triggers."""
+
+    return TriggerIndex([skill for skill in skills if skill.triggers])
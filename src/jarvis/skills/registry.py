@@ -4,28 +4,91 @@ from __future__ import annotations
 from typing import Iterable, List, Optional
 
 from jarvis.skills.base import Skill, SkillContext, SkillResult
+from jarvis.skills.intents import IntentClassifier, IntentMatch
+from jarvis.skills.matcher import TriggerIndex, compile_index, normalize_utterance
 
 
 class SkillRegistry:
-    """Simple in-memory registry for skill discovery and execution."""
+    """Simple in-memory registry for skill discovery and execution.
 
-    def __init__(self, skills: Optional[Iterable[Skill]] = None) -> None:
+    Utterances that no trigger claims are scored by a local intent classifier
+    trained from the skills' ``examples``; a prediction at or above
+    ``intent_threshold`` is handed to that skill, while general questions the
+    classifier rejects go on to ChatGPT. Pass ``None`` to disable.
+    """
+
+    def __init__(
+        self,
+        skills: Optional[Iterable[Skill]] = None,
+        *,
+        intent_threshold: Optional[float] = 0.5,
+    ) -> None:
         self._skills: List[Skill] = list(skills or [])
+        self._index: Optional[TriggerIndex] = None
+        self._legacy: List[Skill] = []
+        self._intent_threshold = intent_threshold
+        self._classifier: Optional[IntentClassifier] = None
 
     def register(self, skill: Skill) -> None:
         self._skills.append(skill)
+        self._index = None
+        self._classifier = None
 
     def extend(self, skills: Iterable[Skill]) -> None:
         for skill in skills:
             self.register(skill)
 
+    def prepare(self) -> None:
+        """Build the trigger index and intent classifier ahead of the first utterance."""
+
+        self.candidates("")
+        if self._intent_threshold is not None and self._classifier is None:
+            self._classifier = IntentClassifier(self._skills)
+
+    def candidates(self, text: str) -> List[Skill]:
+        """Return the skills that may handle ``text``, best match first.
+
+        Skills with declared triggers are ranked by the compiled index; legacy
+        skills that only implement ``can_handle`` are checked afterwards in
+        registration order.
+        """
+
+        if self._index is None:
+            self._index = compile_index(self._skills)
+            self._legacy = [skill for skill in self._skills if not skill.triggers]
+        ranked = [match.skill for match in self._index.match_tokens(normalize_utterance(text))]
+        ranked.extend(skill for skill in self._legacy if skill.can_handle(text))
+        return ranked
+
+    def classify(self, text: str) -> Optional[IntentMatch]:
+        """Return the classifier's best intent for ``text``, whatever its confidence."""
+
+        if self._classifier is None:
+            self._classifier = IntentClassifier(self._skills)
+        return self._classifier.classify(text)
+
     def handle(self, text: str, context: SkillContext) -> Optional[SkillResult]:
-        for skill in self._skills:
-            if skill.can_handle(text):
-                result = skill.handle(text, context)
-                if result.handled:
-                    return result
-        return None
+        for skill in self.candidates(text):
+            result = skill.handle(text, context)
+            if result.handled:
+                result.skill = result.skill or skill.name
+                return result
+        if self._intent_threshold is None:
+            return None
+        match = self.classify(text)
+        if match is None or match.confidence < self._intent_threshold:
+            return None
+        result = match.skill.handle_intent(match, context)
+        if not result.handled:
+            return None
+        result.skill = result.skill or match.skill.name
+        return result
+
+    def static_responses(self) -> List[str]:
+        return [response for skill in self._skills for response in skill.static_responses]
+
+    def skills(self) -> List[Skill]:
+        return list(self._skills)
 
     def names(self) -> List[str]:
         return [skill.name for skill in self._skills]
@@ -1,49 +1,97 @@
 """Skill for performing common desktop automation tasks."""
 from __future__ import annotations
 
-import os
-import subprocess
-from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from jarvis.skills.base import Skill, SkillContext, SkillResult
+from jarvis.system.launcher import AppLauncher, AppSpec, default_terminal_commands
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jarvis.skills.intents import IntentMatch
+
+# (starting, already running) replies per intent
+_RESPONSES = {
+    "open_vscode": ("Opening Visual Studio Code.", "Visual Studio Code is already open."),
+    "open_terminal": ("Terminal is on the way.", "A terminal is already open."),
+}
 
 
 class SystemControlSkill(Skill):
     name = "system_control"
     description = "Launch desktop applications and perform OS commands."
+    triggers = ("open", "launch", "start")
+    entities = ("visual studio code", "vs code", "terminal")
+    static_responses = tuple(reply for replies in _RESPONSES.values() for reply in replies)
 
-    def can_handle(self, text: str) -> bool:
-        lowered = text.lower()
-        return any(keyword in lowered for keyword in ("open", "launch", "start"))
+    def __init__(self, launcher: Optional[AppLauncher] = None) -> None:
+        self._launcher = launcher or AppLauncher()
+        self.apps = {
+            "open_vscode": AppSpec(
+                key="vscode",
+                label="Visual Studio Code",
+                commands=("code", "code-insiders", "codium"),
+                desktop_names=("visual studio code", "vscodium"),
+            ),
+            "open_terminal": AppSpec(
+                key="terminal",
+                label="a terminal",
+                commands=default_terminal_commands(),
+                desktop_names=("terminal",),
+                # gnome-terminal asks an already running server for a new window
+                process_names=("gnome-terminal-server",),
+            ),
+        }
+        self.examples = {
+            "open_vscode": (
+                "open visual studio code",
+                "launch vs code",
+                "start vs code",
+                "fire up code",
+                "bring up the code editor",
+                "open my editor",
+                "i want to write some code",
+            ),
+            "open_terminal": (
+                "open a terminal",
+                "launch the terminal",
+                "start a terminal window",
+                "fire up a shell",
+                "give me a command prompt",
+                "give me a terminal",
+                "open a console",
+                "bring up the command line",
+            ),
+        }
+        self.slots = {
+            "app": (
+                "visual studio code", "vs code", "vscode", "code", "editor",
+                "terminal", "shell", "console", "command prompt", "command line",
+            ),
+        }
 
     def handle(self, text: str, context: SkillContext) -> SkillResult:
         lowered = text.lower()
         if "visual studio code" in lowered or "vs code" in lowered:
-            self._launch_vscode()
-            return SkillResult(handled=True, response="Opening Visual Studio Code.")
-
+            return self._open("open_vscode")
         if "terminal" in lowered:
-            self._launch_terminal()
-            return SkillResult(handled=True, response="Terminal is on the way.")
-
+            return self._open("open_terminal")
         return SkillResult(handled=False)
 
-    def _launch_vscode(self) -> None:
-        command = self._detect_vscode_command()
-        subprocess.Popen(command, shell=True)
-
-    def _launch_terminal(self) -> None:
-        if os.name == "nt":
-            subprocess.Popen("start powershell", shell=True)
-        else:
-            subprocess.Popen(["gnome-terminal"])  # basic fallback
-
-    def _detect_vscode_command(self) -> str:
-        if os.name == "nt":
-            return "code"
-
-        candidates = ["code", "/usr/bin/code", "/snap/bin/code"]
-        for candidate in candidates:
-            if Path(candidate).exists():
-                return candidate
-        return "code"
+    def handle_intent(self, match: "IntentMatch", context: SkillContext) -> SkillResult:
+        return self._open(match.intent)
+
+    # ------------------------------------------------------------------
+    def _open(self, intent: str) -> SkillResult:
+        spec = self.apps.get(intent)
+        if spec is None:
+            return SkillResult(handled=False)
+        try:
+            launched = self._launcher.open(spec)
+        except OSError as exc:
+            return SkillResult(handled=True, response=f"I could not start {spec.label}: {exc}.")
+        if launched is None:
+            return SkillResult(
+                handled=True, response=f"I could not find {spec.label} on this machine."
+            )
+        opening, already_open = _RESPONSES[intent]
+        return SkillResult(handled=True, response=already_open if launched.reused else opening)
@@ -0,0 +1,147 @@
+"""Expose skills and hardware actions to the model as function-calling tools."""
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from jarvis.skills.base import Skill, SkillContext
+from jarvis.skills.intents import IntentMatch
+from jarvis.utils.logger import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from jarvis.integrations.openai_client import ToolCall
+
+_SKILL_PREFIX = "skill_"
+_DEVICE_PREFIX = "device_"
+_INVALID_NAME = re.compile(r"[^a-zA-Z0-9_-]")
+
+
+@dataclass(slots=True)
+class ToolResult:
+    """Outcome of one executed tool call."""
+
+    call: "ToolCall"
+    ok: bool
+    output: str
+
+
+def _tool_name(prefix: str, name: str) -> str:
+    return (prefix + _INVALID_NAME.sub("_", name))[:64]
+
+
+class ToolBox:
+    """Translate skills and hardware actions to tool schemas and run the model's calls.
+
+    Every skill that declares ``examples`` becomes a tool whose ``intent``
+    parameter enumerates its intents and whose other parameters are its
+    slots; every registered hardware action becomes a parameterless tool.
+    :meth:`execute` runs a plan's calls on a thread pool: calls to different
+    tools run concurrently, calls to the same tool keep their order.
+    """
+
+    def __init__(self, skills: Sequence[Skill], *, max_workers: int = 4) -> None:
+        self._skills: Dict[str, Skill] = {
+            _tool_name(_SKILL_PREFIX, skill.name): skill for skill in skills if skill.examples
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="jarvis-tool"
+        )
+        self._log = get_logger("jarvis.tools")
+
+    def schemas(self, context: SkillContext) -> List[dict]:
+        tools = [self._skill_schema(name, skill) for name, skill in self._skills.items()]
+        for action, description in context.hardware.summary().items():
+            tools.append(
+                {
+                    "type": "function",
+                    "function": {
+                        "name": _tool_name(_DEVICE_PREFIX, action),
+                        "description": f"Run the hardware action '{action}'. {description}".strip(),
+                        "parameters": {"type": "object", "properties": {}},
+                    },
+                }
+            )
+        return tools
+
+    def execute(self, calls: Sequence["ToolCall"], context: SkillContext) -> List[ToolResult]:
+        """Run ``calls`` and return their results in the order they were requested."""
+
+        lanes: Dict[str, List[int]] = {}
+        for position, call in enumerate(calls):
+            lanes.setdefault(call.name, []).append(position)
+        results: List[Optional[ToolResult]] = [None] * len(calls)
+
+        def _run_lane(positions: List[int]) -> None:
+            for position in positions:
+                results[position] = self._run(calls[position], context)
+
+        futures = [self._executor.submit(_run_lane, positions) for positions in lanes.values()]
+        for future in futures:
+            future.result()
+        return results  # type: ignore[return-value]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    def _run(self, call: "ToolCall", context: SkillContext) -> ToolResult:
+        try:
+            if call.name in self._skills:
+                return self._run_skill(call, self._skills[call.name], context)
+            action = self._device_action(call.name, context)
+            if action is None:
+                return ToolResult(call=call, ok=False, output=f"I do not know how to {call.name}.")
+            context.hardware.execute(action).result()
+            return ToolResult(call=call, ok=True, output=f"Done: {action.replace('_', ' ')}.")
+        except Exception as exc:
+            self._log.exception("Tool call %s failed: %s", call.name, exc)
+            return ToolResult(call=call, ok=False, output=f"{call.name} failed.")
+
+    def _run_skill(self, call: "ToolCall", skill: Skill, context: SkillContext) -> ToolResult:
+        arguments: Dict[str, Any] = dict(call.arguments)
+        intent = str(arguments.pop("intent", ""))
+        if intent not in skill.examples:
+            return ToolResult(call=call, ok=False, output=f"{skill.name} cannot {intent}.")
+        slots = {key: str(value) for key, value in arguments.items() if key in skill.slots}
+        # the first example stands in for the utterance so text-based handlers still work
+        match = IntentMatch(
+            skill=skill,
+            intent=intent,
+            confidence=1.0,
+            text=skill.examples[intent][0],
+            slots=slots,
+        )
+        result = skill.handle_intent(match, context)
+        return ToolResult(call=call, ok=result.handled, output=result.response or "")
+
+    @staticmethod
+    def _device_action(tool: str, context: SkillContext) -> Optional[str]:
+        for action in context.hardware.summary():
+            if _tool_name(_DEVICE_PREFIX, action) == tool:
+                return action
+        return None
+
+    @staticmethod
+    def _skill_schema(name: str, skill: Skill) -> dict:
+        properties: Dict[str, dict] = {
+            "intent": {"type": "string", "enum": sorted(skill.examples)},
+        }
+        for slot, values in skill.slots.items():
+            properties[slot] = {"type": "string", "description": "e.g. " + ", ".join(values[:4])}
+        examples = "; ".join(
+            f"{intent}: '{phrases[0]}'" for intent, phrases in skill.examples.items() if phrases
+        )
+        return {
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": f"{skill.description} Intents: {examples}".strip(),
+                "parameters": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": ["intent"],
+                },
+            },
+        }
@@ -0,0 +1,5 @@
+"""Operating-system integration: application discovery and launching."""
+
+from jarvis.system.launcher import AppLauncher, AppSpec, ExecutableIndex, LaunchResult
+
+__all__ = ["AppLauncher", "AppSpec", "ExecutableIndex", "LaunchResult"]
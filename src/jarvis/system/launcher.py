@@ -0,0 +1,363 @@
+"""Resolve, launch and track desktop applications without a shell."""
+from __future__ import annotations
+
+import os
+import shlex
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from jarvis.utils.logger import get_logger
+
+# desktop entry field codes (%f, %U, ...) that only make sense to a file manager
+_FIELD_CODES = {"%f", "%F", "%u", "%U", "%d", "%D", "%n", "%N", "%i", "%c", "%k", "%v", "%m"}
+
+
+@dataclass(slots=True, frozen=True)
+class AppSpec:
+    """An application that can be opened by voice.
+
+    ``commands`` are executable names tried in order; ``desktop_names`` are
+    display names looked up in installed ``.desktop`` entries when none of
+    the commands is on ``PATH``. A running instance is recognised by a window
+    class or process name equal to one of the ``commands`` or, for apps whose
+    launcher hands off to a differently named process, ``process_names``.
+    """
+
+    key: str
+    label: str
+    commands: Tuple[str, ...]
+    desktop_names: Tuple[str, ...] = ()
+    process_names: Tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class LaunchResult:
+    """Outcome of opening an application."""
+
+    key: str
+    pid: Optional[int]
+    reused: bool = False
+    focused: bool = False
+
+
+def _default_desktop_dirs() -> List[Path]:
+    data_home = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
+    data_dirs = os.environ.get("XDG_DATA_DIRS", "/usr/local/share:/usr/share").split(os.pathsep)
+    dirs = [data_home / "applications"]
+    dirs.extend(Path(entry) / "applications" for entry in data_dirs if entry)
+    dirs.append(Path("/var/lib/snapd/desktop/applications"))
+    return dirs
+
+
+class ExecutableIndex:
+    """Name-to-path index of ``PATH`` executables and desktop entries.
+
+    The index is built once and rebuilt only when ``PATH`` changes or one of
+    the indexed directories is modified (its mtime changes). Directory mtimes
+    are re-checked at most every ``recheck_seconds``, so a lookup is normally
+    a dictionary hit.
+    """
+
+    def __init__(
+        self,
+        *,
+        extra_dirs: Sequence[Path] = (Path("/snap/bin"),),
+        desktop_dirs: Optional[Sequence[Path]] = None,
+        recheck_seconds: float = 2.0,
+    ) -> None:
+        self._extra_dirs = [Path(entry) for entry in extra_dirs]
+        self._desktop_dirs = (
+            list(desktop_dirs) if desktop_dirs is not None else _default_desktop_dirs()
+        )
+        self._recheck_seconds = recheck_seconds
+        self._executables: Dict[str, str] = {}
+        self._desktop: Dict[str, List[str]] = {}
+        self._signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def which(self, name: str) -> Optional[str]:
+        """Return the full path of executable ``name``, like ``shutil.which``."""
+
+        self._refresh()
+        return self._executables.get(name.lower())
+
+    def desktop_command(self, display_name: str) -> Optional[List[str]]:
+        """Return the argv of the desktop entry whose ``Name`` is ``display_name``."""
+
+        self._refresh()
+        command = self._desktop.get(display_name.lower())
+        return list(command) if command else None
+
+    def resolve(self, spec: AppSpec) -> Optional[List[str]]:
+        for command in spec.commands:
+            path = self.which(command)
+            if path:
+                return [path]
+        for name in spec.desktop_names:
+            argv = self.desktop_command(name)
+            if argv:
+                return argv
+        return None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._signature = None
+
+    # ------------------------------------------------------------------
+    def _path_dirs(self) -> List[Path]:
+        dirs = [Path(entry) for entry in os.get_exec_path() if entry]
+        return dirs + [entry for entry in self._extra_dirs if entry not in dirs]
+
+    def _current_signature(self) -> Tuple:
+        stamps = []
+        for directory in [*self._path_dirs(), *self._desktop_dirs]:
+            try:
+                stamps.append((str(directory), directory.stat().st_mtime_ns))
+            except OSError:
+                stamps.append((str(directory), None))
+        return (os.environ.get("PATH", ""), tuple(stamps))
+
+    def _refresh(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._signature is not None and now - self._checked_at < self._recheck_seconds:
+                return
+            self._checked_at = now
+            signature = self._current_signature()
+            if signature == self._signature:
+                return
+            self._signature = signature
+            self._executables = self._scan_path()
+            self._desktop = self._scan_desktop_entries()
+            self.builds += 1
+
+    def _scan_path(self) -> Dict[str, str]:
+        suffixes = [""]
+        if os.name == "nt":
+            suffixes += [ext.lower() for ext in os.environ.get("PATHEXT", ".EXE").split(";")]
+        found: Dict[str, str] = {}
+        for directory in self._path_dirs():
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if not entry.is_file() or not os.access(entry.path, os.X_OK):
+                        continue
+                except OSError:
+                    continue
+                name = entry.name.lower()
+                # earlier PATH entries win, as they do for the shell
+                found.setdefault(name, entry.path)
+                for suffix in suffixes[1:]:
+                    if name.endswith(suffix):
+                        found.setdefault(name[: -len(suffix)], entry.path)
+        return found
+
+    def _scan_desktop_entries(self) -> Dict[str, List[str]]:
+        found: Dict[str, List[str]] = {}
+        for directory in self._desktop_dirs:
+            try:
+                paths = sorted(directory.glob("*.desktop"))
+            except OSError:
+                continue
+            for path in paths:
+                parsed = _parse_desktop_entry(path)
+                if parsed:
+                    found.setdefault(parsed[0].lower(), parsed[1])
+        return found
+
+
+def _parse_desktop_entry(path: Path) -> Optional[Tuple[str, List[str]]]:
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return None
+    name = command = None
+    in_entry = False
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            in_entry = line == "[Desktop Entry]"
+            continue
+        if not in_entry or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        if key == "Name" and name is None:
+            name = value
+        elif key == "Exec" and command is None:
+            command = value
+        elif key in ("NoDisplay", "Hidden") and value.lower() == "true":
+            return None
+    if not name or not command:
+        return None
+    try:
+        argv = [part for part in shlex.split(command) if part not in _FIELD_CODES]
+    except ValueError:
+        return None
+    return (name, argv) if argv else None
+
+
+def _find_process(names: Set[str]) -> Optional[int]:
+    """Return the PID of a process called one of ``names``, from ``/proc/*/comm``."""
+
+    # the kernel truncates comm to 15 characters
+    wanted = {name[:15] for name in names}
+    own = os.getpid()
+    try:
+        entries = list(os.scandir("/proc"))
+    except OSError:  # not Linux
+        return None
+    for entry in entries:
+        if not entry.name.isdigit() or int(entry.name) == own:
+            continue
+        try:
+            comm = Path(entry.path, "comm").read_text(encoding="utf-8").strip().lower()
+        except OSError:  # exited meanwhile, or not ours to read
+            continue
+        if comm in wanted:
+            return int(entry.name)
+    return None
+
+
+class AppLauncher:
+    """Start applications by direct exec, reap them, and reuse running instances.
+
+    Children are started without a shell, detached from the assistant's
+    stdio, and polled by one background reaper thread so none are left as
+    zombies. Before starting a duplicate, :meth:`open` looks for a running
+    instance by window class with ``wmctrl -lpx`` and focuses it, or, without
+    a window manager to ask, by process name in ``/proc``. The PIDs of the
+    children themselves are no use for this: ``code``, ``x-terminal-emulator``
+    and ``wt`` hand the window to another process and exit within a second.
+    """
+
+    def __init__(
+        self, index: Optional[ExecutableIndex] = None, *, reap_interval: float = 1.0
+    ) -> None:
+        self._index = index or ExecutableIndex()
+        self._reap_interval = reap_interval
+        self._running: Dict[str, subprocess.Popen] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._log = get_logger("jarvis.launcher")
+
+    @property
+    def index(self) -> ExecutableIndex:
+        return self._index
+
+    def open(self, spec: AppSpec, *, reuse: bool = True) -> Optional[LaunchResult]:
+        """Open ``spec``; returns ``None`` when it is not installed."""
+
+        if reuse:
+            existing = self._find_instance(spec)
+            if existing is not None:
+                return existing
+        argv = self._index.resolve(spec)
+        if argv is None:
+            return None
+        process = self.spawn(spec.key, argv)
+        return LaunchResult(key=spec.key, pid=process.pid)
+
+    def spawn(self, key: str, argv: Sequence[str]) -> subprocess.Popen:
+        options: Dict[str, object] = {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.DEVNULL,
+            "close_fds": True,
+        }
+        if os.name == "nt":
+            options["creationflags"] = getattr(subprocess, "CREATE_NEW_CONSOLE", 0)
+        else:
+            options["start_new_session"] = True
+        process = subprocess.Popen(list(argv), **options)  # noqa: S603 - no shell involved
+        self._log.debug("Started %s (pid %d): %s", key, process.pid, " ".join(argv))
+        with self._lock:
+            self._running[key] = process
+            self._ensure_reaper()
+        return process
+
+    def running(self, key: str) -> Optional[subprocess.Popen]:
+        """Return the child started under ``key`` while it has not exited."""
+
+        with self._lock:
+            process = self._running.get(key)
+            if process is None or process.poll() is not None:
+                self._running.pop(key, None)
+                return None
+            return process
+
+    def tracked(self) -> Dict[str, int]:
+        with self._lock:
+            return {key: process.pid for key, process in self._running.items()}
+
+    # ------------------------------------------------------------------
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = threading.Thread(
+                target=self._reap_loop, name="jarvis-reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        while True:
+            time.sleep(self._reap_interval)
+            with self._lock:
+                for key, process in list(self._running.items()):
+                    if process.poll() is not None:  # poll() collects the exit status
+                        self._log.debug("%s exited with %s.", key, process.returncode)
+                        del self._running[key]
+                if not self._running:
+                    self._reaper = None
+                    return
+
+    def _find_instance(self, spec: AppSpec) -> Optional[LaunchResult]:
+        names = {name.lower() for name in (*spec.commands, *spec.process_names)}
+        wmctrl = self._index.which("wmctrl")
+        windows = self._windows(wmctrl) if wmctrl is not None else None
+        if wmctrl is None or windows is None:
+            pid = _find_process(names)
+            return None if pid is None else LaunchResult(key=spec.key, pid=pid, reused=True)
+        for window_id, pid, wm_class in windows:
+            # WM_CLASS is "instance.Class", e.g. "code.Code" or "xterm.XTerm"
+            if names.intersection(wm_class.lower().split(".")):
+                result = subprocess.run(
+                    [wmctrl, "-ia", window_id], capture_output=True, timeout=2, check=False
+                )
+                return LaunchResult(
+                    key=spec.key, pid=pid, reused=True, focused=result.returncode == 0
+                )
+        return None
+
+    def _windows(self, wmctrl: str) -> Optional[List[Tuple[str, Optional[int], str]]]:
+        """List ``(window id, pid, WM_CLASS)``; ``None`` when there is no window manager."""
+
+        try:
+            listing = subprocess.run(
+                [wmctrl, "-lpx"], capture_output=True, text=True, timeout=2, check=False
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if listing.returncode != 0:
+            return None
+        windows = []
+        for line in listing.stdout.splitlines():
+            parts = line.split(None, 4)
+            if len(parts) >= 4:
+                pid = int(parts[2]) if parts[2].isdigit() and parts[2] != "0" else None
+                windows.append((parts[0], pid, parts[3]))
+        return windows
+
+
+def default_terminal_commands() -> Tuple[str, ...]:
+    if os.name == "nt":
+        return ("wt", "powershell", "cmd")
+    return ("x-terminal-emulator", "gnome-terminal", "konsole", "xfce4-terminal", "xterm")
+
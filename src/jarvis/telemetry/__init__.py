@@ -0,0 +1,23 @@
+"""Per-turn tracing, latency metrics and their exporters."""
+
+from jarvis.telemetry.events import Event, EventBus, get_event_bus
+from jarvis.telemetry.exporter import MetricsServer, dump
+from jarvis.telemetry.metrics import Counter, Gauge, Histogram, MetricsRegistry, get_registry
+from jarvis.telemetry.tracing import Tracer, TurnTrace, configure_tracing, get_tracer
+
+__all__ = [
+    "Counter",
+    "Event",
+    "EventBus",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsServer",
+    "Tracer",
+    "TurnTrace",
+    "configure_tracing",
+    "dump",
+    "get_event_bus",
+    "get_registry",
+    "get_tracer",
+]
@@ -0,0 +1,86 @@
+"""In-process event bus feeding the dashboard without slowing the assistant."""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class Event:
+    """Something that happened: a transcript, a reply, a device command, a turn."""
+
+    seq: int
+    kind: str
+    time: float
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"seq": self.seq, "kind": self.kind, "time": self.time, **self.data}
+
+
+class EventBus:
+    """Fixed-size ring of recent events read through per-reader cursors.
+
+    :meth:`publish` stores the event in a preallocated slot and never waits on
+    readers, so it costs the same with no dashboard or with hundreds of
+    clients. Each reader remembers only the sequence number it has read up
+    to; a reader that falls more than ``capacity`` events behind loses the
+    oldest ones, and :meth:`read` reports how many were dropped.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._capacity = max(1, capacity)
+        self._ring: List[Optional[Event]] = [None] * self._capacity
+        self._head = 0  # sequence number of the next event
+        self._lock = threading.Lock()
+        self._published = threading.Condition(self._lock)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def head(self) -> int:
+        """Sequence number the next event will get; a cursor here sees only new events."""
+
+        return self._head
+
+    def publish(self, kind: str, **data: Any) -> None:
+        stamp = time.time()
+        with self._lock:
+            seq = self._head
+            self._ring[seq % self._capacity] = Event(seq, kind, stamp, data)
+            self._head = seq + 1
+            self._published.notify_all()
+
+    def read(self, cursor: int, limit: int) -> Tuple[List[Event], int, int]:
+        """Return up to ``limit`` events from ``cursor`` on, the next cursor, and drops."""
+
+        with self._lock:
+            oldest = max(0, self._head - self._capacity)
+            start = max(cursor, oldest)
+            end = min(self._head, start + max(0, limit))
+            events = [self._ring[seq % self._capacity] for seq in range(start, end)]
+        dropped = start - cursor if cursor < start else 0
+        return events, end, dropped  # type: ignore[return-value]
+
+    def recent(self, limit: int) -> List[Event]:
+        events, _, _ = self.read(max(0, self._head - limit), limit)
+        return events
+
+    def wait(self, cursor: int, timeout: Optional[float] = None) -> bool:
+        """Block until an event at or after ``cursor`` exists; False on timeout."""
+
+        with self._published:
+            return self._published.wait_for(lambda: self._head > cursor, timeout)
+
+
+_default_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Process-wide bus the assistant, hardware and dashboard share."""
+
+    return _default_bus
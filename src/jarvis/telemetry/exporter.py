@@ -0,0 +1,95 @@
+"""HTTP endpoint serving metrics as Prometheus text and as JSON."""
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+from jarvis.telemetry.metrics import MetricsRegistry, get_registry
+from jarvis.telemetry.tracing import Tracer, get_tracer
+from jarvis.utils.logger import get_logger
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def dump(
+    registry: Optional[MetricsRegistry] = None, tracer: Optional[Tracer] = None
+) -> Dict[str, Any]:
+    """Everything the exporter serves, as one JSON-serializable dictionary."""
+
+    registry = registry or get_registry()
+    tracer = tracer or get_tracer()
+    return {"metrics": registry.snapshot(), "turns": tracer.recent_turns()}
+
+
+class MetricsServer:
+    """Serve ``/metrics`` (Prometheus), ``/metrics.json`` and ``/traces`` on a thread.
+
+    Scrapes read the registry under short locks and never block a turn.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        registry: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
+        self._registry = registry or get_registry()
+        self._tracer = tracer or get_tracer()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._log = get_logger("jarvis.telemetry")
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="jarvis-metrics", daemon=True
+        )
+        self._thread.start()
+        self._log.info("Serving metrics on %s/metrics", self.address)
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    # ------------------------------------------------------------------
+    def _handler_class(self) -> type:
+        exporter = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                path = self.path.split("?", 1)[0].rstrip("/")
+                if path == "/metrics":
+                    body = exporter._registry.render_prometheus().encode()
+                    self._send(body, PROMETHEUS_CONTENT_TYPE)
+                elif path == "/metrics.json":
+                    payload = dump(exporter._registry, exporter._tracer)
+                    self._send(json.dumps(payload).encode(), "application/json")
+                elif path == "/traces":
+                    payload = exporter._tracer.recent_turns()
+                    self._send(json.dumps(payload).encode(), "application/json")
+                else:
+                    self._send(b"not found\n", "text/plain", status=404)
+
+            def _send(self, body: bytes, content_type: str, *, status: int = 200) -> None:
+                self.send_response(status)
+                self.send_header("content-type", content_type)
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return _Handler
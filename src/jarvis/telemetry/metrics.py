@@ -0,0 +1,296 @@
+"""Counters, gauges and fixed-bucket histograms with Prometheus and JSON output."""
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# seconds; covers a VAD frame up to a slow LLM reply
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+# (name, type, help, labels, value) rows produced by collectors at scrape time
+Sample = Tuple[str, str, str, Dict[str, str], float]
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Gauge:
+    """A value that goes up and down."""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Histogram:
+    """Latency distribution over fixed bucket bounds.
+
+    Buckets are allocated once; :meth:`observe` only bumps a bucket count and
+    the running sum, so nothing is kept per sample and memory stays constant.
+    Quantiles are estimated by interpolating inside the matching bucket.
+    """
+
+    __slots__ = ("_bounds", "_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._bounds) + 1)  # last slot is +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Cumulative ``(upper bound, count)`` pairs ending with ``+Inf``."""
+
+        with self._lock:
+            counts = list(self._counts)
+        cumulative, running = [], 0
+        for bound, count in zip((*self._bounds, math.inf), counts):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        buckets = self.buckets()
+        total = buckets[-1][1]
+        if not total:
+            return None
+        rank = fraction * total
+        lower, below = 0.0, 0
+        for bound, cumulative in buckets:
+            if cumulative >= rank:
+                if math.isinf(bound):
+                    return lower  # beyond the last bound; report the largest finite one
+                inside = cumulative - below
+                return lower + (bound - lower) * ((rank - below) / inside if inside else 1.0)
+            lower, below = bound, cumulative
+        return lower
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class _Family:
+    __slots__ = ("name", "kind", "help", "buckets", "children")
+
+    def __init__(self, name: str, kind: str, help_text: str, buckets: Sequence[float]) -> None:
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.buckets = buckets
+        self.children: Dict[LabelSet, Metric] = {}
+
+
+class MetricsRegistry:
+    """Named metric families with optional labels.
+
+    Look a metric up once (for example at construction) and keep the returned
+    object; updating it is then a lock-protected add with no dictionary work.
+    Collectors registered with :meth:`register_collector` turn existing
+    counters (transport, cache, executor) into samples at scrape time.
+    """
+
+    def __init__(self) -> None:
+        self._families: Dict[str, _Family] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str = "", **labels: str) -> Counter:
+        return self._child(name, "counter", help_text, labels, DEFAULT_BUCKETS)  # type: ignore
+
+    def gauge(self, name: str, help_text: str = "", **labels: str) -> Gauge:
+        return self._child(name, "gauge", help_text, labels, DEFAULT_BUCKETS)  # type: ignore
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str = "",
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        return self._child(name, "histogram", help_text, labels, buckets)  # type: ignore
+
+    def register_collector(self, collect: Callable[[], Iterable[Sample]]) -> None:
+        with self._lock:
+            self._collectors.append(collect)
+
+    def unregister_collector(self, collect: Callable[[], Iterable[Sample]]) -> None:
+        with self._lock:
+            if collect in self._collectors:
+                self._collectors.remove(collect)
+
+    def render_prometheus(self) -> str:
+        """Text exposition format (version 0.0.4) for a ``/metrics`` endpoint."""
+
+        lines: List[str] = []
+        for family in self._snapshot_families():
+            lines.append(f"# HELP {family.name} {_escape_help(family.help)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for labels, metric in list(family.children.items()):
+                if isinstance(metric, Histogram):
+                    for bound, count in metric.buckets():
+                        le = "+Inf" if math.isinf(bound) else _number(bound)
+                        lines.append(
+                            f"{family.name}_bucket{_labels((*labels, ('le', le)))} {count}"
+                        )
+                    lines.append(f"{family.name}_sum{_labels(labels)} {_number(metric.sum)}")
+                    lines.append(f"{family.name}_count{_labels(labels)} {metric.count}")
+                else:
+                    lines.append(f"{family.name}{_labels(labels)} {_number(metric.value)}")
+        for name, (kind, help_text, rows) in self._collected().items():
+            lines.append(f"# HELP {name} {_escape_help(help_text)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in rows:
+                lines.append(f"{name}{_labels(tuple(sorted(labels.items())))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, object]:
+        """JSON-friendly dump: values, and count/sum/p50/p95/p99 for histograms."""
+
+        dump: Dict[str, object] = {}
+        for family in self._snapshot_families():
+            series = []
+            for labels, metric in list(family.children.items()):
+                entry: Dict[str, object] = {"labels": dict(labels)}
+                if isinstance(metric, Histogram):
+                    entry.update(
+                        count=metric.count,
+                        sum=metric.sum,
+                        p50=metric.quantile(0.5),
+                        p95=metric.quantile(0.95),
+                        p99=metric.quantile(0.99),
+                    )
+                else:
+                    entry["value"] = metric.value
+                series.append(entry)
+            dump[family.name] = {"type": family.kind, "help": family.help, "series": series}
+        for name, (kind, help_text, rows) in self._collected().items():
+            dump[name] = {
+                "type": kind,
+                "help": help_text,
+                "series": [{"labels": labels, "value": value} for labels, value in rows],
+            }
+        return dump
+
+    # ------------------------------------------------------------------
+    def _child(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        labels: Dict[str, str],
+        buckets: Sequence[float],
+    ) -> Metric:
+        key: LabelSet = tuple(sorted((label, str(value)) for label, value in labels.items()))
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = _Family(name, kind, help_text, buckets)
+            elif family.kind != kind:
+                raise ValueError(f"Metric {name} is already registered as a {family.kind}.")
+            metric = family.children.get(key)
+            if metric is None:
+                if kind == "histogram":
+                    metric = Histogram(family.buckets)
+                else:
+                    metric = Counter() if kind == "counter" else Gauge()
+                family.children[key] = metric
+            return metric
+
+    def _snapshot_families(self) -> List[_Family]:
+        with self._lock:
+            return sorted(self._families.values(), key=lambda family: family.name)
+
+    def _collected(self) -> Dict[str, Tuple[str, str, List[Tuple[Dict[str, str], float]]]]:
+        with self._lock:
+            collectors = list(self._collectors)
+        grouped: Dict[str, Tuple[str, str, List[Tuple[Dict[str, str], float]]]] = {}
+        for collect in collectors:
+            for name, kind, help_text, labels, value in collect():
+                grouped.setdefault(name, (kind, help_text, []))[2].append((labels, value))
+        return grouped
+
+
+def _labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels)
+    return "{" + body + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+_default_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Process-wide registry shared by the tracer, exporters and collectors."""
+
+    return _default_registry
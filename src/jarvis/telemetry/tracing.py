@@ -0,0 +1,243 @@
+"""Per-turn tracing spans that feed stage latency histograms."""
+from __future__ import annotations
+
+import contextvars
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from jarvis.telemetry.metrics import Counter, Histogram, MetricsRegistry, get_registry
+
+STAGES: Tuple[str, ...] = (
+    "capture",
+    "vad",
+    "stt",
+    "skill_match",
+    "llm",
+    "llm_first_token",
+    "tool_plan",
+    "tts",
+    "hardware",
+)
+
+_current: "contextvars.ContextVar[Optional[TurnTrace]]" = contextvars.ContextVar(
+    "jarvis_turn", default=None
+)
+
+
+@dataclass(slots=True)
+class TurnTrace:
+    """Spans recorded for one turn.
+
+    ``started_at`` is the end of the utterance, which is what turn latency is
+    measured from; capture therefore reports a negative offset.
+    """
+
+    id: int
+    started_at: float
+    wall_time: float
+    route: Optional[str] = None
+    seconds: Optional[float] = None
+    first_audio: Optional[float] = None
+    spans: List[Tuple[str, float, float]] = field(default_factory=list)
+
+    def add(self, stage: str, start: float, seconds: float) -> None:
+        # list.append is atomic, so stages on other threads can report here
+        self.spans.append((stage, start, seconds))
+
+    def stage_seconds(self) -> Dict[str, float]:
+        """Seconds spent in each stage, summing stages that ran more than once."""
+
+        totals: Dict[str, float] = {}
+        for stage, _start, seconds in list(self.spans):
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        return totals
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "time": self.wall_time,
+            "route": self.route,
+            "seconds": self.seconds,
+            "first_audio": self.first_audio,
+            "spans": [
+                {"stage": stage, "offset": start - self.started_at, "seconds": seconds}
+                for stage, start, seconds in list(self.spans)
+            ],
+        }
+
+
+class Span:
+    """Times one stage; use as a context manager or call :meth:`end` yourself."""
+
+    __slots__ = ("_stage", "_trace", "_start", "_histogram", "_errors")
+
+    def __init__(
+        self, stage: str, trace: Optional[TurnTrace], histogram: Histogram, errors: Counter
+    ) -> None:
+        self._stage = stage
+        self._trace = trace
+        self._histogram = histogram
+        self._errors = errors
+        self._start = time.perf_counter()
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, *_exc: Any) -> None:
+        # a closed generator or an interrupt is not a stage failure
+        self.end(failed=exc_type is not None and issubclass(exc_type, Exception))
+
+    def end(self, *, failed: bool = False) -> float:
+        elapsed = time.perf_counter() - self._start
+        self._histogram.observe(elapsed)
+        if failed:
+            self._errors.inc()
+        if self._trace is not None:
+            self._trace.add(self._stage, self._start, elapsed)
+        return elapsed
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        pass
+
+    def end(self, *, failed: bool = False) -> float:
+        return 0.0
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Records stage spans into histograms and keeps the most recent turn traces.
+
+    Each stage's histogram and error counter are created once and reused, so
+    a span costs two clock reads, a bucket increment and (inside a turn) one
+    list append. The turn a span belongs to comes from :meth:`activate` on the
+    current thread or is passed explicitly for work handed to other threads.
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, *, enabled: bool = True, keep_turns: int = 50
+    ) -> None:
+        self._registry = registry
+        self.enabled = enabled
+        self._ids = itertools.count(1)
+        self._recent: Deque[TurnTrace] = deque(maxlen=max(1, keep_turns))
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Tuple[Histogram, Counter]] = {}
+        for stage in STAGES:
+            self._stage(stage)
+        self._turn_seconds: Dict[str, Histogram] = {}
+        self._first_audio = registry.histogram(
+            "jarvis_turn_first_audio_seconds", "From end of utterance to the first audio."
+        )
+
+    def span(self, stage: str, trace: Optional[TurnTrace] = None) -> Any:
+        if not self.enabled:
+            return _NOOP_SPAN
+        histogram, errors = self._stages.get(stage) or self._stage(stage)
+        return Span(stage, trace if trace is not None else _current.get(), histogram, errors)
+
+    def begin_turn(self, started_at: Optional[float] = None) -> Optional[TurnTrace]:
+        if not self.enabled:
+            return None
+        return TurnTrace(
+            id=next(self._ids),
+            started_at=time.perf_counter() if started_at is None else started_at,
+            wall_time=time.time(),
+        )
+
+    def end_turn(
+        self,
+        trace: Optional[TurnTrace],
+        *,
+        route: Optional[str] = None,
+        first_audio: Optional[float] = None,
+    ) -> None:
+        if trace is None or trace.seconds is not None:
+            return
+        trace.seconds = time.perf_counter() - trace.started_at
+        trace.route = route or trace.route or "unknown"
+        trace.first_audio = first_audio
+        histogram = self._turn_seconds.get(trace.route)
+        if histogram is None:
+            histogram = self._turn_seconds[trace.route] = self._registry.histogram(
+                "jarvis_turn_seconds", "Whole turns by how they were answered.", route=trace.route
+            )
+        histogram.observe(trace.seconds)
+        if first_audio is not None:
+            self._first_audio.observe(first_audio)
+        with self._lock:
+            self._recent.append(trace)
+
+    def configure(self, *, enabled: bool, keep_turns: int) -> None:
+        self.enabled = enabled
+        with self._lock:
+            self._recent = deque(self._recent, maxlen=max(1, keep_turns))
+
+    @contextmanager
+    def activate(self, trace: Optional[TurnTrace]) -> Iterator[Optional[TurnTrace]]:
+        """Make ``trace`` the current turn for spans opened on this thread."""
+
+        token = _current.set(trace)
+        try:
+            yield trace
+        finally:
+            _current.reset(token)
+
+    @staticmethod
+    def current() -> Optional[TurnTrace]:
+        return _current.get()
+
+    def recent_turns(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            turns = list(self._recent)
+        return [trace.as_dict() for trace in turns]
+
+    # ------------------------------------------------------------------
+    def _stage(self, stage: str) -> Tuple[Histogram, Counter]:
+        with self._lock:
+            pair = self._stages.get(stage)
+            if pair is None:
+                pair = self._stages[stage] = (
+                    self._registry.histogram(
+                        "jarvis_stage_seconds", "Time spent in each turn stage.", stage=stage
+                    ),
+                    self._registry.counter(
+                        "jarvis_stage_errors_total", "Stages that raised.", stage=stage
+                    ),
+                )
+            return pair
+
+
+_default_tracer: Optional[Tracer] = None
+_default_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer recording into :func:`~jarvis.telemetry.metrics.get_registry`."""
+
+    global _default_tracer
+    if _default_tracer is None:
+        with _default_lock:
+            if _default_tracer is None:
+                _default_tracer = Tracer(get_registry())
+    return _default_tracer
+
+
+def configure_tracing(*, enabled: bool = True, keep_turns: int = 50) -> Tracer:
+    tracer = get_tracer()
+    tracer.configure(enabled=enabled, keep_turns=keep_turns)
+    return tracer
@@ -1,5 +1,18 @@
 """Utility helpers used across the JARVIS project."""
 
+from jarvis.utils.cancellation import CancelScope
 from jarvis.utils.logger import configure_logging, get_logger
+from jarvis.utils.singleflight import FlightStats, SingleFlight, SingleFlightStream
+from jarvis.utils.startup import StartupProfiler, StartupReport, lazy_import
 
-__all__ = ["configure_logging", "get_logger"]
+__all__ = [
+    "CancelScope",
+    "FlightStats",
+    "SingleFlight",
+    "SingleFlightStream",
+    "StartupProfiler",
+    "StartupReport",
+    "configure_logging",
+    "get_logger",
+    "lazy_import",
+]
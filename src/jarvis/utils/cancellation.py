@@ -0,0 +1,119 @@
+"""Cancel scopes: abort blocking I/O on one thread from another."""
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Generator, Iterable, Iterator, List, Optional, TypeVar
+
+from jarvis.utils.logger import get_logger
+
+T = TypeVar("T")
+
+_local = threading.local()
+_log = get_logger("jarvis.cancellation")
+
+
+class CancelScope:
+    """Abort callbacks registered by work running inside the scope.
+
+    Code that blocks on something it can interrupt, such as reading an HTTP
+    response, registers an abort callback with :func:`on_cancel` while the
+    scope is active on its thread. :meth:`cancel` may be called from any
+    thread: it runs the callbacks registered so far, and any registered
+    afterwards run straight away.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            _run(callback)
+
+    def add(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run ``callback`` on cancel and return a function that unregisters it."""
+
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        _run(callback)
+        return _noop
+
+    @contextmanager
+    def active(self) -> Iterator["CancelScope"]:
+        """Make this the calling thread's current scope for the ``with`` block."""
+
+        outer = getattr(_local, "scope", None)
+        _local.scope = self
+        try:
+            yield self
+        finally:
+            _local.scope = outer
+
+    # ------------------------------------------------------------------
+    def _remove(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def current_scope() -> Optional[CancelScope]:
+    return getattr(_local, "scope", None)
+
+
+def on_cancel(callback: Callable[[], None]) -> Callable[[], None]:
+    """Register ``callback`` with the calling thread's scope, if it has one.
+
+    Returns a function that unregisters it again.
+    """
+
+    scope = current_scope()
+    return scope.add(callback) if scope is not None else _noop
+
+
+def abortable(items: Iterable[T], abort: Callable[[], None]) -> Generator[T, None, None]:
+    """Yield from ``items``, letting the reading thread's scope ``abort`` a blocked read.
+
+    The registration follows the reader: a stream opened on one thread and
+    read on another is aborted by the scope of whichever thread is waiting.
+    """
+
+    iterator = iter(items)
+    scope: Optional[CancelScope] = None
+    release = _noop
+    try:
+        while True:
+            if current_scope() is not scope:
+                release()
+                scope = current_scope()
+                release = on_cancel(abort)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            yield item
+    finally:
+        release()
+
+
+def _run(callback: Callable[[], None]) -> None:
+    try:
+        callback()
+    except Exception as exc:  # aborting is best effort
+        _log.debug("Cancel callback failed: %s", exc)
+
+
+def _noop() -> None:
+    pass
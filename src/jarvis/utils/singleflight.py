@@ -0,0 +1,203 @@
+"""Merge identical concurrent upstream calls into one (single flight)."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generator, Generic, Hashable, Iterator, List, Optional, TypeVar
+
+from jarvis.utils.cancellation import CancelScope, on_cancel
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class FlightStats:
+    """How many upstream calls ran and how many callers shared one instead."""
+
+    calls: int = 0
+    saved: int = 0
+
+
+class SingleFlight(Generic[T]):
+    """Run one call per key at a time and hand its outcome to every concurrent caller.
+
+    The first caller for a key runs ``fn``; callers arriving with the same key
+    while it runs wait and receive the same result, or the same exception.
+    Nothing is remembered afterwards, so this is not a cache: the next call
+    with that key goes upstream again. If the running call is interrupted by
+    something other than an ``Exception`` (``KeyboardInterrupt``, say), the
+    waiters are not failed with it; one of them runs the call itself.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._stats = FlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        while True:
+            with self._lock:
+                flight = self._calls.get(key)
+                if flight is None:
+                    flight = self._calls[key] = Future()
+                    self._stats.calls += 1
+                    break
+                self._stats.saved += 1
+            try:
+                return flight.result()
+            except CancelledError:
+                with self._lock:
+                    self._stats.saved -= 1  # the leader gave up; retry, maybe as leader
+        try:
+            result = fn()
+        except Exception as exc:
+            self._land(key)
+            flight.set_exception(exc)
+            raise
+        except BaseException:
+            self._land(key)
+            flight.cancel()
+            raise
+        self._land(key)
+        flight.set_result(result)
+        return result
+
+    def stats(self) -> FlightStats:
+        with self._lock:
+            return FlightStats(calls=self._stats.calls, saved=self._stats.saved)
+
+    # ------------------------------------------------------------------
+    def _land(self, key: Hashable) -> None:
+        # forget the flight before publishing its outcome so later callers start afresh
+        with self._lock:
+            del self._calls[key]
+
+
+@dataclass(slots=True)
+class _Stream(Generic[T]):
+    upstream: Generator[T, None, None]
+    cond: threading.Condition
+    items: List[T] = field(default_factory=list)
+    done: bool = False
+    error: Optional[BaseException] = None
+    pulling: bool = False
+    readers: int = 0
+    # upstream reads run in the flight's own scope, so one reader cannot abort them for all
+    scope: CancelScope = field(default_factory=CancelScope)
+
+
+class SingleFlightStream(Generic[T]):
+    """Share one upstream iterator between concurrent identical streaming calls.
+
+    Every reader sees every item from the start, including readers that join
+    after the stream has begun. The reader that has caught up pulls the next
+    item for everyone, so no extra thread is needed. A reader that stops
+    early (closing its generator, e.g. on barge-in) only detaches itself;
+    the upstream is closed once its last reader has gone. Likewise, when a
+    reader's :class:`CancelScope` is cancelled, the upstream read is aborted
+    only if no other reader shares it. An upstream error is raised to each
+    reader after the items that preceded it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._streams: Dict[Hashable, _Stream[T]] = {}
+        self._stats = FlightStats()
+
+    def stream(self, key: Hashable, fn: Callable[[], Iterator[T]]) -> Iterator[T]:
+        # like a generator function, nothing happens until the first item is asked for
+        with self._lock:
+            shared = self._streams.get(key)
+            if shared is None:
+                shared = _Stream(upstream=_deferred(fn), cond=threading.Condition(self._lock))
+                self._streams[key] = shared
+                self._stats.calls += 1
+            else:
+                self._stats.saved += 1
+            shared.readers += 1
+        position = 0
+        release = on_cancel(lambda: self._abandon(key, shared))
+        try:
+            while True:
+                with shared.cond:
+                    while position == len(shared.items) and shared.pulling and not shared.done:
+                        shared.cond.wait()
+                    pull = False
+                    if position < len(shared.items):
+                        item = shared.items[position]
+                        position += 1
+                    elif shared.done:
+                        if shared.error is not None:
+                            raise shared.error
+                        return
+                    else:
+                        shared.pulling = pull = True
+                if pull:
+                    self._pull(key, shared)
+                else:
+                    yield item
+        finally:
+            release()
+            self._detach(key, shared)
+
+    def stats(self) -> FlightStats:
+        with self._lock:
+            return FlightStats(calls=self._stats.calls, saved=self._stats.saved)
+
+    # ------------------------------------------------------------------
+    def _pull(self, key: Hashable, shared: _Stream[T]) -> None:
+        try:
+            with shared.scope.active():
+                item = next(shared.upstream)
+        except StopIteration:
+            self._finish(key, shared, None)
+            return
+        except Exception as exc:
+            self._finish(key, shared, exc)
+            return
+        except BaseException:
+            # an interrupt belongs to this reader alone; another one takes over pulling
+            with shared.cond:
+                shared.pulling = False
+                shared.cond.notify_all()
+            raise
+        with shared.cond:
+            shared.items.append(item)
+            shared.pulling = False
+            shared.cond.notify_all()
+
+    def _finish(self, key: Hashable, shared: _Stream[T], error: Optional[BaseException]) -> None:
+        with shared.cond:
+            shared.done = True
+            shared.error = error
+            shared.pulling = False
+            if self._streams.get(key) is shared:
+                del self._streams[key]
+            shared.cond.notify_all()
+
+    def _abandon(self, key: Hashable, shared: _Stream[T]) -> None:
+        """A reader was cancelled: abort the upstream unless someone else still reads it."""
+
+        with shared.cond:
+            if shared.readers > 1 or shared.done:
+                return
+            # later callers start a fresh flight instead of joining an aborted one
+            if self._streams.get(key) is shared:
+                del self._streams[key]
+        shared.scope.cancel()
+
+    def _detach(self, key: Hashable, shared: _Stream[T]) -> None:
+        with shared.cond:
+            shared.readers -= 1
+            if shared.readers or shared.done:
+                return
+            # nobody is listening any more: stop the upstream instead of finishing it
+            shared.done = True
+            if self._streams.get(key) is shared:
+                del self._streams[key]
+        shared.upstream.close()
+
+
+def _deferred(fn: Callable[[], Iterator[T]]) -> Generator[T, None, None]:
+    yield from fn()
@@ -0,0 +1,206 @@
+"""Lazy backend imports and a per-component startup time profile."""
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_import_lock = threading.Lock()
+_import_times: Dict[str, float] = {}
+# import seconds charged to the component measuring on this thread
+_charged = threading.local()
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """Import ``name`` on first use; ``None`` when it is not installed.
+
+    The time of the first import is recorded (see :func:`import_times`) and
+    charged to the component being measured on the calling thread.
+    """
+
+    if name in _import_times:
+        return importlib.import_module(name)
+    try:
+        if importlib.util.find_spec(name) is None:
+            return None
+    except (ImportError, ValueError):
+        return None
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - start
+    with _import_lock:
+        if name in _import_times:
+            return module  # another thread finished the same import first
+        _import_times[name] = elapsed
+    if getattr(_charged, "seconds", None) is not None:
+        _charged.seconds += elapsed
+    return module
+
+
+def import_times() -> Dict[str, float]:
+    """Seconds spent on the first import of each lazily loaded module."""
+
+    with _import_lock:
+        return dict(_import_times)
+
+
+@dataclass(slots=True)
+class ComponentTiming:
+    """How long one component took to import its backend and initialize."""
+
+    name: str
+    started_at: float
+    import_seconds: float = 0.0
+    init_seconds: float = 0.0
+    background: bool = False
+    error: Optional[str] = None
+
+    @property
+    def total_seconds(self) -> float:
+        return self.import_seconds + self.init_seconds
+
+
+@dataclass(slots=True)
+class StartupReport:
+    """Startup breakdown: per-component timings plus ready and total wall time.
+
+    ``ready_seconds`` is when the assistant could take input; background
+    components may finish later, up to ``total_seconds``.
+    """
+
+    components: List[ComponentTiming] = field(default_factory=list)
+    imports: Dict[str, float] = field(default_factory=dict)
+    ready_seconds: Optional[float] = None
+    total_seconds: float = 0.0
+    budget_seconds: Optional[float] = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget_seconds is not None and self.total_seconds > self.budget_seconds
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "components": [asdict(component) for component in self.components],
+            "imports": dict(self.imports),
+            "ready_seconds": self.ready_seconds,
+            "total_seconds": self.total_seconds,
+            "budget_seconds": self.budget_seconds,
+            "over_budget": self.over_budget,
+        }
+
+    def format(self) -> str:
+        lines = [
+            f"{'component':>14} | {'start ms':>8} | {'import ms':>9} | {'init ms':>8} | mode"
+        ]
+        for component in self.components:
+            mode = "background" if component.background else "inline"
+            if component.error:
+                mode += f" (failed: {component.error})"
+            lines.append(
+                f"{component.name:>14} | {component.started_at * 1000:>8.1f} "
+                f"| {component.import_seconds * 1000:>9.1f} "
+                f"| {component.init_seconds * 1000:>8.1f} | {mode}"
+            )
+        for name, seconds in sorted(self.imports.items(), key=lambda item: -item[1]):
+            lines.append(f"  import {name}: {seconds * 1000:.1f} ms")
+        if self.ready_seconds is not None:
+            lines.append(f"ready for input after {self.ready_seconds * 1000:.1f} ms")
+        budget = ""
+        if self.budget_seconds is not None:
+            verdict = "OVER" if self.over_budget else "within"
+            budget = f" ({verdict} budget of {self.budget_seconds * 1000:.0f} ms)"
+        lines.append(f"all components ready after {self.total_seconds * 1000:.1f} ms{budget}")
+        return "\n".join(lines)
+
+
+class StartupProfiler:
+    """Initialize components inline or on a thread pool and time each one.
+
+    :meth:`run` builds a component on the calling thread; :meth:`submit`
+    builds it in the background and returns a future, so independent
+    backends start concurrently while the assistant is already prompting.
+    """
+
+    def __init__(self, *, max_workers: int = 4, budget_seconds: Optional[float] = None) -> None:
+        self._origin = time.perf_counter()
+        self._budget_seconds = budget_seconds
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="jarvis-startup"
+        )
+        self._components: List[ComponentTiming] = []
+        self._futures: List[Future] = []
+        self._ready_at: Optional[float] = None
+        self._finished_at = self._origin
+        self._lock = threading.Lock()
+
+    def run(self, name: str, factory: Callable[[], T]) -> T:
+        return self._measure(name, factory, background=False)
+
+    def submit(self, name: str, factory: Callable[[], T]) -> "Future[T]":
+        future = self._pool.submit(self._measure, name, factory, background=True)
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def mark_ready(self) -> None:
+        """Record that the assistant can take input; only the first call counts."""
+
+        with self._lock:
+            if self._ready_at is None:
+                self._ready_at = time.perf_counter()
+
+    def wait(self) -> StartupReport:
+        """Block until every submitted component is done and return the report."""
+
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.exception()  # failures are recorded in the report, not raised
+        return self.report()
+
+    def report(self) -> StartupReport:
+        with self._lock:
+            components = sorted(self._components, key=lambda item: item.started_at)
+            ready = None if self._ready_at is None else self._ready_at - self._origin
+            total = self._finished_at - self._origin
+        return StartupReport(
+            components=components,
+            imports=import_times(),
+            ready_seconds=ready,
+            total_seconds=max(total, ready or 0.0),
+            budget_seconds=self._budget_seconds,
+        )
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    def _measure(self, name: str, factory: Callable[[], T], *, background: bool) -> T:
+        started = time.perf_counter()
+        timing = ComponentTiming(
+            name=name, started_at=started - self._origin, background=background
+        )
+        outer, _charged.seconds = getattr(_charged, "seconds", None), 0.0
+        try:
+            return factory()
+        except Exception as exc:
+            timing.error = str(exc) or type(exc).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            timing.import_seconds = _charged.seconds
+            timing.init_seconds = max(elapsed - timing.import_seconds, 0.0)
+            if outer is not None:
+                _charged.seconds = outer + timing.import_seconds
+            else:
+                _charged.seconds = None
+            with self._lock:
+                self._components.append(timing)
+                self._finished_at = max(self._finished_at, started + elapsed)